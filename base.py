@@ -1,14 +1,19 @@
 """
 Base classes for the game.
 """
-from typing import Dict, Any, TypeVar, Generic
+from typing import Dict, Any, TypeVar, Generic, Iterable, Tuple
 from dataclasses import dataclass
 
 T = TypeVar('T')
 
+# Marks a field that from_dict reads with data[name] instead of data.get()
+REQUIRED = object()
+
 @dataclass
 class Component:
     """Base class for entity components."""
+    __slots__ = ('entity', 'callbacks', '__weakref__')
+
     entity: 'Entity'
     
     def __init__(self, *args, **kwargs):
@@ -25,4 +30,45 @@ class Component:
     @classmethod
     def from_dict(cls, data: Dict[str, Any], entity: 'Entity') -> 'Component':
         """Create component from dictionary."""
-        return cls(entity) 
\ No newline at end of file
+        return cls(entity)
+
+def make_from_dict(cls: type, init_fields: Iterable[Tuple[str, Any]],
+                   attr_fields: Iterable[Tuple[str, Any]] = (),
+                   entity: bool = True) -> type:
+    """Generate a from_dict classmethod specialized to a fixed field list.
+
+    The loader is built as source and exec'd once at import, so each call is
+    a straight run of data.get() lookups with no per-call reflection.
+
+    Args:
+        cls: Class to attach from_dict to
+        init_fields: (name, default) pairs passed to the constructor
+        attr_fields: (name, default) pairs assigned after construction
+        entity: Whether from_dict takes an entity and passes it on
+
+    Returns:
+        type: The same class, for chaining
+    """
+    namespace: Dict[str, Any] = {}
+
+    def load(name: str, default: Any) -> str:
+        if default is REQUIRED:
+            return f"data[{name!r}]"
+        key = f"_default_{name}"
+        namespace[key] = default
+        return f"data.get({name!r}, {key})"
+
+    args = ["entity=entity"] if entity else []
+    args += [f"{name}={load(name, default)}" for name, default in init_fields]
+    lines = [f"def from_dict(cls, data{', entity' if entity else ''}):",
+             f"    component = cls({', '.join(args)})"]
+    lines += [f"    component.{name} = {load(name, default)}" for name, default in attr_fields]
+    lines.append("    return component")
+    exec("\n".join(lines), namespace)
+
+    from_dict = namespace["from_dict"]
+    from_dict.__doc__ = "Create component from dictionary."
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    from_dict.__module__ = cls.__module__
+    cls.from_dict = classmethod(from_dict)
+    return cls
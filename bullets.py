@@ -2,26 +2,29 @@
 Bullet module.
 """
 import pygame
+import numpy as np
 from typing import List, Dict, Optional, Tuple
 from config import (
     BULLET_SPEED, BULLET_DAMAGE, BULLET_SIZE,
     ENEMY_BULLET_SPEED, ENEMY_BULLET_DAMAGE, ENEMY_BULLET_SIZE
 )
 from entities import EntityType
+from zone_types import ZONE_NEIGHBOR_OFFSETS, zone_key
+from ecs.transform_store import transform_store
 from components import (
     TransformComponent, VelocityComponent, DamageComponent,
     BulletComponent, LifetimeComponent, CollisionComponent
 )
 
 class Bullet(pygame.sprite.Sprite):
+    # Solid bullet images by (size, is_enemy); shared by reference since sprites only blit them
+    _images: Dict[Tuple[int, bool], pygame.Surface] = {}
+
     def __init__(self, x: int, y: int, dx: float, dy: float, damage: int,
                  is_enemy: bool = False, size: int = BULLET_SIZE):
         super().__init__()
-        self.image = pygame.Surface((size, size))
-        self.image.fill((255, 255, 0) if is_enemy else (0, 255, 255))
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.image = self._get_image(size, is_enemy)
+        self.rect = pygame.Rect(x, y, size, size)
         
         # Calculate velocity
         length = (dx ** 2 + dy ** 2) ** 0.5
@@ -37,6 +40,16 @@ class Bullet(pygame.sprite.Sprite):
         self.is_enemy = is_enemy
         self.lifetime = 120  # Frames before bullet disappears
     
+    @classmethod
+    def _get_image(cls, size: int, is_enemy: bool) -> pygame.Surface:
+        """Get the shared image for a bullet size and side, creating it on first use."""
+        key = (size, is_enemy)
+        image = cls._images.get(key)
+        if image is None:
+            image = cls._images[key] = pygame.Surface((size, size))
+            image.fill((255, 255, 0) if is_enemy else (0, 255, 255))
+        return image
+
     def update(self, world_manager):
         """Update bullet position and check collisions."""
         # Update position
@@ -60,19 +73,17 @@ class Bullet(pygame.sprite.Sprite):
         zone_y = self.rect.y // world_manager.zone_size
         
         # Check collisions with tiles in current and adjacent zones
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                check_zone_x = zone_x + dx
-                check_zone_y = zone_y + dy
-                
-                if (check_zone_x, check_zone_y) in world_manager.active_zones:
-                    zone = world_manager.active_zones[(check_zone_x, check_zone_y)]
-                    
-                    # Check collisions with tiles
-                    for tile in zone["tiles"]:
-                        tile_rect = pygame.Rect(tile["x"], tile["y"], 32, 32)
-                        if self.rect.colliderect(tile_rect):
-                            return True
+        active_zones = world_manager.active_zones
+        for dx, dy in ZONE_NEIGHBOR_OFFSETS:
+            zone = active_zones.get(zone_key(zone_x + dx, zone_y + dy))
+            if zone is None:
+                continue
+            
+            # Check collisions with tiles
+            for tile in zone["tiles"]:
+                tile_rect = pygame.Rect(tile["x"], tile["y"], 32, 32)
+                if self.rect.colliderect(tile_rect):
+                    return True
         
         return False
 
@@ -105,22 +116,70 @@ class BulletManager:
             vy = (dy / length) * (ENEMY_BULLET_SPEED if is_enemy else BULLET_SPEED)
         else:
             vx, vy = 0, 0
-        entity.add_component(VelocityComponent(vx, vy))
+        entity.add_component(VelocityComponent(entity, vx, vy))
+        
+        self._add_bullet_components(entity, damage, size)
+        self.entity_manager.add_entity(entity)
+        
+        return entity
+
+    def create_bullets_batch(self, xs, ys, dxs, dys, damages, is_enemy=False, size=None):
+        """Create many bullets at once.
+        
+        Directions are normalized for all bullets in one NumPy pass and the
+        positions and velocities are scattered into the shared transform
+        store in one assignment per field.
+        
+        Args:
+            xs, ys: Spawn positions
+            dxs, dys: Directions (need not be normalized)
+            damages: Damage per bullet, or one value for all
+            is_enemy: Whether the bullets were fired by enemies
+            size: Bullet size, defaults by owner
+            
+        Returns:
+            List: The created bullet entities
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        n = len(xs)
+        if n == 0:
+            return []
+        if size is None:
+            size = ENEMY_BULLET_SIZE if is_enemy else BULLET_SIZE
+        
+        dxs = np.asarray(dxs, dtype=np.float64)
+        dys = np.asarray(dys, dtype=np.float64)
+        length = np.hypot(dxs, dys)
+        scale = np.divide(ENEMY_BULLET_SPEED if is_enemy else BULLET_SPEED, length,
+                          out=np.zeros(n), where=length > 0)
+        damages = np.broadcast_to(np.asarray(damages, dtype=np.float64), (n,))
         
-        # Add other components
+        entities = []
+        slots = np.empty(n, dtype=np.intp)
+        for i, damage in enumerate(damages.tolist()):
+            entity = self.entity_manager.create_entity(EntityType.BULLET)
+            velocity = VelocityComponent(entity)
+            entity.add_component(velocity)
+            self._add_bullet_components(entity, damage, size)
+            slots[i] = velocity._slot
+            entities.append(entity)
+        
+        transform_store.x[slots] = xs
+        transform_store.y[slots] = ys
+        transform_store.vx[slots] = dxs * scale
+        transform_store.vy[slots] = dys * scale
+        return entities
+    
+    def _add_bullet_components(self, entity, damage, size):
+        """Add the damage, bullet, lifetime and collision components to a bullet."""
         entity.add_component(DamageComponent(damage))
-        entity.add_component(BulletComponent(is_enemy))
+        entity.add_component(BulletComponent.spawn(entity, damage=damage))
         entity.add_component(LifetimeComponent(frames_left=120))
         
-        # Add collision component
         collision = CollisionComponent(entity)
         collision.width = size
         collision.height = size
         entity.add_component(collision)
-        
-        self.entity_manager.add_entity(entity)
-        
-        return entity
     
     def update(self, world_manager):
         """Update all bullets."""
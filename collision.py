@@ -5,7 +5,9 @@ from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 import pygame
 from entities import Entity, Component
+from components import PhysicsComponent, TransformComponent
 from logger import logger
+from systems.aabb_tree import AABBTree
 import traceback
 
 @dataclass
@@ -18,6 +20,7 @@ class CollisionComponent(Component):
     is_trigger: bool = False
     collision_mask: int = 0xFFFFFFFF
     collision_layer: int = 0x00000001
+    is_static: bool = False
     
     def get_rect(self, entity: Entity) -> pygame.Rect:
         """Get the collision rectangle for an entity."""
@@ -42,7 +45,8 @@ class CollisionComponent(Component):
             "offset_y": self.offset_y,
             "is_trigger": self.is_trigger,
             "collision_mask": self.collision_mask,
-            "collision_layer": self.collision_layer
+            "collision_layer": self.collision_layer,
+            "is_static": self.is_static
         }
         
     @classmethod
@@ -55,7 +59,8 @@ class CollisionComponent(Component):
             offset_y=data["offset_y"],
             is_trigger=data["is_trigger"],
             collision_mask=data["collision_mask"],
-            collision_layer=data["collision_layer"]
+            collision_layer=data["collision_layer"],
+            is_static=data.get("is_static", False)
         )
 
 class CollisionManager:
@@ -65,6 +70,7 @@ class CollisionManager:
         """Initialize the collision manager."""
         self.spatial_hash: Dict[Tuple[int, int], Set[str]] = {}
         self.cell_size: int = 64  # Size of spatial hash cells
+        self.static_tree = AABBTree(margin=4.0)  # Broad phase for static/slow colliders
         self.collision_count: int = 0
         self.trigger_count: int = 0
         logger.info("Initialized CollisionManager")
@@ -125,6 +131,33 @@ class CollisionManager:
         self.remove_entity(entity_id, entity)
         self.add_entity(entity_id, entity)
         
+    def _is_static(self, entity: Entity, collision: CollisionComponent) -> bool:
+        """Check if an entity belongs in the static collider tier."""
+        if collision.is_static:
+            return True
+        physics = entity.get_component(PhysicsComponent)
+        return bool(physics and getattr(physics, "is_static", False))
+        
+    def update_static_entity(self, entity_id: str, entity: Entity) -> None:
+        """Insert or refresh a static entity in the AABB tree.
+        
+        The tree stores a fattened box, so the leaf is only reinserted once the
+        entity has moved outside of it.
+        """
+        collision = entity.get_component(CollisionComponent)
+        if not collision:
+            return
+            
+        rect = collision.get_rect(entity)
+        margin = self.static_tree.margin
+        physics = entity.get_component(PhysicsComponent)
+        if physics:
+            # Fatten by twice the expected per-frame move
+            speed = max(abs(physics.velocity_x), abs(physics.velocity_y))
+            margin = max(margin, 2.0 * speed)
+            
+        self.static_tree.update(entity_id, (rect.left, rect.top, rect.right, rect.bottom), margin)
+        
     def get_potential_collisions(self, entity_id: str, entity: Entity) -> Set[str]:
         """Get all entities that could collide with the given entity."""
         collision = entity.get_component(CollisionComponent)
@@ -139,6 +172,12 @@ class CollisionManager:
             if cell in self.spatial_hash:
                 potential_collisions.update(self.spatial_hash[cell])
                 
+        # Static colliders never need resolving against each other
+        if entity_id not in self.static_tree:
+            potential_collisions.update(
+                self.static_tree.query((rect.left, rect.top, rect.right, rect.bottom))
+            )
+                
         potential_collisions.discard(entity_id)
         return potential_collisions
         
@@ -225,15 +264,30 @@ class CollisionManager:
             # Clear spatial hash
             self.spatial_hash.clear()
             
-            # Rebuild spatial hash
-            for entity_id, entity in entity_manager.entities.items():
-                if entity.active:
+            # Rebuild spatial hash for dynamic entities, refit static ones in the tree
+            static_ids = set()
+            for entity in entity_manager.get_all_entities():
+                if not entity.active:
+                    continue
+                entity_id = entity.id
+                collision = entity.get_component(CollisionComponent)
+                if collision and self._is_static(entity, collision):
+                    self.update_static_entity(entity_id, entity)
+                    static_ids.add(entity_id)
+                else:
                     self.add_entity(entity_id, entity)
                     
+            # Drop static entities that were removed or deactivated
+            if len(static_ids) != len(self.static_tree):
+                for entity_id in self.static_tree.get_ids():
+                    if entity_id not in static_ids:
+                        self.static_tree.remove(entity_id)
+                    
             # Check collisions
-            for entity_id, entity in entity_manager.entities.items():
+            for entity in entity_manager.get_all_entities():
                 if not entity.active:
                     continue
+                entity_id = entity.id
                     
                 potential_collisions = self.get_potential_collisions(entity_id, entity)
                 
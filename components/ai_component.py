@@ -2,7 +2,59 @@
 AI component for controlling entity behavior.
 """
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Type
+
+class BehaviorState:
+    """Base class for per-behavior scratch state."""
+    __slots__ = ()
+
+class IdleState(BehaviorState):
+    """State data for the idle behavior."""
+    __slots__ = ("idle_time",)
+
+    def __init__(self):
+        self.idle_time = 0.0
+
+class PatrolState(BehaviorState):
+    """State data for the patrol behavior."""
+    __slots__ = ("wait_time", "target_point")
+
+    def __init__(self):
+        self.wait_time = 0.0
+        self.target_point: Optional[Tuple[float, float]] = None
+
+class ChaseState(BehaviorState):
+    """State data for the chase behavior."""
+    __slots__ = ("last_seen_position", "time_since_seen")
+
+    def __init__(self):
+        self.last_seen_position: Optional[Tuple[float, float]] = None
+        self.time_since_seen = 0.0
+
+class AttackState(BehaviorState):
+    """State data for the attack behavior."""
+    __slots__ = ("attacks_made", "windup_time")
+
+    def __init__(self):
+        self.attacks_made = 0
+        self.windup_time = 0.0
+
+class FleeState(BehaviorState):
+    """State data for the flee behavior."""
+    __slots__ = ("flee_time", "flee_from")
+
+    def __init__(self):
+        self.flee_time = 0.0
+        self.flee_from: Optional[Tuple[float, float]] = None
+
+# Behavior name -> state data type, swapped in on every behavior change
+_BEHAVIOR_STATE_TEMPLATES: Dict[str, Type[BehaviorState]] = {
+    "idle": IdleState,
+    "patrol": PatrolState,
+    "chase": ChaseState,
+    "attack": AttackState,
+    "flee": FleeState
+}
 
 @dataclass
 class AIComponent:
@@ -16,19 +68,20 @@ class AIComponent:
     attack_range: float = 50.0  # Range at which to attack
     attack_cooldown: float = 1.0  # Time between attacks
     last_attack_time: float = 0.0  # Last time an attack was performed
-    state_data: Dict[str, Any] = None  # Additional state data for behaviors
+    state_data: Optional[BehaviorState] = None  # Additional state data for behaviors
 
     def __post_init__(self):
         """Initialize default values."""
         if self.patrol_points is None:
             self.patrol_points = []
         if self.state_data is None:
-            self.state_data = {}
+            self.state_data = _BEHAVIOR_STATE_TEMPLATES.get(self.behavior, BehaviorState)()
 
     def update_behavior(self, new_behavior: str):
         """Update the current behavior state."""
         self.behavior = new_behavior
-        self.state_data.clear()  # Clear state data when changing behaviors
+        # Fresh slotted state for the new behavior instead of clearing a dict
+        self.state_data = _BEHAVIOR_STATE_TEMPLATES.get(new_behavior, BehaviorState)()
 
     def set_target(self, target: Any):
         """Set the current target entity."""
@@ -1,14 +1,20 @@
 """
 Bullet component for bullet/projectile entities.
 """
-from typing import Dict, Any, TYPE_CHECKING
+import math
+from typing import Dict, Any, List, TYPE_CHECKING
 from base import Component
 
 if TYPE_CHECKING:
     from entities import Entity
 
+# Maximum number of released components kept for reuse
+BULLET_POOL_LIMIT = 1024
+
 class BulletComponent(Component):
     """Component for bullet/projectile behavior."""
+    _pool: List['BulletComponent'] = []
+
     def __init__(self, entity: 'Entity', speed: float = 0.0, direction: float = 0.0, damage: float = 0.0, lifespan: float = 2.0):
         """Initialize bullet component.
         Args:
@@ -19,13 +25,59 @@ class BulletComponent(Component):
             lifespan: Time in seconds before bullet expires
         """
         super().__init__(entity)
-        self.speed = speed
-        self.direction = direction
+        self.reset(entity, speed, direction, damage, lifespan)
+
+    @classmethod
+    def spawn(cls, entity: 'Entity', speed: float = 0.0, direction: float = 0.0, damage: float = 0.0, lifespan: float = 2.0) -> 'BulletComponent':
+        """Get a bullet component, reusing a released one if available."""
+        if cls._pool:
+            component = cls._pool.pop()
+            component.reset(entity, speed, direction, damage, lifespan)
+            return component
+        return cls(entity, speed, direction, damage, lifespan)
+
+    @classmethod
+    def release(cls, component: 'BulletComponent') -> None:
+        """Return a component to the pool once its bullet is removed."""
+        component.active = False
+        component.entity = None
+        if len(cls._pool) < BULLET_POOL_LIMIT:
+            cls._pool.append(component)
+
+    def reset(self, entity: 'Entity', speed: float = 0.0, direction: float = 0.0, damage: float = 0.0, lifespan: float = 2.0):
+        """Reinitialize the component for a new bullet."""
+        self.entity = entity
+        self._speed = speed
+        self._direction = direction
+        self._update_velocity()
         self.damage = damage
         self.lifespan = lifespan
         self.age = 0.0
         self.active = True
 
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float):
+        self._speed = value
+        self._update_velocity()
+
+    @property
+    def direction(self) -> float:
+        return self._direction
+
+    @direction.setter
+    def direction(self, value: float):
+        self._direction = value
+        self._update_velocity()
+
+    def _update_velocity(self):
+        """Cache the velocity vector so constant-heading bullets skip trig every frame."""
+        self.vx = self._speed * math.cos(self._direction)
+        self.vy = self._speed * math.sin(self._direction)
+
     def update(self, dt: float):
         self.age += dt
         if self.age >= self.lifespan:
@@ -52,4 +104,27 @@ class BulletComponent(Component):
         )
         component.age = data.get("age", 0.0)
         component.active = data.get("active", True)
-        return component 
\ No newline at end of file
+        return component
+
+    def to_bytes(self) -> bytes:
+        """Serialize component to msgpack bytes."""
+        from .serialization import BulletState, encode
+        return encode(BulletState(
+            self.speed, self.direction, self.damage, self.lifespan, self.age, self.active
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, entity: 'Entity') -> 'BulletComponent':
+        """Create component from msgpack bytes."""
+        from .serialization import BulletState, decode
+        state = decode(payload, BulletState)
+        component = cls(
+            entity=entity,
+            speed=state.speed,
+            direction=state.direction,
+            damage=state.damage,
+            lifespan=state.lifespan
+        )
+        component.age = state.age
+        component.active = state.active
+        return component
@@ -9,13 +9,14 @@ if TYPE_CHECKING:
 
 class CollisionComponent(Component):
     """Component for entity collision detection."""
-    def __init__(self, entity: 'Entity', width: float = 32.0, height: float = 32.0):
+    def __init__(self, entity: 'Entity', width: float = 32.0, height: float = 32.0, is_static: bool = False):
         """Initialize collision component.
         
         Args:
             entity: The entity this component belongs to
             width: Width of collision box
             height: Height of collision box
+            is_static: Whether the collider barely moves (bosses, terrain)
         """
         super().__init__(entity)
         self.width = width
@@ -25,6 +26,7 @@ class CollisionComponent(Component):
         self.is_trigger = False
         self.collision_mask = 0xFFFFFFFF  # All layers
         self.collision_layer = 0x1  # Default layer
+        self.is_static = is_static  # Static colliders use the AABB tree broad phase
         
     def get_rect(self):
         """Get collision rectangle.
@@ -53,7 +55,8 @@ class CollisionComponent(Component):
             "offset_y": self.offset_y,
             "is_trigger": self.is_trigger,
             "collision_mask": self.collision_mask,
-            "collision_layer": self.collision_layer
+            "collision_layer": self.collision_layer,
+            "is_static": self.is_static
         }
     
     @classmethod
@@ -62,11 +65,38 @@ class CollisionComponent(Component):
         component = cls(
             entity=entity,
             width=data.get("width", 32.0),
-            height=data.get("height", 32.0)
+            height=data.get("height", 32.0),
+            is_static=data.get("is_static", False)
         )
         component.offset_x = data.get("offset_x", 0.0)
         component.offset_y = data.get("offset_y", 0.0)
         component.is_trigger = data.get("is_trigger", False)
         component.collision_mask = data.get("collision_mask", 0xFFFFFFFF)
         component.collision_layer = data.get("collision_layer", 0x1)
-        return component 
\ No newline at end of file
+        return component
+
+    def to_bytes(self) -> bytes:
+        """Serialize component to msgpack bytes."""
+        from .serialization import CollisionState, encode
+        return encode(CollisionState(
+            self.width, self.height, self.offset_x, self.offset_y, self.is_trigger,
+            self.collision_mask, self.collision_layer, self.is_static
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, entity: 'Entity') -> 'CollisionComponent':
+        """Create component from msgpack bytes."""
+        from .serialization import CollisionState, decode
+        state = decode(payload, CollisionState)
+        component = cls(
+            entity=entity,
+            width=state.width,
+            height=state.height,
+            is_static=state.is_static
+        )
+        component.offset_x = state.offset_x
+        component.offset_y = state.offset_y
+        component.is_trigger = state.is_trigger
+        component.collision_mask = state.collision_mask
+        component.collision_layer = state.collision_layer
+        return component
@@ -45,4 +45,25 @@ class DamageComponent(Component):
         component.damage_multiplier = data.get("damage_multiplier", 1.0)
         component.critical_chance = data.get("critical_chance", 0.0)
         component.critical_multiplier = data.get("critical_multiplier", 2.0)
-        return component 
\ No newline at end of file
+        return component
+
+    def to_bytes(self) -> bytes:
+        """Serialize component to msgpack bytes."""
+        from .serialization import DamageState, encode
+        return encode(DamageState(
+            self.damage, self.damage_multiplier, self.critical_chance, self.critical_multiplier
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, entity: 'Entity') -> 'DamageComponent':
+        """Create component from msgpack bytes."""
+        from .serialization import DamageState, decode
+        state = decode(payload, DamageState)
+        component = cls(
+            entity=entity,
+            damage=state.damage
+        )
+        component.damage_multiplier = state.damage_multiplier
+        component.critical_chance = state.critical_chance
+        component.critical_multiplier = state.critical_multiplier
+        return component
@@ -46,4 +46,27 @@ class EnemyComponent(Component):
         component.is_boss = data.get("is_boss", False)
         component.spawn_time = data.get("spawn_time", 0.0)
         component.aggro = data.get("aggro", False)
-        return component 
\ No newline at end of file
+        return component
+
+    def to_bytes(self) -> bytes:
+        """Serialize component to msgpack bytes."""
+        from .serialization import EnemyState, encode
+        return encode(EnemyState(
+            self.enemy_type, self.ai_type, self.level, self.is_boss, self.spawn_time, self.aggro
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, entity: 'Entity') -> 'EnemyComponent':
+        """Create component from msgpack bytes."""
+        from .serialization import EnemyState, decode
+        state = decode(payload, EnemyState)
+        component = cls(
+            entity=entity,
+            enemy_type=state.enemy_type,
+            ai_type=state.ai_type,
+            level=state.level
+        )
+        component.is_boss = state.is_boss
+        component.spawn_time = state.spawn_time
+        component.aggro = state.aggro
+        return component
@@ -5,6 +5,8 @@ from typing import Dict, Any, TYPE_CHECKING
 import logging
 from base import Component
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from entities import Entity
 
@@ -18,8 +20,6 @@ class HealthComponent(Component):
             max_health: Maximum health value
         """
         super().__init__(entity)
-        self.logger = logging.getLogger("HealthComponent")
-        
         self.entity = entity
         self.max_health = max_health
         self.current_health = max_health
@@ -37,7 +37,7 @@ class HealthComponent(Component):
             self.invincible_timer -= dt
             if self.invincible_timer <= 0:
                 self.invincible = False
-                self.logger.debug(f"Entity {self.entity.id} is no longer invincible")
+                logger.debug("Entity %s is no longer invincible", self.entity.id)
     
     def take_damage(self, amount: float) -> bool:
         """Take damage.
@@ -49,14 +49,14 @@ class HealthComponent(Component):
             bool: True if damage was taken, False if invincible
         """
         if self.invincible:
-            self.logger.debug(f"Entity {self.entity.id} is invincible, no damage taken")
+            logger.debug("Entity %s is invincible, no damage taken", self.entity.id)
             return False
             
         self.current_health = max(0, self.current_health - amount)
-        self.logger.debug(f"Entity {self.entity.id} took {amount} damage, health: {self.current_health}")
+        logger.debug("Entity %s took %s damage, health: %s", self.entity.id, amount, self.current_health)
         
         if self.is_dead():
-            self.logger.info(f"Entity {self.entity.id} died")
+            logger.info("Entity %s died", self.entity.id)
             
         return True
     
@@ -69,15 +69,18 @@ class HealthComponent(Component):
         Returns:
             bool: True if healing was applied
         """
-        if self.is_dead():
-            self.logger.warning(f"Cannot heal dead entity {self.entity.id}")
+        old_health = self.current_health
+        if old_health <= 0:  # Inlined is_dead()
+            logger.warning("Cannot heal dead entity %s", self.entity.id)
             return False
             
-        old_health = self.current_health
-        self.current_health = min(self.max_health, self.current_health + amount)
+        new_health = old_health + amount
+        if new_health > self.max_health:
+            new_health = self.max_health
+        self.current_health = new_health
         
-        if self.current_health > old_health:
-            self.logger.debug(f"Entity {self.entity.id} healed for {amount}, health: {self.current_health}")
+        if new_health > old_health:
+            logger.debug("Entity %s healed for %s, health: %s", self.entity.id, amount, new_health)
             return True
             
         return False
@@ -99,7 +102,7 @@ class HealthComponent(Component):
         self.invincible = True
         self.invincible_timer = duration
         self.invincible_duration = duration
-        self.logger.debug(f"Entity {self.entity.id} is invincible for {duration} seconds")
+        logger.debug("Entity %s is invincible for %s seconds", self.entity.id, duration)
     
     def get_health_percentage(self) -> float:
         """Get current health as a percentage.
@@ -114,7 +117,7 @@ class HealthComponent(Component):
         self.current_health = self.max_health
         self.invincible = False
         self.invincible_timer = 0.0
-        self.logger.debug(f"Entity {self.entity.id} health reset to {self.max_health}")
+        logger.debug("Entity %s health reset to %s", self.entity.id, self.max_health)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert component to dictionary."""
@@ -137,4 +140,27 @@ class HealthComponent(Component):
         component.invincible = data.get("invincible", False)
         component.invincible_timer = data.get("invincible_timer", 0.0)
         component.invincible_duration = data.get("invincible_duration", 0.0)
-        return component 
\ No newline at end of file
+        return component
+
+    def to_bytes(self) -> bytes:
+        """Serialize component to msgpack bytes."""
+        from .serialization import HealthState, encode
+        return encode(HealthState(
+            self.max_health, self.current_health, self.invincible,
+            self.invincible_timer, self.invincible_duration
+        ))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, entity: 'Entity') -> 'HealthComponent':
+        """Create component from msgpack bytes."""
+        from .serialization import HealthState, decode
+        state = decode(payload, HealthState)
+        component = cls(
+            entity=entity,
+            max_health=state.max_health
+        )
+        component.current_health = state.current_health
+        component.invincible = state.invincible
+        component.invincible_timer = state.invincible_timer
+        component.invincible_duration = state.invincible_duration
+        return component
@@ -0,0 +1,68 @@
+"""
+Binary serialization for components using msgspec.
+
+Each struct mirrors the serialized fields of a component. Structs are
+array_like, so payloads are positional msgpack arrays rather than maps.
+"""
+from typing import Dict, Type, TypeVar
+import msgspec
+
+S = TypeVar('S', bound=msgspec.Struct)
+
+class BulletState(msgspec.Struct, array_like=True):
+    """Serialized form of BulletComponent."""
+    speed: float
+    direction: float
+    damage: float
+    lifespan: float
+    age: float
+    active: bool
+
+class CollisionState(msgspec.Struct, array_like=True):
+    """Serialized form of CollisionComponent."""
+    width: float
+    height: float
+    offset_x: float
+    offset_y: float
+    is_trigger: bool
+    collision_mask: int
+    collision_layer: int
+    is_static: bool
+
+class DamageState(msgspec.Struct, array_like=True):
+    """Serialized form of DamageComponent."""
+    damage: float
+    damage_multiplier: float
+    critical_chance: float
+    critical_multiplier: float
+
+class EnemyState(msgspec.Struct, array_like=True):
+    """Serialized form of EnemyComponent."""
+    enemy_type: str
+    ai_type: str
+    level: int
+    is_boss: bool
+    spawn_time: float
+    aggro: bool
+
+class HealthState(msgspec.Struct, array_like=True):
+    """Serialized form of HealthComponent."""
+    max_health: float
+    current_health: float
+    invincible: bool
+    invincible_timer: float
+    invincible_duration: float
+
+_encoder = msgspec.msgpack.Encoder()
+_decoders: Dict[type, msgspec.msgpack.Decoder] = {}
+
+def encode(state: msgspec.Struct) -> bytes:
+    """Encode a component state struct to msgpack bytes."""
+    return _encoder.encode(state)
+
+def decode(payload: bytes, state_type: Type[S]) -> S:
+    """Decode msgpack bytes into a component state struct."""
+    decoder = _decoders.get(state_type)
+    if decoder is None:
+        decoder = _decoders[state_type] = msgspec.msgpack.Decoder(state_type)
+    return decoder.decode(payload)
@@ -6,6 +6,8 @@ import pygame
 import logging
 from base import Component
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from entities import Entity
 
@@ -24,8 +26,6 @@ class SpriteComponent(Component):
             frame: Initial animation frame
         """
         super().__init__(entity)
-        self.logger = logging.getLogger("SpriteComponent")
-        
         # Basic sprite properties
         self.image: Optional[pygame.Surface] = None
         self.image_key: str = image_key
@@ -66,20 +66,20 @@ class SpriteComponent(Component):
             from asset_manager import AssetManager
             asset_manager = AssetManager.get_instance()
             if not asset_manager:
-                self.logger.error("AssetManager not available")
+                logger.error("AssetManager not available")
                 return False
                 
             self.image = asset_manager.get_image(image_key)
             if not self.image:
-                self.logger.error(f"Failed to load image: {image_key}")
+                logger.error("Failed to load image: %s", image_key)
                 return False
                 
             self.image_key = image_key
-            self.logger.debug(f"Successfully loaded image: {image_key}")
+            logger.debug("Successfully loaded image: %s", image_key)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error loading image {image_key}: {str(e)}")
+            logger.error("Error loading image %s: %s", image_key, e)
             return False
     
     def play_animation(self, animation_name: str, reset: bool = True) -> bool:
@@ -93,7 +93,7 @@ class SpriteComponent(Component):
             bool: True if animation exists and was started, False otherwise
         """
         if not self.animation or animation_name not in self.animation:
-            self.logger.warning(f"Animation not found: {animation_name}")
+            logger.warning("Animation not found: %s", animation_name)
             return False
             
         self.current_animation = animation_name
@@ -102,7 +102,7 @@ class SpriteComponent(Component):
             self.frame_time = 0.0
             self.animation_complete = False
             
-        self.logger.debug(f"Playing animation: {animation_name}")
+        logger.debug("Playing animation: %s", animation_name)
         return True
     
     def update(self, dt: float) -> None:
@@ -122,7 +122,7 @@ class SpriteComponent(Component):
             # Check if animation completed one cycle
             if self.frame_index == 0:
                 self.animation_complete = True
-                self.logger.debug(f"Animation cycle completed: {self.current_animation}")
+                logger.debug("Animation cycle completed: %s", self.current_animation)
     
     def get_current_frame(self) -> Optional[pygame.Surface]:
         """Get the current animation frame or static image.
@@ -137,7 +137,7 @@ class SpriteComponent(Component):
                 frame = self.image
                 
             if not frame:
-                self.logger.warning("No frame or image available")
+                logger.warning("No frame or image available")
                 return None
                 
             # Apply transformations
@@ -155,7 +155,7 @@ class SpriteComponent(Component):
             return frame
             
         except Exception as e:
-            self.logger.error(f"Error getting current frame: {str(e)}")
+            logger.error("Error getting current frame: %s", e)
             return None
     
     def add_animation(self, name: str, frames: List[pygame.Surface], duration: float = 0.1) -> bool:
@@ -171,7 +171,7 @@ class SpriteComponent(Component):
         """
         try:
             if not frames:
-                self.logger.error(f"Cannot add empty animation: {name}")
+                logger.error("Cannot add empty animation: %s", name)
                 return False
                 
             if not self.animation:
@@ -179,11 +179,11 @@ class SpriteComponent(Component):
                 
             self.animation[name] = frames
             self.frame_duration = duration
-            self.logger.debug(f"Added animation: {name} with {len(frames)} frames")
+            logger.debug("Added animation: %s with %s frames", name, len(frames))
             return True
             
         except Exception as e:
-            self.logger.error(f"Error adding animation {name}: {str(e)}")
+            logger.error("Error adding animation %s: %s", name, e)
             return False
     
     def to_dict(self) -> Dict[str, Any]:
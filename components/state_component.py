@@ -5,6 +5,8 @@ from typing import Dict, Any, TYPE_CHECKING
 import logging
 from base import Component
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from entities import Entity
 
@@ -18,7 +20,6 @@ class StateComponent(Component):
             initial_state: The initial state of the entity
         """
         super().__init__(entity)
-        self.logger = logging.getLogger("StateComponent")
         self.current_state = initial_state
         self.previous_state = None
         self.state_time = 0.0
@@ -43,7 +44,7 @@ class StateComponent(Component):
         self.previous_state = self.current_state
         self.current_state = new_state
         self.state_time = 0.0
-        self.logger.debug(f"Entity {self.entity.id} changed state from {self.previous_state} to {new_state}")
+        logger.debug("Entity %s changed state from %s to %s", self.entity.id, self.previous_state, new_state)
         
     def update(self, dt: float) -> None:
         """Update state component.
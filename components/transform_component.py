@@ -1,55 +1,143 @@
 """
 Transform component for entity position, rotation, and scale.
 """
+import sys
 from typing import Dict, Any, Tuple, TYPE_CHECKING
-from dataclasses import dataclass
-from base import Component
+from base import Component, make_from_dict
+from ecs.transform_store import transform_store
 
 if TYPE_CHECKING:
     from entities import Entity
 
-@dataclass
+# Interned serialization keys shared by to_dict and from_dict
+_K_X = sys.intern("x")
+_K_Y = sys.intern("y")
+_K_ROTATION = sys.intern("rotation")
+_K_SCALE_X = sys.intern("scale_x")
+_K_SCALE_Y = sys.intern("scale_y")
+
 class TransformComponent(Component):
-    """Component for entity transform properties."""
-    entity: 'Entity'
-    x: float = 0.0
-    y: float = 0.0
-    rotation: float = 0.0
-    scale_x: float = 1.0
-    scale_y: float = 1.0
+    """Component for entity transform properties.
+
+    Values live in the shared TransformStore; the component is a view onto
+    its entity's slot.
+    """
+    __slots__ = ('_slot',)
+
+    def __init__(self, entity: 'Entity', x: float = 0.0, y: float = 0.0, rotation: float = 0.0,
+                 scale_x: float = 1.0, scale_y: float = 1.0):
+        """Initialize transform component.
+
+        Args:
+            entity: The entity this component belongs to
+            x: X position
+            y: Y position
+            rotation: Rotation in degrees
+            scale_x: Horizontal scale
+            scale_y: Vertical scale
+        """
+        super().__init__()
+        self.entity = entity
+        self._slot = slot = transform_store.acquire(entity)
+        transform_store.x[slot] = x
+        transform_store.y[slot] = y
+        transform_store.rotation[slot] = rotation
+        transform_store.scale_x[slot] = scale_x
+        transform_store.scale_y[slot] = scale_y
+
+    def destroy(self) -> None:
+        """Release the store slot; the component must not be used afterwards."""
+        slot = getattr(self, '_slot', None)
+        if slot is not None:
+            self._slot = None
+            transform_store.release(slot)
+
+    def __del__(self):
+        # Fallback for components dropped without Entity.remove_component()
+        self.destroy()
+
+    def __repr__(self):
+        return f"<Transform x={self.x}, y={self.y}>"
+
+    @property
+    def x(self) -> float:
+        return transform_store.x.item(self._slot)
+
+    @x.setter
+    def x(self, value: float) -> None:
+        transform_store.x[self._slot] = value
+
+    @property
+    def y(self) -> float:
+        return transform_store.y.item(self._slot)
+
+    @y.setter
+    def y(self, value: float) -> None:
+        transform_store.y[self._slot] = value
+
+    @property
+    def rotation(self) -> float:
+        return transform_store.rotation.item(self._slot)
+
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        transform_store.rotation[self._slot] = value
+
+    @property
+    def scale_x(self) -> float:
+        return transform_store.scale_x.item(self._slot)
+
+    @scale_x.setter
+    def scale_x(self, value: float) -> None:
+        transform_store.scale_x[self._slot] = value
+
+    @property
+    def scale_y(self) -> float:
+        return transform_store.scale_y.item(self._slot)
+
+    @scale_y.setter
+    def scale_y(self, value: float) -> None:
+        transform_store.scale_y[self._slot] = value
+
+    @property
+    def position_xy(self) -> Tuple[float, float]:
+        """Position as an (x, y) tuple, for callers that need one at an API boundary."""
+        slot = self._slot
+        return (transform_store.x.item(slot), transform_store.y.item(slot))
 
     def get_position(self) -> Tuple[float, float]:
-        """Get the current position as a tuple."""
-        return (self.x, self.y)
+        """Get the current position as a tuple.
+
+        Prefer reading x and y directly; this allocates a tuple per call.
+        """
+        return self.position_xy
 
     def set_position(self, x: float, y: float) -> None:
         """Set the position."""
-        self.x = x
-        self.y = y
+        transform_store.x[self._slot] = x
+        transform_store.y[self._slot] = y
 
     def move(self, dx: float, dy: float) -> None:
         """Move the entity by the given delta."""
-        self.x += dx
-        self.y += dy
+        transform_store.x[self._slot] += dx
+        transform_store.y[self._slot] += dy
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert component to dictionary."""
+        slot = self._slot
         return {
-            "x": self.x,
-            "y": self.y,
-            "rotation": self.rotation,
-            "scale_x": self.scale_x,
-            "scale_y": self.scale_y
+            _K_X: transform_store.x.item(slot),
+            _K_Y: transform_store.y.item(slot),
+            _K_ROTATION: transform_store.rotation.item(slot),
+            _K_SCALE_X: transform_store.scale_x.item(slot),
+            _K_SCALE_Y: transform_store.scale_y.item(slot)
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any], entity: 'Entity') -> 'TransformComponent':
-        """Create component from dictionary."""
-        return cls(
-            entity=entity,
-            x=data.get("x", 0.0),
-            y=data.get("y", 0.0),
-            rotation=data.get("rotation", 0.0),
-            scale_x=data.get("scale_x", 1.0),
-            scale_y=data.get("scale_y", 1.0)
-        ) 
\ No newline at end of file
+# from_dict(data, entity) is generated for the fixed field list
+make_from_dict(TransformComponent, (
+    (_K_X, 0.0),
+    (_K_Y, 0.0),
+    (_K_ROTATION, 0.0),
+    (_K_SCALE_X, 1.0),
+    (_K_SCALE_Y, 1.0),
+))
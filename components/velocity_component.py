@@ -1,11 +1,45 @@
-from dataclasses import dataclass
+from ecs.transform_store import transform_store
 
-@dataclass
 class VelocityComponent:
-    """Component for velocity-related properties."""
-    entity: object
-    vx: float = 0
-    vy: float = 0
+    """Component for velocity-related properties.
+
+    Values live in the shared TransformStore, in the same slot as the
+    entity's TransformComponent.
+    """
+    __slots__ = ('entity', '_slot')
+
+    def __init__(self, entity: object, vx: float = 0, vy: float = 0):
+        self.entity = entity
+        self._slot = slot = transform_store.acquire(entity)
+        transform_store.vx[slot] = vx
+        transform_store.vy[slot] = vy
+
+    def destroy(self) -> None:
+        """Release the store slot; the component must not be used afterwards."""
+        slot = getattr(self, '_slot', None)
+        if slot is not None:
+            self._slot = None
+            transform_store.release(slot)
+
+    def __del__(self):
+        # Fallback for components dropped without Entity.remove_component()
+        self.destroy()
+
+    @property
+    def vx(self) -> float:
+        return transform_store.vx.item(self._slot)
+
+    @vx.setter
+    def vx(self, value: float) -> None:
+        transform_store.vx[self._slot] = value
+
+    @property
+    def vy(self) -> float:
+        return transform_store.vy.item(self._slot)
+
+    @vy.setter
+    def vy(self, value: float) -> None:
+        transform_store.vy[self._slot] = value
 
     def __repr__(self):
-        return f"<Velocity vx={self.vx}, vy={self.vy}>" 
\ No newline at end of file
+        return f"<Velocity vx={self.vx}, vy={self.vy}>"
@@ -2,13 +2,19 @@
 Zone component for entity zone management.
 """
 from typing import Dict, Any, TYPE_CHECKING
-from base import Component
+from base import Component, make_from_dict
+from ecs.zone_store import zone_store, ZONE_ACTIVE, ZONE_TRIGGERED
 
 if TYPE_CHECKING:
     from entities import Entity
 
 class ZoneComponent(Component):
-    """Component for entity zone management."""
+    """Component for entity zone management.
+
+    The zone id and flags live in the shared ZoneStore slot.
+    """
+    __slots__ = ('_slot',)
+
     def __init__(self, entity: 'Entity', zone_id: str = None):
         """Initialize zone component.
         
@@ -17,9 +23,44 @@ class ZoneComponent(Component):
             zone_id: Unique identifier for the zone
         """
         super().__init__(entity)
-        self.zone_id = zone_id
-        self.is_active = True
-        self.triggered = False
+        self.entity = entity
+        self._slot = zone_store.alloc(zone_id)
+        zone_store.flags[self._slot] = ZONE_ACTIVE
+
+    def __del__(self):
+        slot = getattr(self, '_slot', None)
+        if slot is not None:
+            zone_store.free(slot)
+
+    @property
+    def zone_id(self) -> str:
+        return zone_store.zone_ids[self._slot]
+
+    @zone_id.setter
+    def zone_id(self, value: str) -> None:
+        zone_store.zone_ids[self._slot] = value
+
+    @property
+    def is_active(self) -> bool:
+        return bool(zone_store.flags[self._slot] & ZONE_ACTIVE)
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        if value:
+            zone_store.flags[self._slot] |= ZONE_ACTIVE
+        else:
+            zone_store.flags[self._slot] &= ~ZONE_ACTIVE & 0xFF
+
+    @property
+    def triggered(self) -> bool:
+        return bool(zone_store.flags[self._slot] & ZONE_TRIGGERED)
+
+    @triggered.setter
+    def triggered(self, value: bool) -> None:
+        if value:
+            zone_store.flags[self._slot] |= ZONE_TRIGGERED
+        else:
+            zone_store.flags[self._slot] &= ~ZONE_TRIGGERED & 0xFF
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert component to dictionary."""
@@ -28,14 +69,10 @@ class ZoneComponent(Component):
             "is_active": self.is_active,
             "triggered": self.triggered
         }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any], entity: 'Entity') -> 'ZoneComponent':
-        """Create component from dictionary."""
-        component = cls(
-            entity=entity,
-            zone_id=data.get("zone_id")
-        )
-        component.is_active = data.get("is_active", True)
-        component.triggered = data.get("triggered", False)
-        return component 
\ No newline at end of file
+
+# from_dict(data, entity) is generated for the fixed field list
+make_from_dict(
+    ZoneComponent,
+    (("zone_id", None),),
+    (("is_active", True), ("triggered", False)),
+)
@@ -1,15 +1,20 @@
 """
 Game configuration and constants.
 """
-import pygame
-from typing import Dict, Tuple, List, Optional, Any, Set
-from dataclasses import dataclass, field
+import numpy as np
+from typing import Dict, Tuple, List, Optional, Any, Set, TYPE_CHECKING
+from dataclasses import dataclass, fields
 import json
 import os
+try:
+    import orjson
+except ImportError:  # Optional; fall back to the stdlib json module
+    orjson = None
 from logger import logger
-import traceback
-from base import Component
-from entities import Entity, EntityType
+from base import Component, REQUIRED, make_from_dict
+
+if TYPE_CHECKING:
+    from entities import Entity
 
 # Display settings
 SCREEN_WIDTH = 800
@@ -73,6 +78,17 @@ PLATFORM_POSITIONS: List[Tuple[int, int, int, int]] = [
     (600, 400, 200, 32)
 ]
 
+# Platform bounds as arrays, so collision queries can test every platform
+# with one broadcast compare, e.g. np.any((x > PLATFORM_X0) & (x < PLATFORM_X1) & ...)
+_platforms = np.asarray(PLATFORM_POSITIONS, dtype=np.int32)
+PLATFORM_X0 = _platforms[:, 0]
+PLATFORM_Y0 = _platforms[:, 1]
+PLATFORM_X1 = _platforms[:, 0] + _platforms[:, 2]
+PLATFORM_Y1 = _platforms[:, 1] + _platforms[:, 3]
+for _bounds in (PLATFORM_X0, PLATFORM_Y0, PLATFORM_X1, PLATFORM_Y1):
+    _bounds.flags.writeable = False
+del _platforms, _bounds
+
 # UI settings
 UI_FONT_SIZE = 24
 UI_COLOR = WHITE
@@ -87,16 +103,35 @@ class GameState:
     PAUSED = "paused"
     GAME_OVER = "game_over"
 
+# Key and mouse button codes, matching the pygame constants of the same
+# name. Kept as literals so config can be imported without pygame.
+K_SPACE = 32
+K_ESCAPE = 27
+K_a = 97
+K_d = 100
+K_q = 113
+K_s = 115
+K_w = 119
+K_RIGHT = 1073741903
+K_LEFT = 1073741904
+K_UP = 1073741906
+K_LSHIFT = 1073742049
+BUTTON_LEFT = 1
+BUTTON_RIGHT = 3
+
 # Input mappings
 INPUT_MAPPINGS = {
-    "left": [pygame.K_a, pygame.K_LEFT],
-    "right": [pygame.K_d, pygame.K_RIGHT],
-    "jump": [pygame.K_w, pygame.K_UP, pygame.K_SPACE],
-    "shoot": [pygame.BUTTON_LEFT],
-    "grapple": [pygame.BUTTON_RIGHT],
-    "pause": [pygame.K_ESCAPE]
+    "left": [K_a, K_LEFT],
+    "right": [K_d, K_RIGHT],
+    "jump": [K_w, K_UP, K_SPACE],
+    "shoot": [BUTTON_LEFT],
+    "grapple": [BUTTON_RIGHT],
+    "pause": [K_ESCAPE]
 }
 
+# Inverted INPUT_MAPPINGS for O(1) dispatch: key or mouse button code -> action
+KEY_TO_ACTION: Dict[int, str] = {key: action for action, keys in INPUT_MAPPINGS.items() for key in keys}
+
 # Zone settings
 ZONE_SIZE = 320  # 10 tiles * 32 pixels
 ZONE_LOAD_DISTANCE = 2  # Number of zones to load in each direction
@@ -205,36 +240,137 @@ PARTICLE_SETTINGS = {
     }
 }
 
+class _ReadThroughDict(dict):
+    """Dict that reads from a shared default until it is first written.
+
+    reset_config hands every config the same default table; the copy only
+    happens when a config actually diverges from it.
+    """
+    __slots__ = ('_default',)
+
+    def __init__(self, default: Dict[str, Any]):
+        super().__init__()
+        self._default = default
+
+    def _detach(self) -> None:
+        """Copy the shared default into this dict and stop reading through."""
+        if self._default is not None:
+            dict.update(self, self._default)
+            self._default = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._default is None:
+            return dict.__getitem__(self, key)
+        return self._default[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._default is None:
+            return dict.get(self, key, default)
+        return self._default.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if self._default is None:
+            return dict.__contains__(self, key)
+        return key in self._default
+
+    def __iter__(self):
+        if self._default is None:
+            return dict.__iter__(self)
+        return iter(self._default)
+
+    def __len__(self) -> int:
+        if self._default is None:
+            return dict.__len__(self)
+        return len(self._default)
+
+    def __eq__(self, other: object) -> bool:
+        if self._default is None:
+            return dict.__eq__(self, other)
+        return self._default == other
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # Mutable like dict; defining __eq__ must not bring back hashing
+
+    def __repr__(self) -> str:
+        if self._default is None:
+            return dict.__repr__(self)
+        return repr(self._default)
+
+    def keys(self):
+        return self._default.keys() if self._default is not None else dict.keys(self)
+
+    def values(self):
+        return self._default.values() if self._default is not None else dict.values(self)
+
+    def items(self):
+        return self._default.items() if self._default is not None else dict.items(self)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._detach()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._detach()
+        dict.__delitem__(self, key)
+
+    def update(self, *args, **kwargs) -> None:
+        self._detach()
+        dict.update(self, *args, **kwargs)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._detach()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, *args) -> Any:
+        self._detach()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._detach()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._default = None
+        dict.clear(self)
+
 @dataclass
 class ConfigComponent(Component):
     """Component for handling configuration."""
+    entity: Optional['Entity'] = None
     config_id: str = ""
     config_type: str = "game"
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Optional[Dict[str, Any]] = None  # Allocated on first write
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert component to dictionary."""
-        return {
-            "config_id": self.config_id,
-            "config_type": self.config_type,
-            "data": self.data
-        }
-        
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ConfigComponent':
-        """Create component from dictionary."""
-        return cls(
-            config_id=data["config_id"],
-            config_type=data["config_type"],
-            data=data["data"]
-        )
+        data = {name: getattr(self, name) for name in self._FIELD_NAMES}
+        if self.data is None:
+            data["data"] = {}
+        elif isinstance(self.data, _ReadThroughDict):
+            # The JSON encoders read dict storage directly, bypassing the overrides
+            data["data"] = self.data.copy()
+        return data
+
+# Serialized field names, cached once instead of reflecting on every to_dict
+ConfigComponent._FIELD_NAMES = tuple(f.name for f in fields(ConfigComponent) if f.name != "entity")
+
+# from_dict(data) is generated for the same fields; all of them are required
+make_from_dict(ConfigComponent, ((name, REQUIRED) for name in ConfigComponent._FIELD_NAMES), entity=False)
 
 class ConfigManager:
     """Manages game configuration."""
     
     def __init__(self):
         """Initialize the configuration manager."""
-        self.configs: Dict[str, Entity] = {}
+        self.configs: Dict[str, 'Entity'] = {}
+        # config_id -> ConfigComponent, so reads skip the entity lookup
+        self._components: Dict[str, ConfigComponent] = {}
         self.default_config: Dict[str, Any] = {
             "game": {
                 "screen_width": 800,
@@ -265,13 +401,13 @@ class ConfigManager:
             },
             "input": {
                 "keyboard": {
-                    "up": pygame.K_w,
-                    "down": pygame.K_s,
-                    "left": pygame.K_a,
-                    "right": pygame.K_d,
-                    "shoot": pygame.K_SPACE,
-                    "dash": pygame.K_LSHIFT,
-                    "ultimate": pygame.K_q
+                    "up": K_w,
+                    "down": K_s,
+                    "left": K_a,
+                    "right": K_d,
+                    "shoot": K_SPACE,
+                    "dash": K_LSHIFT,
+                    "ultimate": K_q
                 },
                 "gamepad": {
                     "deadzone": 0.1,
@@ -294,27 +430,29 @@ class ConfigManager:
         }
         
     def create_config(self, config_id: str, config_type: str,
-                     data: Optional[Dict[str, Any]] = None) -> Entity:
+                     data: Optional[Dict[str, Any]] = None) -> 'Entity':
         """Create a new configuration."""
+        from entities import Entity, EntityType  # Deferred so config imports headless
         try:
             # Create entity
             entity = Entity(EntityType.EFFECT)
             
             # Create config component
             config = ConfigComponent(
+                entity=entity,
                 config_id=config_id,
                 config_type=config_type,
-                data=data or {}
+                data=data
             )
             entity.add_component(config)
             
             # Store config
             self.configs[config_id] = entity
+            self._components[config_id] = config
             return entity
             
         except Exception as e:
-            logger.error(f"Error creating configuration: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error creating configuration: %s", e)
             return None
             
     def delete_config(self, config_id: str) -> None:
@@ -322,118 +460,103 @@ class ConfigManager:
         try:
             if config_id in self.configs:
                 del self.configs[config_id]
+                self._components.pop(config_id, None)
                 
         except Exception as e:
-            logger.error(f"Error deleting configuration: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error deleting configuration: %s", e)
             
-    def get_config(self, config_id: str) -> Optional[Entity]:
+    def get_config(self, config_id: str) -> Optional['Entity']:
         """Get a configuration by ID."""
         return self.configs.get(config_id)
         
     def get_value(self, config_id: str, key: str,
                   default: Any = None) -> Any:
         """Get a configuration value."""
-        try:
-            config = self.get_config(config_id)
-            if not config:
-                return default
-                
-            config_component = config.get_component(ConfigComponent)
-            if not config_component:
-                return default
-                
-            return config_component.data.get(key, default)
-            
-        except Exception as e:
-            logger.error(f"Error getting configuration value: {str(e)}")
-            logger.error(traceback.format_exc())
+        config_component = self._components.get(config_id)
+        if config_component is None or config_component.data is None:
             return default
+        return config_component.data.get(key, default)
             
     def set_value(self, config_id: str, key: str, value: Any) -> None:
         """Set a configuration value."""
-        try:
-            config = self.get_config(config_id)
-            if not config:
-                return
-                
-            config_component = config.get_component(ConfigComponent)
-            if not config_component:
-                return
-                
+        config_component = self._components.get(config_id)
+        if config_component is not None:
+            if config_component.data is None:
+                config_component.data = {}
             config_component.data[key] = value
             
-        except Exception as e:
-            logger.error(f"Error setting configuration value: {str(e)}")
-            logger.error(traceback.format_exc())
-            
     def load_config(self, filename: str) -> None:
         """Load configuration from file."""
         try:
             if not os.path.exists(filename):
                 return
                 
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    data = json.load(f)
                 
             # Create new manager
             new_manager = self.from_dict(data)
             
             # Update current manager
             self.configs = new_manager.configs
+            self._components = new_manager._components
             
         except Exception as e:
-            logger.error(f"Error loading configuration: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error loading configuration: %s", e)
             
     def save_config(self, filename: str) -> None:
         """Save configuration to file."""
         try:
             data = self.to_dict()
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=4)
                 
         except Exception as e:
-            logger.error(f"Error saving configuration: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error saving configuration: %s", e)
             
     def reset_config(self, config_id: str) -> None:
         """Reset a configuration to default values."""
         try:
-            config = self.get_config(config_id)
-            if not config:
-                return
-                
-            config_component = config.get_component(ConfigComponent)
-            if not config_component:
+            config_component = self._components.get(config_id)
+            if config_component is None:
                 return
                 
             # Get default values
             default_data = self.default_config.get(config_component.config_type, {})
             
-            # Update config
-            config_component.data = default_data.copy()
+            # Share the defaults until the config is first written
+            config_component.data = _ReadThroughDict(default_data)
             
         except Exception as e:
-            logger.error(f"Error resetting configuration: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error resetting configuration: %s", e)
             
     def to_dict(self) -> Dict[str, Any]:
         """Convert manager to dictionary."""
         return {
             "configs": {
-                config_id: entity.get_component(ConfigComponent).to_dict()
-                for config_id, entity in self.configs.items()
+                config_id: component.to_dict()
+                for config_id, component in self._components.items()
             }
         }
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConfigManager':
         """Create manager from dictionary."""
+        from entities import Entity, EntityType  # Deferred so config imports headless
         manager = cls()
         for config_id, config_data in data["configs"].items():
             entity = Entity(EntityType.EFFECT)
             config = ConfigComponent.from_dict(config_data)
+            config.entity = entity
             entity.add_component(config)
             manager.configs[config_id] = entity
+            manager._components[config_id] = config
         return manager 
\ No newline at end of file
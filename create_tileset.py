@@ -1,45 +1,78 @@
 from PIL import Image, ImageDraw
+import hashlib
+import numpy as np
 import os
 
+TILE_SIZE = 32
+
+# Platform colors
+BASE_COLOR = (100, 100, 100, 255)
+HIGHLIGHT_COLOR = (150, 150, 150, 255)
+SHADOW_COLOR = (50, 50, 50, 255)
+
+# Bump when the drawing code changes so cached assets are regenerated
+GENERATOR_VERSION = 1
+
+def _params_hash(*params):
+    """Hash the generation parameters of an asset."""
+    return hashlib.md5(repr((GENERATOR_VERSION,) + params).encode()).hexdigest()
+
+def _is_up_to_date(paths, hash_path, digest):
+    """Check that every output exists and was made with the same parameters."""
+    if not all(os.path.exists(path) for path in paths):
+        return False
+    try:
+        with open(hash_path) as f:
+            return f.read().strip() == digest
+    except OSError:
+        return False
+
+def _write_hash(hash_path, digest):
+    with open(hash_path, 'w') as f:
+        f.write(digest)
+
 def create_platform_tileset():
-    # Create a new image with a transparent background
-    tile_size = 32
-    tileset = Image.new('RGBA', (tile_size * 4, tile_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(tileset)
-    
-    # Define colors
-    base_color = (100, 100, 100)
-    highlight_color = (150, 150, 150)
-    shadow_color = (50, 50, 50)
+    # Build every tile as one RGBA array instead of a dozen draw calls
+    tile_size = TILE_SIZE
+    base_color = BASE_COLOR
+    highlight_color = HIGHLIGHT_COLOR
+    shadow_color = SHADOW_COLOR
     
-    # Draw left tile
-    draw.rectangle([0, 0, tile_size, tile_size], fill=base_color)
-    draw.rectangle([0, 0, tile_size, tile_size], outline=highlight_color, width=2)
-    draw.rectangle([2, 2, tile_size-2, tile_size-2], outline=shadow_color, width=1)
+    # Skip generation if the cached tileset was built from the same parameters
+    digest = _params_hash(tile_size, base_color, highlight_color, shadow_color)
+    if _is_up_to_date(['assets/platforms.png'], 'assets/platforms.png.hash', digest):
+        return
     
-    # Draw middle tile
-    draw.rectangle([tile_size, 0, tile_size*2, tile_size], fill=base_color)
-    draw.rectangle([tile_size, 0, tile_size*2, tile_size], outline=highlight_color, width=2)
-    draw.rectangle([tile_size+2, 2, tile_size*2-2, tile_size-2], outline=shadow_color, width=1)
+    # One tile: base fill, 2px highlight border, 1px shadow inset
+    tile = np.empty((tile_size, tile_size, 4), dtype=np.uint8)
+    tile[:, :] = base_color
+    inner = slice(2, tile_size - 1)
+    tile[2, inner] = shadow_color
+    tile[tile_size - 2, inner] = shadow_color
+    tile[inner, 2] = shadow_color
+    tile[inner, tile_size - 2] = shadow_color
+    tile[:2, :] = highlight_color
+    tile[-1:, :] = highlight_color
+    tile[:, :2] = highlight_color
+    tile[:, -1:] = highlight_color
     
-    # Draw right tile
-    draw.rectangle([tile_size*2, 0, tile_size*3, tile_size], fill=base_color)
-    draw.rectangle([tile_size*2, 0, tile_size*3, tile_size], outline=highlight_color, width=2)
-    draw.rectangle([tile_size*2+2, 2, tile_size*3-2, tile_size-2], outline=shadow_color, width=1)
-    
-    # Draw single tile
-    draw.rectangle([tile_size*3, 0, tile_size*4, tile_size], fill=base_color)
-    draw.rectangle([tile_size*3, 0, tile_size*4, tile_size], outline=highlight_color, width=2)
-    draw.rectangle([tile_size*3+2, 2, tile_size*4-2, tile_size-2], outline=shadow_color, width=1)
+    # Left, middle, right and single tiles are identical
+    tileset = Image.fromarray(np.tile(tile, (1, 4, 1)), 'RGBA')
     
     # Save the tileset
     if not os.path.exists('assets'):
         os.makedirs('assets')
     tileset.save('assets/platforms.png')
+    _write_hash('assets/platforms.png.hash', digest)
 
 def create_overlay_textures():
     """Create overlay textures for platform effects."""
-    tile_size = 32
+    tile_size = TILE_SIZE
+    
+    overlays = ['assets/overlays/cracks.png', 'assets/overlays/glow.png', 'assets/overlays/frost.png']
+    digest = _params_hash(tile_size)
+    if _is_up_to_date(overlays, 'assets/overlays/overlays.hash', digest):
+        return
     
     # Create overlays directory if it doesn't exist
     if not os.path.exists('assets/overlays'):
@@ -58,14 +91,18 @@ def create_overlay_textures():
     cracks.save('assets/overlays/cracks.png')
     
     # Create glow overlay
-    glow = Image.new('RGBA', (tile_size, tile_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(glow)
-    # Draw a soft glow effect
-    for i in range(10):
-        alpha = int(128 * (1 - i/10))
-        draw.ellipse([i, i, tile_size-i, tile_size-i], 
-                    fill=(255, 255, 255, alpha))
-    glow.save('assets/overlays/glow.png')
+    # Soft glow: 10 concentric rings stepping alpha down from 128 at the
+    # edge, computed from each pixel's distance to the centre
+    center = tile_size / 2
+    outer = center + 0.5
+    ys, xs = np.indices((tile_size, tile_size))
+    radius = np.hypot(xs - center, ys - center)
+    ring = np.clip(np.floor(outer - radius), 0, 9)
+    inside = radius <= outer
+    glow = np.zeros((tile_size, tile_size, 4), dtype=np.uint8)
+    glow[inside, :3] = 255
+    glow[inside, 3] = (128 * (1 - ring[inside] / 10)).astype(np.uint8)
+    Image.fromarray(glow, 'RGBA').save('assets/overlays/glow.png')
     
     # Create frost overlay
     frost = Image.new('RGBA', (tile_size, tile_size), (0, 0, 0, 0))
@@ -83,6 +120,7 @@ def create_overlay_textures():
         ]
         draw.polygon(points, fill=(255, 255, 255, 64))
     frost.save('assets/overlays/frost.png')
+    _write_hash('assets/overlays/overlays.hash', digest)
 
 if __name__ == '__main__':
     create_platform_tileset()
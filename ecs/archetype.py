@@ -0,0 +1,176 @@
+"""
+Archetype-grouped structure-of-arrays storage for ECS systems.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from entities import component_id, component_mask
+
+# Array fields stored for each component type
+COMPONENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'Transform': ('tx', 'ty'),
+    'Physics': ('vx', 'vy', 'ax', 'ay'),
+    'Particle': ('pvx', 'pvy', 'lifetime'),
+    # One row per active effect; effect_type holds the StatusEffectType value
+    'StatusEffect': ('duration', 'tick_rate', 'tick_time', 'effect_value', 'effect_type'),
+}
+
+class Archetype:
+    """Dense rows for every entity with exactly the same component set.
+
+    Each field is one contiguous float64 array, so a system updates a
+    whole archetype with a few vectorized operations. Rows stay packed:
+    removing a row moves the last row into its place.
+    """
+
+    def __init__(self, mask: int, components: Iterable[str], capacity: int = 64):
+        """Initialize the archetype.
+
+        Args:
+            mask: Component mask shared by every entity in the archetype
+            components: Component names making up the archetype
+            capacity: Initial number of rows
+        """
+        self.mask = mask
+        self.components = tuple(components)
+        self.fields = tuple(f for name in self.components for f in COMPONENT_FIELDS.get(name, ()))
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.entities: List[Any] = []
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.zeros(self.capacity, dtype=np.float64) for name in self.fields
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Field arrays are exposed as attributes, trimmed to the live rows
+        arrays = self.__dict__.get('_arrays')
+        if arrays is not None and name in arrays:
+            return arrays[name][:self.count]
+        raise AttributeError(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Augmented assignment (arch.vx += ...) writes back through here
+        arrays = self.__dict__.get('_arrays')
+        if arrays is not None and name in arrays:
+            if not (isinstance(value, np.ndarray) and value.base is arrays[name]):
+                arrays[name][:self.count] = value
+            return
+        super().__setattr__(name, value)
+
+    def add(self, entity: Any = None, **values: float) -> int:
+        """Append a row and return its index."""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        for name, array in self._arrays.items():
+            array[row] = values.get(name, 0.0)
+        self.entities.append(entity)
+        self.count += 1
+        return row
+
+    def remove(self, row: int) -> Optional[Any]:
+        """Remove a row by moving the last row into it.
+
+        Returns:
+            The entity whose row moved into the removed slot, if any
+        """
+        last = self.count - 1
+        moved = None
+        if row != last:
+            for array in self._arrays.values():
+                array[row] = array[last]
+            self.entities[row] = moved = self.entities[last]
+        self.entities.pop()
+        self.count = last
+        return moved
+
+    def compress(self, keep: np.ndarray) -> List[Any]:
+        """Keep only the rows where keep is True.
+
+        Returns:
+            List: Entities of the removed rows
+        """
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return []
+        for array in self._arrays.values():
+            array[:kept] = np.compress(keep, array[:n])
+        removed = [e for e, k in zip(self.entities, keep.tolist()) if not k]
+        self.entities = [e for e, k in zip(self.entities, keep.tolist()) if k]
+        self.count = kept
+        return removed
+
+    def _grow(self) -> None:
+        """Double the capacity of every field array."""
+        for name, array in self._arrays.items():
+            self._arrays[name] = np.concatenate((array, np.zeros(self.capacity, dtype=np.float64)))
+        self.capacity *= 2
+
+class World:
+    """Owns the archetypes, keyed by component mask."""
+
+    def __init__(self):
+        """Initialize the world."""
+        self.archetypes: List[Archetype] = []
+        self.archetype_version = 0  # Incremented whenever an archetype is created
+        self._by_mask: Dict[int, Archetype] = {}
+        # Component id -> tracked entities owning that component, kept dense by swap-pop
+        self._by_component: Dict[int, List[Any]] = {}
+
+    def add_entity(self, entity: Any) -> None:
+        """Track an entity in the per-component lists.
+
+        The entity reports later add_component/remove_component calls back
+        to the world until it is removed.
+        """
+        if entity.world is self:
+            return
+        entity.world = self
+        for cid, component in enumerate(entity._component_slots):
+            if component is not None:
+                self._component_added(entity, cid)
+
+    def remove_entity(self, entity: Any) -> None:
+        """Stop tracking an entity."""
+        if entity.world is not self:
+            return
+        for cid in list(entity._idx_by_comp):
+            self._component_removed(entity, cid)
+        entity.world = None
+
+    def entities_with(self, component: Any) -> List[Any]:
+        """Get the tracked entities owning a component (class, name or id)."""
+        return self._by_component.get(component_id(component), [])
+
+    def _component_added(self, entity: Any, cid: int) -> None:
+        entities = self._by_component.setdefault(cid, [])
+        entity._idx_by_comp[cid] = len(entities)
+        entities.append(entity)
+
+    def _component_removed(self, entity: Any, cid: int) -> None:
+        # Swap the last entity into the freed index so the list stays dense
+        entities = self._by_component[cid]
+        index = entity._idx_by_comp.pop(cid)
+        last = entities.pop()
+        if last is not entity:
+            entities[index] = last
+            last._idx_by_comp[cid] = index
+
+    def get_archetype(self, components: Iterable[str]) -> Archetype:
+        """Get the archetype for a component set, creating it on first use."""
+        components = tuple(sorted(components))
+        mask = component_mask(components)
+        archetype = self._by_mask.get(mask)
+        if archetype is None:
+            archetype = self._by_mask[mask] = Archetype(mask, components)
+            self.archetypes.append(archetype)
+            self.archetype_version += 1
+        return archetype
+
+    def spawn(self, components: Iterable[str], entity: Any = None, **values: float) -> Tuple[Archetype, int]:
+        """Add an entity row with the given components and field values."""
+        archetype = self.get_archetype(components)
+        return archetype, archetype.add(entity, **values)
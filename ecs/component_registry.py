@@ -1,5 +1,5 @@
 from typing import Dict, Type, List
-from entities import Component
+from entities import Component, component_bit, component_id, component_mask
 
 class ComponentRegistry:
     """Registry for all component types in the ECS system."""
@@ -10,6 +10,23 @@ class ComponentRegistry:
         'StatusEffect', 'Loot', 'Powerup', 'Physics', 'Collision',
         'Audio', 'Config', 'State', 'PlayerStats'
     ]
+    _ALL_COMPONENTS_SET = frozenset(ALL_COMPONENTS)
+
+    # Integer ids of the core components; entity.get_component(ID) is a list index
+    TRANSFORM = component_id('Transform')
+    SPRITE = component_id('Sprite')
+    UI = component_id('UI')
+    PARTICLE = component_id('Particle')
+    HEALTH = component_id('Health')
+    STATUS_EFFECT = component_id('StatusEffect')
+    LOOT = component_id('Loot')
+    POWERUP = component_id('Powerup')
+    PHYSICS = component_id('Physics')
+    COLLISION = component_id('Collision')
+    AUDIO = component_id('Audio')
+    CONFIG = component_id('Config')
+    STATE = component_id('State')
+    PLAYER_STATS = component_id('PlayerStats')
 
     # Component type mapping
     COMPONENT_TYPES: Dict[str, Type[Component]] = {}
@@ -27,9 +44,24 @@ class ComponentRegistry:
     @classmethod
     def is_valid_component(cls, name: str) -> bool:
         """Check if a component name is valid."""
-        return name in cls.ALL_COMPONENTS
+        return name in cls._ALL_COMPONENTS_SET
 
     @classmethod
     def get_all_component_types(cls) -> List[Type[Component]]:
         """Get all registered component types."""
-        return list(cls.COMPONENT_TYPES.values()) 
\ No newline at end of file
+        return list(cls.COMPONENT_TYPES.values())
+
+    @classmethod
+    def get_component_id(cls, name: str) -> int:
+        """Get the integer id for a component name."""
+        return component_id(name)
+
+    @classmethod
+    def get_component_bit(cls, name: str) -> int:
+        """Get the stable entity mask bit for a component name."""
+        return component_bit(name)
+
+    @classmethod
+    def get_component_mask(cls, names: List[str]) -> int:
+        """Get the combined entity mask bits for several component names."""
+        return component_mask(names)
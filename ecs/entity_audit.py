@@ -2,27 +2,40 @@
 Entity audit utilities for ECS system — now fully decoupled from EntityManager.
 """
 
+import numpy as np
 from components import HealthComponent
+from entities import component_mask
+
+REQUIRED_COMPONENTS = ["TransformComponent", "SpriteComponent"]
 
 def audit_components(entities: list):
     """
     Audit that each entity has required components.
     """
-    for entity in entities:
-        missing = []
-        if not entity.has_component("TransformComponent"):
-            missing.append("TransformComponent")
-        if not entity.has_component("SpriteComponent"):
-            missing.append("SpriteComponent")
-        if missing:
-            print(f"[Audit] Entity {entity.id} missing components: {missing}")
+    if not entities:
+        return
+    required = np.uint64(component_mask(REQUIRED_COMPONENTS))
+    masks = np.fromiter((entity.component_mask for entity in entities), dtype=np.uint64, count=len(entities))
+    for i in np.flatnonzero((masks & required) != required):
+        entity = entities[i]
+        missing = [name for name in REQUIRED_COMPONENTS if not entity.has_component(name)]
+        print(f"[Audit] Entity {entity.id} missing components: {missing}")
 
 def audit_health_states(entities: list):
     """
     Audit that HealthComponents have valid state.
     """
+    audited = []
+    healths = []
     for entity in entities:
         health = entity.get_component(HealthComponent)
         if health:
-            if health.current_health < 0 or health.current_health > health.max_health:
-                print(f"[Audit] Entity {entity.id} has invalid health state: {health.current_health}/{health.max_health}") 
\ No newline at end of file
+            audited.append(entity)
+            healths.append(health)
+    if not healths:
+        return
+    current = np.fromiter((h.current_health for h in healths), dtype=np.float64, count=len(healths))
+    maximum = np.fromiter((h.max_health for h in healths), dtype=np.float64, count=len(healths))
+    for i in np.flatnonzero((current < 0) | (current > maximum)):
+        health = healths[i]
+        print(f"[Audit] Entity {audited[i].id} has invalid health state: {health.current_health}/{health.max_health}")
@@ -0,0 +1,155 @@
+"""
+Structure-of-arrays storage for entity physics properties.
+"""
+from typing import List, Optional
+import numpy as np
+from ecs.transform_store import TransformStore, transform_store
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; step() falls back to NumPy
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _step_kernel(rows, slots, vx, vy, ax, ay, damping, gravity, dt):
+        """Fused gravity, acceleration and friction update of each active row's velocity."""
+        for k in prange(rows.shape[0]):
+            i = rows[k]
+            s = slots[i]
+            vx[s] = (vx[s] + ax[i] * dt) * damping[i]
+            vy[s] = (vy[s] + gravity[i] * dt + ay[i] * dt) * damping[i]
+else:
+    _step_kernel = None
+
+class PhysicsStore:
+    """Contiguous per-entity acceleration, friction and gravity arrays.
+
+    Velocities are not stored here: each row points at its entity's
+    TransformStore slot and step() updates vx/vy there, leaving the move
+    itself to TransformStore.integrate(). PhysicsComponent is a thin view
+    onto one row and one transform slot.
+    """
+
+    def __init__(self, transforms: TransformStore = transform_store, capacity: int = 256):
+        """Initialize the store.
+
+        Args:
+            transforms: Store holding the velocities the rows point at
+            capacity: Initial number of rows
+        """
+        self.transforms = transforms
+        self.capacity = max(1, capacity)
+        self.ax = np.zeros(self.capacity, dtype=np.float64)
+        self.ay = np.zeros(self.capacity, dtype=np.float64)
+        self.friction = np.zeros(self.capacity, dtype=np.float64)
+        self.damping = np.ones(self.capacity, dtype=np.float64)  # 1 - friction, kept by set_friction()
+        self.gravity = np.zeros(self.capacity, dtype=np.float64)
+        self.slot = np.full(self.capacity, -1, dtype=np.int64)  # Transform slot of each row
+        self.active = np.zeros(self.capacity, dtype=np.bool_)  # Live and not kinematic
+
+        self._high_water = 0
+        self._free: List[int] = []  # Dead rows below the high water mark
+        self._rows: Optional[np.ndarray] = None  # Active rows step() changes; None when stale
+
+    def __len__(self) -> int:
+        return self._high_water - len(self._free)
+
+    def alloc(self, slot: int) -> int:
+        """Get a free row moving the given transform slot."""
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._high_water == self.capacity:
+                self._grow()
+            row = self._high_water
+            self._high_water += 1
+        self.slot[row] = slot
+        self.active[row] = True
+        self._rows = None
+        return row
+
+    def free(self, row: int) -> None:
+        """Return a row to the pool."""
+        self.ax[row] = 0.0
+        self.ay[row] = 0.0
+        self.friction[row] = 0.0
+        self.damping[row] = 1.0
+        self.gravity[row] = 0.0
+        self.slot[row] = -1
+        self.active[row] = False
+        self._rows = None
+        self._free.append(row)
+
+    def set_acceleration(self, row: int, ax: float, ay: float) -> None:
+        """Set a row's acceleration."""
+        self.ax[row] = ax
+        self.ay[row] = ay
+        self._rows = None
+
+    def set_gravity(self, row: int, gravity: float) -> None:
+        """Set a row's gravity."""
+        self.gravity[row] = gravity
+        self._rows = None
+
+    def set_friction(self, row: int, friction: float) -> None:
+        """Set a row's friction and the velocity factor step() multiplies by."""
+        self.friction[row] = friction
+        self.damping[row] = 1.0 - friction
+        self._rows = None
+
+    def set_kinematic(self, row: int, kinematic: bool) -> None:
+        """Exclude a row from step(), or include it again."""
+        self.active[row] = not kinematic
+        self._rows = None
+
+    def step(self, dt: float) -> None:
+        """Apply gravity, acceleration and friction to every active velocity.
+
+        The same update the per-entity PhysicsComponent.update() used to
+        run, gathered from and scattered back to the transform store.
+        Rows with no acceleration, gravity or friction, such as bullets,
+        would keep their velocity unchanged and are skipped; writes made
+        directly to the arrays rather than through the setters must be
+        followed by invalidate() for that to stay correct.
+        """
+        rows = self._rows
+        if rows is None:
+            rows = self._rows = self._changing_rows()
+        if rows.size == 0:
+            return
+        if _step_kernel is not None:
+            _step_kernel(rows, self.slot, self.transforms.vx, self.transforms.vy,
+                         self.ax, self.ay, self.damping, self.gravity, float(dt))
+            return
+        slots = self.slot[rows]
+        vx_all = self.transforms.vx
+        vy_all = self.transforms.vy
+        damping = self.damping[rows]
+        vx = vx_all[slots] + self.ax[rows] * dt
+        vy = vy_all[slots] + self.gravity[rows] * dt + self.ay[rows] * dt
+        vx_all[slots] = vx * damping
+        vy_all[slots] = vy * damping
+
+    def invalidate(self) -> None:
+        """Recompute the rows step() visits on its next call."""
+        self._rows = None
+
+    def _changing_rows(self) -> np.ndarray:
+        """Indices of active rows whose velocity step() would change."""
+        n = self._high_water
+        changes = ((self.ax[:n] != 0.0) | (self.ay[:n] != 0.0) |
+                   (self.gravity[:n] != 0.0) | (self.damping[:n] != 1.0))
+        return np.flatnonzero(self.active[:n] & changes)
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+        old = self.capacity
+        self.capacity *= 2
+        for name in ("ax", "ay", "friction", "gravity"):
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros(old, dtype=np.float64))))
+        self.damping = np.concatenate((self.damping, np.ones(old, dtype=np.float64)))
+        self.slot = np.concatenate((self.slot, np.full(old, -1, dtype=np.int64)))
+        self.active = np.concatenate((self.active, np.zeros(old, dtype=np.bool_)))
+
+# Shared store used by all physics components
+physics_store = PhysicsStore()
@@ -1,7 +1,27 @@
 from typing import List, Dict, Type, Optional
 from abc import ABC, abstractmethod
-from entities import Entity, Component
-from component_registry import ComponentRegistry
+import numpy as np
+from entities import Entity, Component, StatusEffect, StatusEffectType
+from ecs.component_registry import ComponentRegistry
+from ecs.archetype import Archetype, World
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; PhysicsSystem falls back to NumPy
+    njit = None
+
+if njit is not None:
+    # Explicit signature compiles at import, so the first frame does not stall
+    @njit("void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8)",
+          parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _phys_kernel(vx, vy, ax, ay, tx, ty, dt):
+        """Fused velocity and position update over one archetype."""
+        for i in prange(vx.shape[0]):
+            vx[i] += ax[i] * dt
+            vy[i] += ay[i] * dt
+            tx[i] += vx[i] * dt
+            ty[i] += vy[i] * dt
+else:
+    _phys_kernel = None
 
 class System(ABC):
     """Base class for all ECS systems."""
@@ -10,19 +30,76 @@ class System(ABC):
         self.required_components: List[str] = []
         self.optional_components: List[str] = []
 
+    @property
+    def required_components(self) -> List[str]:
+        return self._required_components
+
+    @required_components.setter
+    def required_components(self, names: List[str]) -> None:
+        # Keep the archetype mask in step so filtering is one int AND per entity
+        self._required_components = list(names)
+        self.required_ids = [ComponentRegistry.get_component_id(name) for name in self._required_components]
+        self.required_mask = ComponentRegistry.get_component_mask(self._required_components)
+
     @abstractmethod
     def update(self, entities: List[Entity], delta_time: float) -> None:
         """Update all entities in this system."""
         raise NotImplementedError
 
-    def filter_entities(self, entities: List[Entity]) -> List[Entity]:
-        """Filter entities that have all required components."""
-        return [
-            entity for entity in entities
-            if all(entity.has_component(comp) for comp in self.required_components)
-        ]
+    def filter_entities(self, entities) -> List[Entity]:
+        """Filter entities that have all required components.
+
+        Given a World, only the tracked entities owning the rarest required
+        component are tested.
+        """
+        mask = self.required_mask
+        if isinstance(entities, World):
+            world = entities
+            if not self.required_ids:
+                return []
+            entities = min((world.entities_with(cid) for cid in self.required_ids), key=len)
+        return [entity for entity in entities if (entity.component_mask & mask) == mask]
+
+class ArchetypeSystem(System):
+    """Base class for systems that update archetype storage in bulk."""
 
-class ParticleSystem(System):
+    def __init__(self):
+        super().__init__()
+        # Matched archetypes are cached; the world only ever appends archetypes
+        self._matched_archetypes: List[Archetype] = []
+        self._matched_world: Optional[World] = None
+        self._matched_mask = 0
+        self._last_archetype_version = -1
+        self._scanned_archetypes = 0
+
+    @abstractmethod
+    def update(self, world: World, delta_time: float) -> None:
+        """Update every matching archetype in the world."""
+        raise NotImplementedError
+
+    def query(self, world: World) -> List[Archetype]:
+        """Get the archetypes that have all required components.
+
+        Only archetypes created since the last call are tested.
+        """
+        mask = self.required_mask
+        if world is not self._matched_world or mask != self._matched_mask:
+            self._matched_archetypes = []
+            self._matched_world = world
+            self._matched_mask = mask
+            self._last_archetype_version = -1
+            self._scanned_archetypes = 0
+
+        if world.archetype_version != self._last_archetype_version:
+            archetypes = world.archetypes
+            for archetype in archetypes[self._scanned_archetypes:]:
+                if (archetype.mask & mask) == mask:
+                    self._matched_archetypes.append(archetype)
+            self._scanned_archetypes = len(archetypes)
+            self._last_archetype_version = world.archetype_version
+        return self._matched_archetypes
+
+class ParticleSystem(ArchetypeSystem):
     """System for updating particle effects."""
     
     def __init__(self):
@@ -30,26 +107,96 @@ class ParticleSystem(System):
         self.required_components = ['Particle']
         self.optional_components = ['Transform']
 
-    def update(self, entities: List[Entity], delta_time: float) -> None:
-        """Update all particle entities."""
-        for entity in self.filter_entities(entities):
-            particle = entity.get_component('Particle')
-            if not particle:
-                continue
-                
+    def update(self, world: World, delta_time: float) -> None:
+        """Update all particle archetypes."""
+        for archetype in self.query(world):
             # Update particle lifetime
-            particle.lifetime -= delta_time
-            if particle.lifetime <= 0:
-                entity.destroy()
-                continue
+            archetype.lifetime -= delta_time
+            alive = archetype.lifetime > 0
 
             # Update particle position
-            if entity.has_component('Transform'):
-                transform = entity.get_component('Transform')
-                transform.x += particle.velocity[0] * delta_time
-                transform.y += particle.velocity[1] * delta_time
+            if 'Transform' in archetype.components:
+                archetype.tx += archetype.pvx * delta_time
+                archetype.ty += archetype.pvy * delta_time
+
+            # Drop expired particles in one pass
+            for entity in archetype.compress(alive):
+                if entity is not None:
+                    entity.dead = True
+
+# Status effects whose ticks deal their value as damage
+_DAMAGE_EFFECT_TYPES = (float(StatusEffectType.POISON.value), float(StatusEffectType.BURN.value))
+
+class StatusEffectSystem(ArchetypeSystem):
+    """System for ticking status effects.
+
+    Each active effect is one archetype row whose entity is the affected
+    entity, so an entity under several effects owns several rows.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.required_components = ['StatusEffect']
+        self._row_counts: Dict[int, int] = {}  # id(entity) -> rows added through add()
+
+    @staticmethod
+    def apply(world: World, entity: Optional[Entity], effect: StatusEffect) -> None:
+        """Add a row for a status effect on an entity."""
+        world.spawn(['StatusEffect'], entity, duration=effect.duration, tick_rate=effect.tick_rate,
+                    tick_time=effect.time_since_last_tick, effect_value=effect.value,
+                    effect_type=float(effect.type.value))
 
-class PhysicsSystem(System):
+    def add(self, world: World, entity: Entity, effect: StatusEffect) -> None:
+        """Add a row for a status effect on an entity, counting it for remove()."""
+        self.apply(world, entity, effect)
+        key = id(entity)
+        self._row_counts[key] = self._row_counts.get(key, 0) + 1
+
+    def update(self, world: World, delta_time: float) -> None:
+        """Advance every effect's timers, apply damage ticks and drop expired effects."""
+        for archetype in self.query(world):
+            archetype.duration -= delta_time
+            archetype.tick_time += delta_time
+            ticked = archetype.tick_time >= archetype.tick_rate
+            archetype.tick_time[ticked] = 0.0
+
+            # Only the rows dealing damage this frame touch Python objects
+            hits = np.flatnonzero(ticked & np.isin(archetype.effect_type, _DAMAGE_EFFECT_TYPES))
+            if hits.size:
+                entities = archetype.entities
+                values = archetype.effect_value
+                for row in hits.tolist():
+                    entity = entities[row]
+                    health = entity.get_component(ComponentRegistry.HEALTH) if entity is not None else None
+                    if health:
+                        health.take_damage(values.item(row))
+
+            expired = archetype.compress(archetype.duration > 0)
+            counts = self._row_counts
+            for entity in expired:
+                key = id(entity)
+                count = counts.get(key)
+                if count is not None:
+                    if count > 1:
+                        counts[key] = count - 1
+                    else:
+                        del counts[key]
+
+    def remove(self, world: World, entity: Entity) -> None:
+        """Drop every effect row added through add() on an entity, e.g. when it leaves the world.
+
+        Entities without such rows return at once, so despawns cost nothing
+        when no effect is active on them.
+        """
+        if self._row_counts.pop(id(entity), None) is None:
+            return
+        for archetype in self.query(world):
+            if archetype.count:
+                keep = np.fromiter((e is not entity for e in archetype.entities), dtype=np.bool_,
+                                   count=archetype.count)
+                archetype.compress(keep)
+
+class PhysicsSystem(ArchetypeSystem):
     """System for updating physics."""
     
     def __init__(self):
@@ -57,21 +204,21 @@ class PhysicsSystem(System):
         self.required_components = ['Physics', 'Transform']
         self.optional_components = ['Collision']
 
-    def update(self, entities: List[Entity], delta_time: float) -> None:
-        """Update all physics entities."""
-        for entity in self.filter_entities(entities):
-            physics = entity.get_component('Physics')
-            transform = entity.get_component('Transform')
-            if not physics or not transform:
+    def update(self, world: World, delta_time: float) -> None:
+        """Update all physics archetypes."""
+        for archetype in self.query(world):
+            if _phys_kernel is not None:
+                _phys_kernel(archetype.vx, archetype.vy, archetype.ax, archetype.ay,
+                             archetype.tx, archetype.ty, delta_time)
                 continue
 
             # Update velocity
-            physics.velocity_x += physics.acceleration_x * delta_time
-            physics.velocity_y += physics.acceleration_y * delta_time
+            archetype.vx += archetype.ax * delta_time
+            archetype.vy += archetype.ay * delta_time
 
             # Update position
-            transform.x += physics.velocity_x * delta_time
-            transform.y += physics.velocity_y * delta_time
+            archetype.tx += archetype.vx * delta_time
+            archetype.ty += archetype.vy * delta_time
 
 class RenderSystem(System):
     """System for rendering entities."""
@@ -84,18 +231,16 @@ class RenderSystem(System):
     def update(self, entities: List[Entity], delta_time: float) -> None:
         """Render all entities."""
         for entity in self.filter_entities(entities):
-            transform = entity.get_component('Transform')
+            transform = entity.transform
             if not transform:
                 continue
 
             # Render sprite if present
-            if entity.has_component('Sprite'):
-                sprite = entity.get_component('Sprite')
-                if sprite:
-                    sprite.render(transform.x, transform.y)
+            sprite = entity.sprite
+            if sprite:
+                sprite.render(transform.x, transform.y)
 
             # Render UI if present
-            if entity.has_component('UI'):
-                ui = entity.get_component('UI')
-                if ui and ui.visible:
-                    ui.render(transform.x, transform.y) 
\ No newline at end of file
+            ui = entity.ui
+            if ui and ui.visible:
+                ui.render(transform.x, transform.y) 
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Structure-of-arrays storage for entity transforms and velocities.
+"""
+from typing import Any, Dict, List, Tuple
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:  # Optional; integrate() falls back to NumPy
+    njit = None
+
+# Entities per block: 8 float64 values fill one 64-byte cache line
+LANES = 8
+ALIGNMENT = 64
+
+# Rows of the backing buffer, in order
+FIELDS = ("x", "y", "rotation", "scale_x", "scale_y", "vx", "vy", "_tmp")
+_ONES_FIELDS = ("scale_x", "scale_y")
+
+def _aligned_buffer(rows: int, columns: int) -> np.ndarray:
+    """Allocate a zeroed float64 (rows, columns) array starting on a cache line."""
+    nbytes = rows * columns * 8
+    raw = np.zeros(nbytes + ALIGNMENT, dtype=np.uint8)
+    offset = -raw.ctypes.data % ALIGNMENT
+    return raw[offset:offset + nbytes].view(np.float64).reshape(rows, columns)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _integrate_kernel(x, y, vx, vy, dt, n):
+        """Fused x += vx * dt, y += vy * dt in a single pass."""
+        for i in prange(n):
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+else:
+    _integrate_kernel = None
+
+class TransformStore:
+    """Contiguous per-entity position, rotation, scale and velocity arrays.
+
+    Every entity gets one slot; its TransformComponent and VelocityComponent
+    are thin views onto that slot, so the move phase can integrate all
+    entities with a couple of vectorized NumPy operations.
+
+    All field arrays are rows of one cache-line aligned buffer whose
+    capacity is a multiple of LANES, so slot i lives in lane i & 7 of block
+    i >> 3 in every field and sweeps always run over whole blocks.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initialize the store.
+
+        Args:
+            capacity: Initial number of slots
+        """
+        self.capacity = max(LANES, -(-capacity // LANES) * LANES)
+        self._buffer = _aligned_buffer(len(FIELDS), self.capacity)
+        self._bind_fields()
+        self.scale_x[:] = 1.0
+        self.scale_y[:] = 1.0
+        self.alive = np.full(self.capacity, -1, dtype=np.int8)  # 1 = alive, -1 = dead
+
+        self._high_water = 0
+        self._free: List[int] = []  # Dead slots below the high water mark
+        self._refs: List[int] = []  # Number of live components per slot
+        self._slot_keys: List[Any] = []  # Entity key owning each slot
+        self._entity_slots: Dict[int, int] = {}  # id(entity) -> slot
+
+    def __len__(self) -> int:
+        return self._high_water - len(self._free)
+
+    @staticmethod
+    def block_of(slot: int) -> Tuple[int, int]:
+        """Get the (block, lane) position of a slot."""
+        return slot >> 3, slot & (LANES - 1)
+
+    def acquire(self, entity: Any) -> int:
+        """Get the slot for an entity, allocating one on first use.
+
+        Components of the same entity share a slot. Components without an
+        entity get a private slot.
+        """
+        key = None if entity is None else id(entity)
+        if key is not None:
+            slot = self._entity_slots.get(key)
+            if slot is not None:
+                self._refs[slot] += 1
+                return slot
+
+        slot = self.alloc()
+        self._refs[slot] = 1
+        self._slot_keys[slot] = key
+        if key is not None:
+            self._entity_slots[key] = slot
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Drop one component reference to a slot, freeing it at zero."""
+        self._refs[slot] -= 1
+        if self._refs[slot] > 0:
+            return
+
+        key = self._slot_keys[slot]
+        if key is not None and self._entity_slots.get(key) == slot:
+            del self._entity_slots[key]
+        self._slot_keys[slot] = None
+        self.free(slot)
+
+    def alloc(self) -> int:
+        """Get a free slot, reusing dead slots before growing the live region."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._high_water == self.capacity:
+                self._grow()
+            slot = self._high_water
+            self._high_water += 1
+            self._refs.append(0)
+            self._slot_keys.append(None)
+        self.alive[slot] = 1
+        return slot
+
+    def free(self, slot: int) -> None:
+        """Return a slot to the pool.
+
+        The row is reset to defaults so it is a no-op for integrate() while
+        it sits in the dead region.
+        """
+        self.x[slot] = 0.0
+        self.y[slot] = 0.0
+        self.rotation[slot] = 0.0
+        self.scale_x[slot] = 1.0
+        self.scale_y[slot] = 1.0
+        self.vx[slot] = 0.0
+        self.vy[slot] = 0.0
+        self.alive[slot] = -1
+        self._refs[slot] = 0
+        self._free.append(slot)
+
+    def integrate(self, dt: float) -> None:
+        """Advance every position by its velocity.
+
+        Dead rows inside the live region have zero velocity, so the sweep
+        runs over [:high_water] without masking.
+        """
+        n = self._high_water
+        if n == 0:
+            return
+        # Round up to whole blocks; unused lanes past high water have zero velocity
+        n = -(-n // LANES) * LANES
+        if _integrate_kernel is not None:
+            _integrate_kernel(self.x, self.y, self.vx, self.vy, dt, n)
+            return
+        tmp = self._tmp[:n]
+        np.multiply(self.vx[:n], dt, out=tmp)
+        np.add(self.x[:n], tmp, out=self.x[:n])
+        np.multiply(self.vy[:n], dt, out=tmp)
+        np.add(self.y[:n], tmp, out=self.y[:n])
+
+    def _bind_fields(self) -> None:
+        """Point each field attribute at its row of the backing buffer."""
+        for row, name in enumerate(FIELDS):
+            setattr(self, name, self._buffer[row])
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+        old = self.capacity
+        self.capacity *= 2
+        buffer = _aligned_buffer(len(FIELDS), self.capacity)
+        buffer[:, :old] = self._buffer
+        self._buffer = buffer
+        self._bind_fields()
+        for name in _ONES_FIELDS:
+            getattr(self, name)[old:] = 1.0
+        self.alive = np.concatenate((self.alive, np.full(old, -1, dtype=np.int8)))
+
+# Shared store used by all transform and velocity components
+transform_store = TransformStore()
@@ -0,0 +1,72 @@
+"""
+Packed flag storage for zone components.
+"""
+from typing import List, Optional
+import numpy as np
+
+# Flag bits
+ZONE_ACTIVE = 0b01
+ZONE_TRIGGERED = 0b10
+
+class ZoneStore:
+    """One uint8 flag byte per zone component.
+
+    Bit 0 is "active" and bit 1 is "triggered", so zone systems can find
+    every active, untriggered zone with a single vectorized mask instead
+    of two attribute loads and branches per zone.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """Initialize the store.
+
+        Args:
+            capacity: Initial number of slots
+        """
+        self.capacity = capacity
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.zone_ids: List[Optional[str]] = []
+
+        self._high_water = 0
+        self._free: List[int] = []  # Dead slots below the high water mark
+
+    def __len__(self) -> int:
+        return self._high_water - len(self._free)
+
+    def alloc(self, zone_id: Optional[str] = None) -> int:
+        """Get a free slot, reusing dead slots before growing."""
+        if self._free:
+            slot = self._free.pop()
+            self.zone_ids[slot] = zone_id
+        else:
+            if self._high_water == self.capacity:
+                self._grow()
+            slot = self._high_water
+            self._high_water += 1
+            self.zone_ids.append(zone_id)
+        self.flags[slot] = 0
+        return slot
+
+    def free(self, slot: int) -> None:
+        """Return a slot to the pool. Cleared flags keep it out of every mask."""
+        self.flags[slot] = 0
+        self.zone_ids[slot] = None
+        self._free.append(slot)
+
+    def get_pending_slots(self) -> np.ndarray:
+        """Get the slots of all zones that are active and not yet triggered."""
+        flags = self.flags[:self._high_water]
+        return np.flatnonzero((flags & (ZONE_ACTIVE | ZONE_TRIGGERED)) == ZONE_ACTIVE)
+
+    def get_pending_zone_ids(self) -> List[Optional[str]]:
+        """Get the zone ids of all zones that are active and not yet triggered."""
+        zone_ids = self.zone_ids
+        return [zone_ids[slot] for slot in self.get_pending_slots().tolist()]
+
+    def _grow(self) -> None:
+        """Double the capacity of the flag array."""
+        extra = max(1, self.capacity)
+        self.flags = np.concatenate((self.flags, np.zeros(extra, dtype=np.uint8)))
+        self.capacity += extra
+
+# Shared store used by all zone components
+zone_store = ZoneStore()
@@ -2,12 +2,13 @@
 Enemy management module.
 """
 import pygame
-import math
+import numpy as np
 import random
 import os
+from bisect import bisect
 from sprite_animator import SpriteAnimator
 from player import Player
-from typing import Tuple, List, Optional, Dict, Any
+from typing import Tuple, List, Optional, Dict, Any, Sequence
 from config import (
     ENEMY_BASE_HEALTH, ENEMY_BASE_DAMAGE, ENEMY_BASE_SPEED,
     ENEMY_SPAWN_RATE, RED, ENEMY_BULLET_DAMAGE, ENEMY_SHOOT_DELAY,
@@ -19,25 +20,106 @@ from world_manager import WorldManager
 from entities import Entity, EntityType
 from enemy_ai import EnemyBehavior, EnemyState
 from status_effects import create_poison_effect, create_burn_effect, create_slow_effect
+from systems.spatial_grid import SpatialGrid
+from systems.tile_collision import TILE_SIZE, resolve_tiles
+from systems.platform_collision import HIT_NAMES, resolve_platform_rect, resolve_platforms
 import traceback
 
+# Maximum number of released enemies kept for reuse
+ENEMY_POOL_LIMIT = 64
+
+# Largest downward velocity gravity accelerates an enemy to
+ENEMY_MAX_FALL_SPEED = 15
+
+# Shared empty platform list for enemies without a world
+EMPTY_TUPLE = ()
+
+# Health bar height and how far above the enemy it is drawn, in pixels
+HEALTH_BAR_HEIGHT = 5
+HEALTH_BAR_OFFSET = 10
+
+# Maximum number of rendered debug labels kept between frames
+DEBUG_TEXT_CACHE_SIZE = 64
+
+# Spawn angles are drawn from a table of evenly spaced directions
+ANGLE_BITS = 10
+ANGLE_STEPS = 1 << ANGLE_BITS
+_ANGLES = np.linspace(0, 2 * np.pi, ANGLE_STEPS, endpoint=False)
+_COS = np.cos(_ANGLES)
+_SIN = np.sin(_ANGLES)
+_COS_LIST = _COS.tolist()  # Plain floats for single lookups
+_SIN_LIST = _SIN.tolist()
+
+def _batched_stat(name: str) -> property:
+    """Property for a stat EnemyManager copies into its arrays; writes bump Enemy.stats_version."""
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        Enemy.stats_version += 1
+
+    return property(fget, fset)
+
 class Enemy(Entity):
     _next_id = 0  # Class variable to track next available ID
+    stats_version = 0  # Bumped whenever any enemy's batched stats change
+    _debug_font: Optional[pygame.font.Font] = None  # Shared by all enemies, created on first use
+    _text_cache: Dict[str, pygame.Surface] = {}  # Rendered debug labels, oldest first
+    _range_surfaces: Dict[int, pygame.Surface] = {}  # Detection range outlines by radius
+    _bar_surfaces: Dict[int, pygame.Surface] = {}  # Solid health bars by width in pixels
+    # Per-type (health, speed, bullet damage, shoot delay); unknown types use 'basic'
+    _TEMPLATES: Dict[str, Tuple[float, float, float, float]] = {
+        'basic': (ENEMY_HEALTH, ENEMY_SPEED, ENEMY_BULLET_DAMAGE, ENEMY_SHOOT_DELAY),
+        'fast': (ENEMY_HEALTH * 0.7, ENEMY_SPEED * 1.5, ENEMY_BULLET_DAMAGE * 0.7, ENEMY_SHOOT_DELAY * 0.7),
+        'tank': (ENEMY_HEALTH * 2, ENEMY_SPEED * 0.7, ENEMY_BULLET_DAMAGE * 1.5, ENEMY_SHOOT_DELAY * 1.5),
+    }
     
     def __init__(self, x: int, y: int, enemy_type: str, biome: str):
         super().__init__(EntityType.ENEMY, x, y, 32, 32)
+        self._index = -1  # Position in EnemyManager.enemies
+        # Collaborators, set through the set_* methods
+        self.world_manager = None
+        self.player = None
+        self.bullet_manager = None
+        self.entity_manager = None
+        self.batched_update = False  # Set while EnemyManager's array passes update this enemy
+        self._reset_state(enemy_type, biome)
+        
+        # Initialize behavior
+        self.behavior = EnemyBehavior(
+            detection_range=200,
+            attack_range=50,
+            flee_health_threshold=self.flee_health_threshold,
+            patrol_points=[],
+            attack_cooldown=1.0,
+            movement_speed=100,
+            attack_damage=self.damage
+        )
+        
+        # Set up event handlers
+        self.add_event_handler("death", self._on_death)
+        self.add_event_handler("damage", self._on_damage)
+        
+        logger.info(f"Enemy {self.id} created at ({x}, {y})")
+
+    def _reset_state(self, enemy_type: str, biome: str):
+        """Assign a new id and reset all per-spawn state."""
         self.id = Enemy._next_id
         Enemy._next_id += 1
         
         # Enemy-specific properties
         self.enemy_type = enemy_type
         self.biome = biome
-        self.health = ENEMY_HEALTH
-        self.max_health = ENEMY_HEALTH
-        self.speed = ENEMY_SPEED
-        self.damage = ENEMY_BULLET_DAMAGE
+        health, self.speed, self.damage, self.attack_delay = Enemy._TEMPLATES.get(
+            enemy_type, Enemy._TEMPLATES['basic']
+        )
+        self.health = health
+        self.flee_health_threshold = 0.3  # Fraction of max health below which the enemy flees
+        self.max_health = health
         self.contact_damage = 1  # Damage dealt on contact with player
-        self.attack_delay = ENEMY_SHOOT_DELAY
         self.attack_cooldown = 0
         self.detection_range = 200
         self.gravity = 0.5
@@ -50,23 +132,47 @@ class Enemy(Entity):
         self.patrol_speed = 2
         self.patrol_wait_time = 0
         self.patrol_wait_duration = 60  # Frames to wait at patrol point
-        
-        # Initialize behavior
-        self.behavior = EnemyBehavior(
-            detection_range=200,
-            attack_range=50,
-            flee_health_threshold=0.3,
-            patrol_points=[],
-            attack_cooldown=1.0,
-            movement_speed=100,
-            attack_damage=self.damage
-        )
-        
-        # Set up event handlers
-        self.add_event_handler("death", self._on_death)
-        self.add_event_handler("damage", self._on_damage)
-        
-        logger.info(f"Enemy {self.id} created at ({x}, {y})")
+
+    @property
+    def max_health(self) -> float:
+        return self._max_health
+
+    @max_health.setter
+    def max_health(self, value: float) -> None:
+        # Cache the values draw() and _on_damage() derive from max health
+        self._max_health = value
+        self._inv_max_hp = 1.0 / value if value else 0.0
+        self._flee_hp = value * self.flee_health_threshold if value else 0.0
+        Enemy.stats_version += 1
+
+    @property
+    def flee_health_threshold(self) -> float:
+        return self._flee_health_threshold
+
+    @flee_health_threshold.setter
+    def flee_health_threshold(self, value: float) -> None:
+        self._flee_health_threshold = value
+        max_health = getattr(self, '_max_health', 0)
+        self._flee_hp = max_health * value if max_health else 0.0
+        Enemy.stats_version += 1
+
+    speed = _batched_stat('speed')
+    detection_range = _batched_stat('detection_range')
+    gravity = _batched_stat('gravity')
+
+    def _reinit(self, x: int, y: int, enemy_type: str, biome: str):
+        """Reinitialize a pooled enemy for a new spawn.
+
+        The behavior object and event handlers are kept from the first spawn.
+        """
+        self._reset_state(enemy_type, biome)
+        self.rect.x = x
+        self.rect.y = y
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.dead = False
+        self.status_effects.clear()
+        self.behavior.patrol_points = []
         
     def _generate_patrol_points(self):
         """Generate patrol points around the enemy's initial position."""
@@ -83,9 +189,19 @@ class Enemy(Entity):
         ]
         
     def update(self, dt):
-        """Update enemy state."""
+        """Update enemy state.
+
+        Enemies owned by an EnemyManager are moved, collided, kept in bounds
+        and fire from its array passes instead.
+        """
+        if self.batched_update:
+            return
+
         # Get platforms from world manager
-        platforms = self.world_manager.get_platforms() if hasattr(self, 'world_manager') else []
+        if self.world_manager is not None:
+            platforms = self.world_manager.get_platform_rects()
+        else:
+            platforms = EMPTY_TUPLE
         
         # Update position
         self.move(self.velocity_x, self.velocity_y)
@@ -93,9 +209,6 @@ class Enemy(Entity):
         # Keep in bounds
         self._handle_screen_bounds()
         
-        # Check platform collisions
-        self._handle_platform_collisions(platforms)
-        
         # Attack if cooldown is ready
         if self.attack_cooldown <= 0:
             self._attack()
@@ -103,89 +216,49 @@ class Enemy(Entity):
         else:
             self.attack_cooldown -= 1
         
-        # Apply gravity
-        self.apply_gravity()
-        
-        # Platform collisions
-        self.on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                # Calculate overlap
-                dx = min(self.rect.right - platform.rect.left, platform.rect.right - self.rect.left)
-                dy = min(self.rect.bottom - platform.rect.top, platform.rect.bottom - self.rect.top)
-                
-                # Resolve collision based on smallest overlap
-                if dx < dy:
-                    # Horizontal collision
-                    if self.rect.centerx < platform.rect.centerx:
-                        self.rect.right = platform.rect.left
-                    else:
-                        self.rect.left = platform.rect.right
-                    self.last_collision = 'horizontal'
-                else:
-                    # Vertical collision
-                    if self.rect.centery < platform.rect.centery:
-                        self.rect.bottom = platform.rect.top
-                        self.velocity_y = 0
-                        self.on_ground = True
-                        self.last_collision = 'vertical_bottom'
-                    else:
-                        self.rect.top = platform.rect.bottom
-                        self.velocity_y = 0
-                        self.last_collision = 'vertical_top'
-                self.collision_count += 1
+        # Apply gravity, then resolve platform collisions once with the post-gravity velocity
+        self._resolve_platforms(platforms)
                     
     def _handle_screen_bounds(self):
-        """Handle enemy collision with screen boundaries."""
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.velocity_x *= -1
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
+        """Handle enemy collision with screen boundaries.
+
+        Position is clamped with min/max; velocity is reflected on the axes
+        the clamp actually moved.
+        """
+        rect = self.rect
+        x = max(0, min(rect.x, SCREEN_WIDTH - rect.width))
+        y = max(0, min(rect.y, SCREEN_HEIGHT - rect.height))
+        if x != rect.x:
+            rect.x = x
             self.velocity_x *= -1
-        if self.rect.top < 0:
-            self.rect.top = 0
-            self.velocity_y *= -1
-        if self.rect.bottom > SCREEN_HEIGHT:
-            self.rect.bottom = SCREEN_HEIGHT
+        if y != rect.y:
+            rect.y = y
             self.velocity_y *= -1
             
-    def _handle_platform_collisions(self, platforms):
-        """Handle collisions with platforms."""
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                # Calculate overlap
-                dx = min(self.rect.right - platform.rect.left, platform.rect.right - self.rect.left)
-                dy = min(self.rect.bottom - platform.rect.top, platform.rect.bottom - self.rect.top)
-                
-                # Resolve collision based on smallest overlap
-                if dx < dy:
-                    # Horizontal collision
-                    if self.rect.centerx < platform.rect.centerx:
-                        self.rect.right = platform.rect.left
-                    else:
-                        self.rect.left = platform.rect.right
-                    self.velocity_x *= -1
-                else:
-                    # Vertical collision
-                    if self.rect.centery < platform.rect.centery:
-                        self.rect.bottom = platform.rect.top
-                    else:
-                        self.rect.top = platform.rect.bottom
-                    self.velocity_y *= -1
+    def _resolve_platforms(self, platforms: Sequence[pygame.Rect]):
+        """Apply gravity and resolve collisions with platforms.
+        
+        Horizontal hits turn the enemy around; vertical hits stop it and
+        landing on top of a platform sets on_ground.
+        """
+        self.velocity_x, self.velocity_y, self.on_ground, hit, count = resolve_platform_rect(
+            self.rect, self.velocity_x, self.velocity_y, self.gravity, ENEMY_MAX_FALL_SPEED, platforms
+        )
+        if hit:
+            self.last_collision = HIT_NAMES[hit]
+            self.collision_count += count
                     
     def _attack(self):
         """Attack the player if in range."""
-        if not hasattr(self, 'player') or not hasattr(self, 'bullet_manager'):
+        if self.player is None or self.bullet_manager is None:
             return
             
         # Calculate distance to player
         dx = self.player.rect.centerx - self.rect.centerx
         dy = self.player.rect.centery - self.rect.centery
-        distance = (dx ** 2 + dy ** 2) ** 0.5
         
         # Only attack if in range
-        if distance <= self.detection_range:
+        if dx * dx + dy * dy <= self.detection_range * self.detection_range:
             self.bullet_manager.create_bullet(
                 self.rect.centerx,
                 self.rect.centery,
@@ -214,20 +287,66 @@ class Enemy(Entity):
         pygame.draw.rect(screen, (255, 0, 0), self.rect)
         
         # Draw health bar
-        health_width = (self.health / self.max_health) * self.rect.width
-        pygame.draw.rect(screen, (0, 255, 0), 
-                        (self.rect.x, self.rect.y - 10, health_width, 5))
+        bar = self._health_bar_blit()
+        if bar is not None:
+            screen.blit(*bar)
         
         # Draw detection range (for debugging)
-        pygame.draw.circle(screen, (255, 255, 255), 
-                         self.rect.center, self.detection_range, 1)
+        screen.blit(*self._range_blit())
         
         # Draw debug info
         if self.last_collision:
-            font = pygame.font.Font(None, 20)
-            debug_text = f"ID: {self.id} | Collision: {self.last_collision} | Count: {self.collision_count}"
-            text_surface = font.render(debug_text, True, (255, 255, 255))
-            screen.blit(text_surface, (self.rect.x, self.rect.y - 20))
+            self._draw_debug_text(screen)
+
+    def _health_bar_blit(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the health bar and where to blit it, or None when it is empty."""
+        width = int(self.health * self._inv_max_hp * self.rect.width)
+        if width <= 0:
+            return None
+        surface = Enemy._bar_surfaces.get(width)
+        if surface is None:
+            # Opaque, so blitting it gives the same pixels as filling the bar rect
+            surface = pygame.Surface((width, HEALTH_BAR_HEIGHT))
+            surface.fill((0, 255, 0))
+            Enemy._bar_surfaces[width] = surface
+        return surface, (self.rect.x, self.rect.y - HEALTH_BAR_OFFSET)
+
+    def _range_blit(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the detection range outline and where to blit it."""
+        radius = self.detection_range
+        surface = Enemy._range_surfaces.get(radius)
+        if surface is None:
+            # Same pixels as pygame.draw.circle(..., radius, 1), rasterized once
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (255, 255, 255), (radius, radius), radius, 1)
+            Enemy._range_surfaces[radius] = surface
+        center_x, center_y = self.rect.center
+        return surface, (center_x - radius, center_y - radius)
+
+    def _draw_debug_text(self, screen):
+        """Draw the collision debug label above the enemy."""
+        debug_text = f"ID: {self.id} | Collision: {self.last_collision} | Count: {self.collision_count}"
+        text_surface = Enemy._text_cache.get(debug_text) or Enemy._render_text(debug_text)
+        screen.blit(text_surface, (self.rect.x, self.rect.y - 20))
+
+    @classmethod
+    def _get_font(cls) -> pygame.font.Font:
+        """Get the shared debug font, creating it on first use."""
+        if cls._debug_font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            cls._debug_font = pygame.font.Font(None, 20)
+        return cls._debug_font
+
+    @classmethod
+    def _render_text(cls, text: str) -> pygame.Surface:
+        """Render a debug label and cache it, evicting the oldest label when full."""
+        surface = cls._get_font().render(text, True, (255, 255, 255))
+        cache = cls._text_cache
+        if len(cache) >= DEBUG_TEXT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[text] = surface
+        return surface
 
     def _on_death(self) -> None:
         """Handle enemy death."""
@@ -236,7 +355,7 @@ class Enemy(Entity):
     def _on_damage(self, amount: int) -> None:
         """Handle taking damage."""
         # Check if we should flee
-        if self.health and self.health <= self.max_health * self.behavior.flee_health_threshold:
+        if self.health and self.health <= self._flee_hp:
             self.behavior.state = EnemyState.FLEE
             
     def drop_loot(self) -> None:
@@ -272,6 +391,14 @@ class Enemy(Entity):
         self.behavior.patrol_points = points
         self.current_patrol_index = 0
 
+    def kill(self) -> None:
+        """Remove the enemy from play, like pygame.sprite.Sprite.kill().
+
+        The owning EnemyManager releases dead enemies at the end of its
+        update, so its list is never modified while it is being iterated.
+        """
+        self.dead = True
+
     def stun(self, duration: float) -> None:
         """Stun the enemy for a duration."""
         self.behavior.stun(duration, self.current_time)
@@ -326,41 +453,59 @@ class Enemy(Entity):
         return enemy
 
 class EnemyManager:
+    # Wave enemy types with cumulative spawn weights, so picking one is a single bisect
+    _WAVE_TYPES = ('basic', 'fast', 'tank')
+    _CUM_EARLY = (0.6, 0.9, 1.0)  # 60% basic, 30% fast, 10% tank
+    _CUM_LATE = (0.4, 0.8, 1.0)  # More fast enemies and tanks
+
     def __init__(self, screen_width: int, screen_height: int):
-        self.enemies = pygame.sprite.Group()
+        self.enemies: List[Enemy] = []  # Dense; each enemy's _index is its position
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.wave_number = 1
         self.enemies_remaining = 5
         self.max_enemies_on_screen = 3
-        self.spawn_timer = 0
         self.spawn_delay = 120
         self.boss_wave_interval = 5
         self.spawn_radius = 100
-        self.wave_timer = 0
         self.wave_delay = 180
+        # Timers are absolute frame numbers, so a frame without an event is one compare each
+        self._frame = 0
+        self._next_spawn = self.spawn_delay
+        self._next_wave = self.wave_delay
         self.enemies_per_wave = ENEMY_SPAWN_RATE
         self.difficulty_scaling = 1.0
+        # Broad-phase grid of enemies, rebuilt every frame
+        self.enemy_grid = SpatialGrid(cell=64)
+        self._indexed_zones = None
+        # Tile top-left corners as int32 (N, 2) arrays, per zone and for all active zones
+        self._zone_tiles: Dict[Any, np.ndarray] = {}
+        self._tile_xy = np.empty((0, 2), dtype=np.int32)
+        # Platform (left, top, right, bottom) rows of all active zones, for the batched collision pass
+        self._platform_xyxy = np.empty((0, 4), dtype=np.int32)
+        self._pool: List[Enemy] = []  # Released enemies kept for reuse
+        # Per-enemy state for the vectorized move, bounds and attack passes.
+        # xs/ys keep sub-pixel positions between frames; rects get the truncated value.
+        self._array_enemies: List[Enemy] = []  # Enemy at each array index
+        # Bumped whenever enemies are added or released; stats are regathered when it
+        # or Enemy.stats_version changes
+        self._layout_version = 0
+        self._stats_key = None
+        self.xs = np.empty(0, dtype=np.float64)
+        self.ys = np.empty(0, dtype=np.float64)
+        self.vx = np.empty(0, dtype=np.float64)
+        self.vy = np.empty(0, dtype=np.float64)
+        self.widths = np.empty(0, dtype=np.float64)
+        self.heights = np.empty(0, dtype=np.float64)
+        self.speeds = np.empty(0, dtype=np.float64)
+        self.ranges = np.empty(0, dtype=np.float64)
+        self.healths = np.empty(0, dtype=np.float64)
+        self.flee_healths = np.empty(0, dtype=np.float64)
+        self.gravities = np.empty(0, dtype=np.float64)
         logger.info("Enemy manager initialized")
         self.enemy_types = {
-            "basic": {
-                "health": ENEMY_HEALTH,
-                "speed": ENEMY_SPEED,
-                "bullet_damage": ENEMY_BULLET_DAMAGE,
-                "shoot_delay": ENEMY_SHOOT_DELAY
-            },
-            "fast": {
-                "health": ENEMY_HEALTH * 0.7,
-                "speed": ENEMY_SPEED * 1.5,
-                "bullet_damage": ENEMY_BULLET_DAMAGE * 0.7,
-                "shoot_delay": ENEMY_SHOOT_DELAY * 0.7
-            },
-            "tank": {
-                "health": ENEMY_HEALTH * 2,
-                "speed": ENEMY_SPEED * 0.7,
-                "bullet_damage": ENEMY_BULLET_DAMAGE * 1.5,
-                "shoot_delay": ENEMY_SHOOT_DELAY * 1.5
-            }
+            name: {"health": health, "speed": speed, "bullet_damage": damage, "shoot_delay": delay}
+            for name, (health, speed, damage, delay) in Enemy._TEMPLATES.items()
         }
 
     def create_enemy(self, pos, enemy_type, wave_number):
@@ -368,10 +513,50 @@ class EnemyManager:
         if len(self.enemies) >= self.max_enemies_on_screen:
             return None
             
-        enemy = Enemy(pos[0], pos[1], enemy_type, "")
-        self.enemies.add(enemy)
+        enemy = self._acquire_enemy(pos[0], pos[1], enemy_type, "")
+        self._add_enemy(enemy)
         return enemy
 
+    def _acquire_enemy(self, x: int, y: int, enemy_type: str, biome: str) -> Enemy:
+        """Get an enemy, reusing a released one if available."""
+        if self._pool:
+            enemy = self._pool.pop()
+            enemy._reinit(x, y, enemy_type, biome)
+            return enemy
+        return Enemy(x, y, enemy_type, biome)
+
+    def release_enemy(self, enemy: Enemy):
+        """Remove an enemy and keep it for reuse."""
+        # Swap the last enemy into the freed position so the list stays dense
+        index = enemy._index
+        last = self.enemies.pop()
+        if last is not enemy:
+            self.enemies[index] = last
+            last._index = index
+        enemy._index = -1
+        self._layout_version += 1
+        self.enemy_grid.remove(enemy, enemy.rect)
+        if len(self._pool) < ENEMY_POOL_LIMIT:
+            self._pool.append(enemy)
+
+    def _release_all(self):
+        """Remove every enemy, keeping them for reuse."""
+        for enemy in self.enemies:
+            enemy._index = -1
+            if len(self._pool) < ENEMY_POOL_LIMIT:
+                self._pool.append(enemy)
+        self.enemies.clear()
+        self._layout_version += 1
+        self.enemy_grid.clear()
+
+    def _add_enemy(self, enemy: Enemy):
+        """Add an enemy to the list and the broad-phase grid."""
+        enemy.batched_update = True
+        enemy._index = len(self.enemies)
+        self.enemies.append(enemy)
+        self._layout_version += 1
+        self.enemy_grid.insert(enemy, enemy.rect)
+
     def _select_enemy_type(self):
         """Select enemy type based on wave number."""
         if self.wave_number % self.boss_wave_interval == 0:
@@ -381,15 +566,9 @@ class EnemyManager:
         if self.wave_number <= 3:
             return 'basic'
         
-        # Add more variety in later waves
-        enemy_types = ['basic', 'fast', 'tank']
-        weights = [0.6, 0.3, 0.1]  # 60% basic, 30% fast, 10% tank
-        
-        # Adjust weights based on wave number
-        if self.wave_number > 5:
-            weights = [0.4, 0.4, 0.2]  # More fast enemies and tanks
-        
-        return random.choices(enemy_types, weights=weights)[0]
+        # Add more variety in later waves, weighted further toward fast enemies and tanks after wave 5
+        cum = self._CUM_LATE if self.wave_number > 5 else self._CUM_EARLY
+        return self._WAVE_TYPES[bisect(cum, random.random())]
 
     def _get_spawn_position(self, player, screen_width, screen_height):
         """Get a valid spawn position for an enemy."""
@@ -399,73 +578,323 @@ class EnemyManager:
             y = random.randint(0, screen_height - 30)
             return (x, y)
 
-        # Try to find a position outside the player's view
-        for _ in range(10):  # Try up to 10 times
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(self.spawn_radius, self.spawn_radius * 2)
-            x = player.rect.centerx + math.cos(angle) * distance
-            y = player.rect.centery + math.sin(angle) * distance
-            # Ensure position is within screen bounds
-            x = max(0, min(x, screen_width - 30))
-            y = max(0, min(y, screen_height - 30))
-            # Check if position is far enough from other enemies
-            too_close = False
-            for enemy in self.enemies:
-                dx = enemy.rect.centerx - x
-                dy = enemy.rect.centery - y
-                if math.sqrt(dx * dx + dy * dy) < 100:  # Increased minimum distance
-                    too_close = True
-                    break
-            if not too_close:
-                return (x, y)
+        # Try to find a position outside the player's view; all 10 tries are sampled at once
+        tries = 10
+        idxs = np.random.randint(0, ANGLE_STEPS, tries)
+        distances = np.random.uniform(self.spawn_radius, self.spawn_radius * 2, tries)
+        # Ensure positions are within screen bounds
+        xs = np.clip(player.rect.centerx + _COS[idxs] * distances, 0, screen_width - 30)
+        ys = np.clip(player.rect.centery + _SIN[idxs] * distances, 0, screen_height - 30)
+
+        # Every enemy that could be within 100 of some candidate, from one grid query
+        min_distance = 100
+        x0 = int(xs.min()) - min_distance
+        y0 = int(ys.min()) - min_distance
+        area = pygame.Rect(x0, y0, int(xs.max()) - x0 + min_distance + 1, int(ys.max()) - y0 + min_distance + 1)
+        nearby = self.enemy_grid.query(area)
+        if not nearby:
+            return (float(xs[0]), float(ys[0]))
+
+        # Squared distance from every candidate to every nearby enemy center in one broadcast
+        cx = np.fromiter((e.rect.centerx for e in nearby), dtype=np.float64, count=len(nearby))
+        cy = np.fromiter((e.rect.centery for e in nearby), dtype=np.float64, count=len(nearby))
+        dx = cx[None, :] - xs[:, None]
+        dy = cy[None, :] - ys[:, None]
+        too_close = (dx * dx + dy * dy < min_distance * min_distance).any(axis=1)
+        free = np.flatnonzero(~too_close)
+        if free.size:
+            return (float(xs[free[0]]), float(ys[free[0]]))
         return None  # No valid position found
 
     def _spawn_enemy(self, player_position, screen_width, screen_height):
         # Unpack player position tuple
         player_x, player_y = player_position
-        angle = random.uniform(0, 2 * math.pi)
+        idx = random.getrandbits(ANGLE_BITS)
         distance = 300
-        x = player_x + math.cos(angle) * distance
-        y = player_y + math.sin(angle) * distance
+        x = player_x + _COS_LIST[idx] * distance
+        y = player_y + _SIN_LIST[idx] * distance
         enemy_type = random.choice(self.enemy_types)
         biome = "forest"
         print(f"[ENEMY SPAWN] Spawning {enemy_type} at ({x}, {y})")
-        enemy = Enemy(x, y, enemy_type, biome)
-        self.enemies.add(enemy)
+        enemy = self._acquire_enemy(x, y, enemy_type, biome)
+        self._add_enemy(enemy)
 
     def update(self, player_rect, world_manager, bullet_manager, screen_width, screen_height):
         """Update all enemies."""
-        # Update wave timer
-        self.wave_timer += 1
-        if self.wave_timer >= self.wave_delay:
-            self.wave_timer = 0
+        self._frame += 1
+        frame = self._frame
+
+        # Next wave
+        if frame >= self._next_wave:
+            self._next_wave = frame + self.wave_delay
             self.wave_number += 1
             self.enemies_remaining = self.enemies_per_wave
             self.difficulty_scaling += 0.1
         
-        # Update spawn timer
-        self.spawn_timer += 1
-        if self.spawn_timer >= self.spawn_delay:
-            self.spawn_timer = 0
-            if self.enemies_remaining > 0:
+        # Next spawn; the delay only runs while the wave has enemies left and there is room on screen
+        if self.enemies_remaining > 0 and len(self.enemies) < self.max_enemies_on_screen:
+            if frame >= self._next_spawn:
+                self._next_spawn = frame + self.spawn_delay
                 self._spawn_enemy(self.player_rect.center, screen_width, screen_height)
+        else:
+            self._next_spawn = frame + self.spawn_delay
         
-        # Update all enemies
+        self._index_world(world_manager)
+
+        # Move every enemy, then apply gravity and resolve platform collisions for all of them
+        enemies = self.enemies
+        self._sync_arrays(enemies)
+        self._chase_player(enemies, player_rect)
+        self._integrate(enemies)
+        self._resolve_platforms(enemies)
+
+        # Dead enemies go back to the pool
+        for enemy in [e for e in self.enemies if e.dead or e.health <= 0]:
+            self.release_enemy(enemy)
+
+        self._sync_arrays(enemies)
+        self._apply_screen_bounds(enemies)
+        self._update_attacks(enemies, player_rect, bullet_manager)
+
+        self._rebuild_enemy_grid()
+
+    def _sync_arrays(self, enemies: List[Enemy]):
+        """Gather enemy positions and velocities into contiguous arrays.
+
+        Enemies already in the arrays keep their sub-pixel position unless
+        something else (a collision, a respawn) moved their rect.
+        """
+        n = len(enemies)
+        rx = np.fromiter((e.rect.x for e in enemies), dtype=np.float64, count=n)
+        ry = np.fromiter((e.rect.y for e in enemies), dtype=np.float64, count=n)
+        if enemies == self._array_enemies:
+            xs, ys = self.xs, self.ys
+        elif self._array_enemies:
+            index = {id(e): i for i, e in enumerate(self._array_enemies)}
+            prev = np.fromiter((index.get(id(e), -1) for e in enemies), dtype=np.intp, count=n)
+            known = prev >= 0
+            xs = np.where(known, self.xs[prev], rx)
+            ys = np.where(known, self.ys[prev], ry)
+        else:
+            xs, ys = rx, ry
+        self.xs = np.where(np.trunc(xs) != rx, rx, xs)
+        self.ys = np.where(np.trunc(ys) != ry, ry, ys)
+        self._array_enemies = list(enemies)
+        self.vx = np.fromiter((e.velocity_x for e in enemies), dtype=np.float64, count=n)
+        self.vy = np.fromiter((e.velocity_y for e in enemies), dtype=np.float64, count=n)
+        self.healths = np.fromiter((e.health for e in enemies), dtype=np.float64, count=n)
+        if self._stats_key != (self._layout_version, Enemy.stats_version):
+            self._gather_stats(enemies)
+
+    def _gather_stats(self, enemies: List[Enemy]):
+        """Gather the stats that stay fixed until the enemy list or an enemy's stats change."""
+        n = len(enemies)
+        self.widths = np.fromiter((e.rect.width for e in enemies), dtype=np.float64, count=n)
+        self.heights = np.fromiter((e.rect.height for e in enemies), dtype=np.float64, count=n)
+        self.speeds = np.fromiter((e.speed for e in enemies), dtype=np.float64, count=n)
+        self.ranges = np.fromiter((e.detection_range for e in enemies), dtype=np.float64, count=n)
+        self.flee_healths = np.fromiter((e._flee_hp for e in enemies), dtype=np.float64, count=n)
+        self.gravities = np.fromiter((e.gravity for e in enemies), dtype=np.float64, count=n)
+        self._stats_key = (self._layout_version, Enemy.stats_version)
+
+    def _chase_player(self, enemies: List[Enemy], player_rect):
+        """Steer every enemy that can see the player toward it, or away when fleeing.
+
+        Enemies flee once their health drops to their flee threshold. Enemies
+        out of detection range keep their current velocity.
+        """
+        if not enemies or player_rect is None:
+            return
+        dx = player_rect.centerx - (np.trunc(self.xs) + self.widths // 2)
+        dy = player_rect.centery - (np.trunc(self.ys) + self.heights // 2)
+        d2 = dx * dx + dy * dy
+        chase = np.flatnonzero(d2 <= self.ranges * self.ranges)
+        if chase.size == 0:
+            return
+
+        dist = np.sqrt(d2[chase])
+        np.maximum(dist, 1, out=dist)
+        speeds = self.speeds[chase]
+        scale = np.where(self.healths[chase] <= self.flee_healths[chase], -speeds, speeds) / dist
+        self.vx[chase] = dx[chase] * scale
+        self.vy[chase] = dy[chase] * scale
+        for i in chase.tolist():
+            enemy = enemies[i]
+            enemy.velocity_x = float(self.vx[i])
+            enemy.velocity_y = float(self.vy[i])
+
+    def _integrate(self, enemies: List[Enemy]):
+        """Advance every enemy by its velocity, writing back only rects that changed."""
+        if not enemies:
+            return
+        old_x = np.trunc(self.xs)
+        old_y = np.trunc(self.ys)
+        self.xs += self.vx
+        self.ys += self.vy
+        changed = np.flatnonzero((np.trunc(self.xs) != old_x) | (np.trunc(self.ys) != old_y))
+        for i in changed.tolist():
+            rect = enemies[i].rect
+            rect.x = int(self.xs[i])
+            rect.y = int(self.ys[i])
+
+    def _resolve_platforms(self, enemies: List[Enemy]):
+        """Apply gravity and push every enemy out of the platforms it overlaps.
+
+        Rects are only written back for enemies a platform moved.
+        """
+        if not enemies:
+            return
+        xs = np.trunc(self.xs).astype(np.int64)
+        ys = np.trunc(self.ys).astype(np.int64)
+        old_x = xs.copy()
+        old_y = ys.copy()
+        on_ground, hits, counts = resolve_platforms(
+            xs, ys, self.widths.astype(np.int64), self.heights.astype(np.int64),
+            self.vx, self.vy, self.gravities, ENEMY_MAX_FALL_SPEED, self._platform_xyxy
+        )
+
+        moved = np.flatnonzero((xs != old_x) | (ys != old_y))
+        for i in moved.tolist():
+            rect = enemies[i].rect
+            rect.x = int(xs[i])
+            rect.y = int(ys[i])
+        for enemy, vx, vy, grounded, hit, count in zip(enemies, self.vx.tolist(), self.vy.tolist(),
+                                                         on_ground.tolist(), hits.tolist(), counts.tolist()):
+            enemy.velocity_x = vx
+            enemy.velocity_y = vy
+            enemy.on_ground = grounded
+            if hit:
+                enemy.last_collision = HIT_NAMES[hit]
+                enemy.collision_count += count
+
+    def _apply_screen_bounds(self, enemies: List[Enemy]):
+        """Clamp every enemy to the screen, reflecting velocity off the edges it hit.
+
+        Only enemies that were actually clamped are written back.
+        """
+        if not enemies:
+            return
+        max_x = self.screen_width - self.widths
+        max_y = self.screen_height - self.heights
+        hit_x = (self.xs < 0) | (self.xs > max_x)
+        hit_y = (self.ys < 0) | (self.ys > max_y)
+        changed = np.flatnonzero(hit_x | hit_y)
+        if changed.size == 0:
+            return
+
+        np.clip(self.xs, 0, max_x, out=self.xs)
+        np.clip(self.ys, 0, max_y, out=self.ys)
+        self.vx = np.where(hit_x, -self.vx, self.vx)
+        self.vy = np.where(hit_y, -self.vy, self.vy)
+        for i in changed.tolist():
+            enemy = enemies[i]
+            enemy.rect.x = int(self.xs[i])
+            enemy.rect.y = int(self.ys[i])
+            enemy.velocity_x = float(self.vx[i])
+            enemy.velocity_y = float(self.vy[i])
+
+    def _update_attacks(self, enemies: List[Enemy], player_rect, bullet_manager):
+        """Tick attack cooldowns and fire at the player from every ready enemy in range.
+
+        Range is checked on squared distances, so no square roots are taken.
+        """
+        if not enemies:
+            return
+        n = len(enemies)
+        cooldowns = np.fromiter((e.attack_cooldown for e in enemies), dtype=np.float64, count=n)
+        ready = cooldowns <= 0
+
+        if player_rect is not None and bullet_manager is not None and ready.any():
+            ranges = self.ranges
+            widths = self.widths
+            heights = self.heights
+            cx = self.xs + widths // 2
+            cy = self.ys + heights // 2
+            dx = player_rect.centerx - cx
+            dy = player_rect.centery - cy
+            in_range = dx * dx + dy * dy <= ranges * ranges
+            fire = np.flatnonzero(ready & in_range)
+            if fire.size:
+                # Every shot this tick goes to the bullet manager in one call
+                bullet_manager.create_bullets_batch(
+                    np.trunc(self.xs[fire]) + widths[fire] // 2,
+                    np.trunc(self.ys[fire]) + heights[fire] // 2,
+                    dx[fire],
+                    dy[fire],
+                    np.fromiter((enemies[i].damage for i in fire.tolist()), dtype=np.float64, count=fire.size),
+                    is_enemy=True
+                )
+
+        for enemy, is_ready in zip(enemies, ready.tolist()):
+            if is_ready:
+                enemy.attack_cooldown = enemy.attack_delay
+            else:
+                enemy.attack_cooldown -= 1
+
+    def _rebuild_enemy_grid(self):
+        """Reinsert every enemy into the grid at its current position."""
+        grid = self.enemy_grid
+        grid.clear()
         for enemy in self.enemies:
-            enemy.update(dt)
+            grid.insert(enemy, enemy.rect)
+
+    def _index_world(self, world_manager):
+        """Index platforms and tiles whenever the set of active zones changes."""
+        if world_manager is None:
+            return
+        zones = world_manager.active_zones
+        key = frozenset(zones)
+        if key == self._indexed_zones:
+            return
+        self._indexed_zones = key
+
+        self._platform_xyxy = world_manager.get_platform_xyxy()
+
+        # Tiles of unloaded zones are dropped, newly loaded zones are converted once
+        for zone_key in list(self._zone_tiles):
+            if zone_key not in key:
+                del self._zone_tiles[zone_key]
+        if isinstance(zones, dict):
+            for zone_key, zone in zones.items():
+                if zone_key not in self._zone_tiles:
+                    self._zone_tiles[zone_key] = np.array(
+                        [(tile["x"], tile["y"]) for tile in zone["tiles"]], dtype=np.int32
+                    ).reshape(-1, 2)
+        if self._zone_tiles:
+            self._tile_xy = np.concatenate(list(self._zone_tiles.values()))
+        else:
+            self._tile_xy = np.empty((0, 2), dtype=np.int32)
 
     def draw(self, screen):
-        """Draw all enemies."""
-        for enemy in self.enemies:
-            enemy.draw(screen)
+        """Draw all enemies, one pass per layer.
+
+        Bodies are solid fills. Health bars and detection ranges are shared
+        pre-rendered surfaces sent to SDL in a single blits() call.
+        """
+        enemies = self.enemies
+        if not enemies:
+            return
+        fill = screen.fill
+        for enemy in enemies:
+            fill(RED, enemy.rect)
+        blits = [bar for bar in (enemy._health_bar_blit() for enemy in enemies) if bar is not None]
+        blits.extend(enemy._range_blit() for enemy in enemies)
+        screen.blits(blits, doreturn=False)
+        for enemy in enemies:
+            if enemy.last_collision:
+                enemy._draw_debug_text(screen)
 
     def get_enemies(self):
-        """Get the sprite group of enemies."""
+        """Get the list of enemies."""
         return self.enemies
 
+    def sprites(self) -> List[Enemy]:
+        """Get a copy of the enemy list, like pygame.sprite.Group.sprites()."""
+        return list(self.enemies)
+
     def clear(self):
         """Clear all enemies."""
-        self.enemies.empty()
+        self._release_all()
         self.wave_number = 1
         self.enemies_remaining = self.enemies_per_wave
         self.difficulty_scaling = 1.0
@@ -476,12 +905,12 @@ class EnemyManager:
 
     def update_enemy_spawns(self, enemy_spawns: List[Dict]):
         """Update enemy manager with new spawns."""
-        # Clear existing enemies
-        self.enemies.empty()
+        # Clear existing enemies; the pool hands them back out for the first spawns
+        self._release_all()
         
         # Create new enemies from spawns
         for spawn in enemy_spawns:
-            enemy = Enemy(
+            enemy = self._acquire_enemy(
                 spawn["x"],
                 spawn["y"],
                 spawn["type"],
@@ -492,7 +921,7 @@ class EnemyManager:
             if "patrol_points" in spawn:
                 enemy.set_patrol_points(spawn["patrol_points"])
             
-            self.enemies.add(enemy)
+            self._add_enemy(enemy)
 
     def _update_patrol(self, enemy: Enemy):
         """Update patrol movement."""
@@ -505,52 +934,28 @@ class EnemyManager:
         # Calculate direction to target
         dx = target[0] - enemy.rect.centerx
         dy = target[1] - enemy.rect.centery
-        distance = (dx ** 2 + dy ** 2) ** 0.5
+        d2 = dx * dx + dy * dy
         
         # Move towards target
-        if distance > 5:  # Small threshold to prevent jittering
-            enemy.velocity_x = (dx / distance) * enemy.speed
-            enemy.velocity_y = (dy / distance) * enemy.speed
+        if d2 > 5 * 5:  # Small threshold to prevent jittering
+            inv = d2 ** -0.5
+            enemy.velocity_x = dx * inv * enemy.speed
+            enemy.velocity_y = dy * inv * enemy.speed
         else:
             # Reached target, move to next point
             enemy.current_patrol_index = (enemy.current_patrol_index + 1) % len(enemy.patrol_points)
 
     def _check_collisions(self, enemy: Enemy, world_manager):
         """Check collisions with the world."""
-        # Get current zone and surrounding zones
-        zone_x = enemy.rect.x // world_manager.zone_size
-        zone_y = enemy.rect.y // world_manager.zone_size
-        
-        # Check collisions with tiles in current and adjacent zones
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                check_zone_x = zone_x + dx
-                check_zone_y = zone_y + dy
-                
-                if (check_zone_x, check_zone_y) in world_manager.active_zones:
-                    zone = world_manager.active_zones[(check_zone_x, check_zone_y)]
-                    
-                    # Check collisions with tiles
-                    for tile in zone["tiles"]:
-                        tile_rect = pygame.Rect(tile["x"], tile["y"], 32, 32)
-                        
-                        # Horizontal collision
-                        if enemy.velocity_x != 0:
-                            if enemy.rect.colliderect(tile_rect):
-                                if enemy.velocity_x > 0:
-                                    enemy.rect.right = tile_rect.left
-                                else:
-                                    enemy.rect.left = tile_rect.right
-                                enemy.velocity_x = 0
-                        
-                        # Vertical collision
-                        if enemy.velocity_y != 0:
-                            if enemy.rect.colliderect(tile_rect):
-                                if enemy.velocity_y > 0:
-                                    enemy.rect.bottom = tile_rect.top
-                                else:
-                                    enemy.rect.top = tile_rect.bottom
-                                enemy.velocity_y = 0
+        self._index_world(world_manager)
+
+        rect = enemy.rect
+        x, y, enemy.velocity_x, enemy.velocity_y = resolve_tiles(
+            rect.x, rect.y, rect.width, rect.height,
+            enemy.velocity_x, enemy.velocity_y, self._tile_xy, TILE_SIZE
+        )
+        rect.x = x
+        rect.y = y
     
     def _attack(self, enemy: Enemy, bullet_manager: BulletManager):
         """Attack the target."""
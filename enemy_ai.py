@@ -2,10 +2,8 @@
 Enemy AI module.
 """
 from typing import Dict, List, Tuple, Optional, Any, Callable
-from dataclasses import dataclass
 from enum import Enum, auto
 import random
-import math
 import pygame
 from logger import logger
 import traceback
@@ -20,77 +18,31 @@ class AIState(Enum):
     STUNNED = auto()
     DEAD = auto()
 
-@dataclass
 class AICondition:
     """Condition for AI state transitions."""
-    name: str
-    check: Callable[[], bool]
-    priority: int = 0
+    __slots__ = ("name", "check", "priority")
+
+    def __init__(self, name: str, check: Callable[[], bool], priority: int = 0):
+        self.name = name
+        self.check = check
+        self.priority = priority
 
-@dataclass
 class AIAction:
     """Action for AI state."""
-    name: str
-    execute: Callable[[], None]
-    duration: float = 0.0
-    cooldown: float = 0.0
-    last_executed: float = 0.0
+    __slots__ = ("name", "execute", "duration", "cooldown", "last_executed")
 
-class BehaviorNode:
-    """Base class for behavior tree nodes."""
-    def __init__(self, name: str):
+    def __init__(self, name: str, execute: Callable[[], None], duration: float = 0.0,
+                 cooldown: float = 0.0, last_executed: float = 0.0):
         self.name = name
-        self.children: List[BehaviorNode] = []
-        
-    def add_child(self, child: 'BehaviorNode') -> None:
-        """Add a child node."""
-        self.children.append(child)
-        
-    def evaluate(self) -> bool:
-        """Evaluate the node."""
-        raise NotImplementedError()
-
-class SequenceNode(BehaviorNode):
-    """Node that executes children in sequence."""
-    def evaluate(self) -> bool:
-        """Evaluate all children in sequence."""
-        for child in self.children:
-            if not child.evaluate():
-                return False
-        return True
-
-class SelectorNode(BehaviorNode):
-    """Node that executes first successful child."""
-    def evaluate(self) -> bool:
-        """Evaluate children until one succeeds."""
-        for child in self.children:
-            if child.evaluate():
-                return True
-        return False
-
-class ConditionNode(BehaviorNode):
-    """Node that checks a condition."""
-    def __init__(self, name: str, condition: Callable[[], bool]):
-        super().__init__(name)
-        self.condition = condition
-        
-    def evaluate(self) -> bool:
-        """Evaluate the condition."""
-        return self.condition()
-
-class ActionNode(BehaviorNode):
-    """Node that executes an action."""
-    def __init__(self, name: str, action: Callable[[], None]):
-        super().__init__(name)
-        self.action = action
-        
-    def evaluate(self) -> bool:
-        """Execute the action."""
-        self.action()
-        return True
+        self.execute = execute
+        self.duration = duration
+        self.cooldown = cooldown
+        self.last_executed = last_executed
 
 class EnemyAI:
     """AI controller for enemies."""
+    __slots__ = ("enemy", "state", "state_time", "target", "patrol_points",
+                 "current_patrol_index", "_rules", "conditions", "actions")
     
     def __init__(self, enemy: 'Enemy'):
         """Initialize the AI controller."""
@@ -100,13 +52,14 @@ class EnemyAI:
         self.target = None
         self.patrol_points = []
         self.current_patrol_index = 0
-        self.behavior_tree = None
+        # Flattened behavior: (condition, action) pairs in priority order, first match runs
+        self._rules: Tuple[Tuple[Callable[[], bool], Callable[[], None]], ...] = ()
         self.conditions: Dict[str, AICondition] = {}
         self.actions: Dict[str, AIAction] = {}
         self._initialize_behavior()
         
     def _initialize_behavior(self) -> None:
-        """Initialize the behavior tree and conditions."""
+        """Initialize the conditions, actions and behavior rules."""
         try:
             # Create conditions
             self.conditions = {
@@ -167,43 +120,15 @@ class EnemyAI:
                 )
             }
             
-            # Create behavior tree
-            self.behavior_tree = SelectorNode("root")
-            
-            # Add stunned behavior
-            stunned_sequence = SequenceNode("stunned")
-            stunned_sequence.add_child(ConditionNode("is_stunned", self.conditions["is_stunned"].check))
-            stunned_sequence.add_child(ActionNode("wait", lambda: None))
-            self.behavior_tree.add_child(stunned_sequence)
-            
-            # Add flee behavior
-            flee_sequence = SequenceNode("flee")
-            flee_sequence.add_child(ConditionNode("is_low_health", self.conditions["is_low_health"].check))
-            flee_sequence.add_child(ActionNode("flee", self.actions["flee"].execute))
-            self.behavior_tree.add_child(flee_sequence)
-            
-            # Add attack behavior
-            attack_sequence = SequenceNode("attack")
-            attack_sequence.add_child(ConditionNode("target_in_range", self.conditions["target_in_range"].check))
-            attack_sequence.add_child(ActionNode("attack", self.actions["attack"].execute))
-            self.behavior_tree.add_child(attack_sequence)
-            
-            # Add chase behavior
-            chase_sequence = SequenceNode("chase")
-            chase_sequence.add_child(ConditionNode("has_target", self.conditions["has_target"].check))
-            chase_sequence.add_child(ActionNode("chase", self.actions["chase"].execute))
-            self.behavior_tree.add_child(chase_sequence)
-            
-            # Add patrol behavior
-            patrol_sequence = SequenceNode("patrol")
-            patrol_sequence.add_child(ConditionNode("has_patrol_points", self.conditions["has_patrol_points"].check))
-            patrol_sequence.add_child(ActionNode("patrol", self.actions["patrol"].execute))
-            self.behavior_tree.add_child(patrol_sequence)
-            
-            # Add idle behavior
-            idle_sequence = SequenceNode("idle")
-            idle_sequence.add_child(ActionNode("idle", self.actions["idle"].execute))
-            self.behavior_tree.add_child(idle_sequence)
+            # Behavior rules, highest priority first; idle always matches
+            self._rules = (
+                (self.conditions["is_stunned"].check, lambda: None),
+                (self.conditions["is_low_health"].check, self.actions["flee"].execute),
+                (self.conditions["target_in_range"].check, self.actions["attack"].execute),
+                (self.conditions["has_target"].check, self.actions["chase"].execute),
+                (self.conditions["has_patrol_points"].check, self.actions["patrol"].execute),
+                (lambda: True, self.actions["idle"].execute),
+            )
             
         except Exception as e:
             logger.error(f"Error initializing enemy AI: {str(e)}")
@@ -220,9 +145,11 @@ class EnemyAI:
                 if action.last_executed > 0:
                     action.last_executed -= dt
                     
-            # Evaluate behavior tree
-            if self.behavior_tree:
-                self.behavior_tree.evaluate()
+            # Run the action of the first rule whose condition holds
+            for condition, action in self._rules:
+                if condition():
+                    action()
+                    break
                 
         except Exception as e:
             logger.error(f"Error updating enemy AI: {str(e)}")
@@ -246,11 +173,11 @@ class EnemyAI:
         if not self.target:
             return False
             
-        distance = math.sqrt(
-            (self.enemy.x - self.target.x) ** 2 +
-            (self.enemy.y - self.target.y) ** 2
-        )
-        return distance <= self.enemy.attack_range
+        # Compare squared distances so no square root is taken
+        dx = self.enemy.x - self.target.x
+        dy = self.enemy.y - self.target.y
+        attack_range = self.enemy.attack_range
+        return dx * dx + dy * dy <= attack_range * attack_range
         
     def _action_idle(self) -> None:
         """Execute idle action."""
@@ -265,13 +192,14 @@ class EnemyAI:
         target_x, target_y = self.patrol_points[self.current_patrol_index]
         dx = target_x - self.enemy.x
         dy = target_y - self.enemy.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        d2 = dx * dx + dy * dy
         
-        if distance < 5:
+        if d2 < 5 * 5:
             self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_points)
         else:
-            self.enemy.velocity_x = dx / distance * self.enemy.speed
-            self.enemy.velocity_y = dy / distance * self.enemy.speed
+            scale = d2 ** -0.5 * self.enemy.speed
+            self.enemy.velocity_x = dx * scale
+            self.enemy.velocity_y = dy * scale
             
     def _action_chase(self) -> None:
         """Execute chase action."""
@@ -280,11 +208,12 @@ class EnemyAI:
             
         dx = self.target.x - self.enemy.x
         dy = self.target.y - self.enemy.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        d2 = dx * dx + dy * dy
         
-        if distance > 0:
-            self.enemy.velocity_x = dx / distance * self.enemy.speed
-            self.enemy.velocity_y = dy / distance * self.enemy.speed
+        if d2 > 0:
+            scale = d2 ** -0.5 * self.enemy.speed
+            self.enemy.velocity_x = dx * scale
+            self.enemy.velocity_y = dy * scale
             
     def _action_attack(self) -> None:
         """Execute attack action."""
@@ -303,11 +232,12 @@ class EnemyAI:
             
         dx = self.enemy.x - self.target.x
         dy = self.enemy.y - self.target.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        d2 = dx * dx + dy * dy
         
-        if distance > 0:
-            self.enemy.velocity_x = dx / distance * self.enemy.speed * 1.5
-            self.enemy.velocity_y = dy / distance * self.enemy.speed * 1.5
+        if d2 > 0:
+            scale = d2 ** -0.5 * self.enemy.speed * 1.5
+            self.enemy.velocity_x = dx * scale
+            self.enemy.velocity_y = dy * scale
             
     def get_state(self) -> Dict[str, Any]:
         """Get the current AI state."""
@@ -6,15 +6,102 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 import pygame
 import json
-import uuid
-import traceback
+try:
+    import orjson
+except ImportError:  # Optional; fall back to the stdlib json module
+    orjson = None
+import sys
+import itertools
 from base import Component
 from utils import ComponentRegistry
-from logger import logger
+from logger import logger, log_exception_once
 from components import StateComponent, TransformComponent
+from ecs.transform_store import transform_store
+from ecs.physics_store import physics_store
 
 T = TypeVar('T')
 
+# Process-wide entity id counter; ids are 8+ hex digit strings, unique per run
+_next_entity_number = itertools.count(1).__next__
+
+def new_entity_id() -> str:
+    """Get a fresh entity id, much cheaper than a uuid4 per spawn."""
+    return f"{_next_entity_number():08x}"
+
+# Integer id of each component type, keyed by class, name and the id itself.
+# "Transform" and "TransformComponent" name the same component.
+_COMPONENT_IDS: Dict[Any, int] = {}
+_COMPONENT_NAMES: List[str] = []  # Interned short name for each id
+MAX_COMPONENT_BITS = 64
+
+def component_id(component: Any) -> int:
+    """Get the integer id for a component class, name or id, assigning one on first use."""
+    cid = _COMPONENT_IDS.get(component)
+    if cid is not None:
+        return cid
+    if isinstance(component, type):
+        cid = component_id(component.__name__)
+    elif isinstance(component, int):
+        raise ValueError(f"Unknown component id {component}")
+    else:
+        name = component[:-len("Component")] if component.endswith("Component") and component != "Component" else component
+        name = sys.intern(name)
+        cid = _COMPONENT_IDS.get(name)
+        if cid is None:
+            if len(_COMPONENT_NAMES) >= MAX_COMPONENT_BITS:
+                raise ValueError(f"Too many component types for a {MAX_COMPONENT_BITS}-bit mask")
+            cid = _COMPONENT_IDS[name] = _COMPONENT_IDS[len(_COMPONENT_NAMES)] = len(_COMPONENT_NAMES)
+            _COMPONENT_NAMES.append(name)
+    _COMPONENT_IDS[component] = cid
+    return cid
+
+def component_bit(component_name: Any) -> int:
+    """Get the mask bit for a component name, assigning one on first use."""
+    return 1 << component_id(component_name)
+
+# Hot components are also kept in a plain attribute on the entity, so system
+# loops can read entity.transform instead of calling get_component()
+_HOT_ATTRS: Dict[int, str] = {
+    component_id('Transform'): 'transform',
+    component_id('Physics'): 'physics',
+    component_id('Particle'): 'particle',
+    component_id('Sprite'): 'sprite',
+    component_id('UI'): 'ui',
+}
+
+def component_mask(component_names: List[str]) -> int:
+    """Get the combined mask bits for several component names."""
+    mask = 0
+    for name in component_names:
+        mask |= component_bit(name)
+    return mask
+
+# Mask bit of each entity tag, assigned on first use
+_TAG_BITS: Dict[str, int] = {}
+_TAG_NAMES: List[str] = []  # Interned tag name for each bit index
+MAX_TAG_BITS = 64
+
+def tag_bit(tag: str) -> int:
+    """Get the mask bit for an entity tag, assigning one on first use."""
+    bit = _TAG_BITS.get(tag)
+    if bit is None:
+        if len(_TAG_NAMES) >= MAX_TAG_BITS:
+            raise ValueError(f"Too many entity tags for a {MAX_TAG_BITS}-bit mask")
+        bit = _TAG_BITS[tag] = 1 << len(_TAG_NAMES)
+        _TAG_NAMES.append(sys.intern(tag))
+    return bit
+
+def tag_mask(tags: List[str]) -> int:
+    """Get the combined mask bits for several tags."""
+    mask = 0
+    for tag in tags:
+        mask |= tag_bit(tag)
+    return mask
+
+def tag_names(mask: int) -> List[str]:
+    """Get the names of the tags set in a mask, in bit order."""
+    return [name for index, name in enumerate(_TAG_NAMES) if mask >> index & 1]
+
 class EntityType(Enum):
     """Types of entities in the game."""
     PLAYER = auto()
@@ -48,14 +135,17 @@ class StatusEffectType(Enum):
     DAMAGE_UP = auto()
     DEFENSE_UP = auto()
 
-@dataclass
 class StatusEffect:
     """Represents a status effect on an entity."""
-    type: StatusEffectType
-    duration: float
-    value: float = 0.0
-    tick_rate: float = 1.0
-    time_since_last_tick: float = 0.0
+    __slots__ = ('type', 'duration', 'value', 'tick_rate', 'time_since_last_tick')
+
+    def __init__(self, type: StatusEffectType, duration: float, value: float = 0.0,
+                 tick_rate: float = 1.0, time_since_last_tick: float = 0.0):
+        self.type = type
+        self.duration = duration
+        self.value = value
+        self.tick_rate = tick_rate
+        self.time_since_last_tick = time_since_last_tick
     
     def update(self, dt: float) -> None:
         """Update the status effect."""
@@ -74,6 +164,8 @@ class StatusEffect:
 @dataclass
 class Component:
     """Base class for entity components."""
+    __slots__ = ('entity', '__weakref__')
+
     entity: 'Entity'
     
     def update(self, dt: float) -> None:
@@ -89,40 +181,113 @@ class Component:
         """Create component from dictionary."""
         return cls(entity)
 
-@dataclass
 class PhysicsComponent(Component):
-    """Component for entity physics."""
-    velocity_x: float = 0.0
-    velocity_y: float = 0.0
-    acceleration_x: float = 0.0
-    acceleration_y: float = 0.0
-    mass: float = 1.0
-    friction: float = 0.1
-    gravity: float = 0.0
-    is_kinematic: bool = False
-    
-    def update(self, dt: float) -> None:
-        """Update physics."""
-        if not self.is_kinematic:
-            # Apply gravity
-            self.velocity_y += self.gravity * dt
-            
-            # Apply acceleration
-            self.velocity_x += self.acceleration_x * dt
-            self.velocity_y += self.acceleration_y * dt
-            
-            # Apply friction
-            if abs(self.velocity_x) > 0:
-                self.velocity_x *= (1 - self.friction)
-            if abs(self.velocity_y) > 0:
-                self.velocity_y *= (1 - self.friction)
-                
-            # Update position
-            transform = self.entity.get_component(TransformComponent)
-            if transform:
-                transform.x += self.velocity_x * dt
-                transform.y += self.velocity_y * dt
-                
+    """Component for entity physics.
+
+    Velocity lives in the entity's TransformStore slot and the remaining
+    properties in a PhysicsStore row. PhysicsSystem steps every row at
+    once, so the component has no per-entity update.
+    """
+    __slots__ = ('mass', '_slot', '_row')
+
+    def __init__(self, entity: 'Entity', velocity_x: float = 0.0, velocity_y: float = 0.0,
+                 acceleration_x: float = 0.0, acceleration_y: float = 0.0, mass: float = 1.0,
+                 friction: float = 0.1, gravity: float = 0.0, is_kinematic: bool = False):
+        """Initialize physics component.
+
+        Args:
+            entity: The entity this component belongs to
+            velocity_x: Horizontal velocity
+            velocity_y: Vertical velocity
+            acceleration_x: Horizontal acceleration
+            acceleration_y: Vertical acceleration
+            mass: Entity mass
+            friction: Fraction of velocity lost each step
+            gravity: Downward acceleration
+            is_kinematic: Whether step() leaves the velocity alone
+        """
+        self.entity = entity
+        self.mass = mass
+        self._slot = slot = transform_store.acquire(entity)
+        self._row = row = physics_store.alloc(slot)
+        transform_store.vx[slot] = velocity_x
+        transform_store.vy[slot] = velocity_y
+        physics_store.set_acceleration(row, acceleration_x, acceleration_y)
+        physics_store.set_friction(row, friction)
+        physics_store.set_gravity(row, gravity)
+        physics_store.set_kinematic(row, is_kinematic)
+
+    def destroy(self) -> None:
+        """Release the store row and slot; the component must not be used afterwards."""
+        row = getattr(self, '_row', None)
+        if row is not None:
+            self._row = None
+            physics_store.free(row)
+        slot = getattr(self, '_slot', None)
+        if slot is not None:
+            self._slot = None
+            transform_store.release(slot)
+
+    def __del__(self):
+        # Fallback for components dropped without Entity.remove_component()
+        self.destroy()
+
+    @property
+    def velocity_x(self) -> float:
+        return transform_store.vx.item(self._slot)
+
+    @velocity_x.setter
+    def velocity_x(self, value: float) -> None:
+        transform_store.vx[self._slot] = value
+
+    @property
+    def velocity_y(self) -> float:
+        return transform_store.vy.item(self._slot)
+
+    @velocity_y.setter
+    def velocity_y(self, value: float) -> None:
+        transform_store.vy[self._slot] = value
+
+    @property
+    def acceleration_x(self) -> float:
+        return physics_store.ax.item(self._row)
+
+    @acceleration_x.setter
+    def acceleration_x(self, value: float) -> None:
+        physics_store.set_acceleration(self._row, value, physics_store.ay.item(self._row))
+
+    @property
+    def acceleration_y(self) -> float:
+        return physics_store.ay.item(self._row)
+
+    @acceleration_y.setter
+    def acceleration_y(self, value: float) -> None:
+        physics_store.set_acceleration(self._row, physics_store.ax.item(self._row), value)
+
+    @property
+    def friction(self) -> float:
+        return physics_store.friction.item(self._row)
+
+    @friction.setter
+    def friction(self, value: float) -> None:
+        physics_store.set_friction(self._row, value)
+
+    @property
+    def gravity(self) -> float:
+        return physics_store.gravity.item(self._row)
+
+    @gravity.setter
+    def gravity(self, value: float) -> None:
+        physics_store.set_gravity(self._row, value)
+
+    @property
+    def is_kinematic(self) -> bool:
+        return not physics_store.active.item(self._row)
+
+    @is_kinematic.setter
+    def is_kinematic(self, value: bool) -> None:
+        physics_store.set_kinematic(self._row, value)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert physics to dictionary."""
         return {
@@ -151,18 +316,23 @@ class PhysicsComponent(Component):
             is_kinematic=data["is_kinematic"]
         )
 
-@dataclass
 class CollisionComponent(Component):
     """Component for entity collision."""
-    width: float = 32.0
-    height: float = 32.0
-    is_trigger: bool = False
-    collision_mask: int = 0xFFFFFFFF
-    collision_layer: int = 0x00000001
+    __slots__ = ('width', 'height', 'is_trigger', 'collision_mask', 'collision_layer')
+
+    def __init__(self, entity: 'Entity', width: float = 32.0, height: float = 32.0,
+                 is_trigger: bool = False, collision_mask: int = 0xFFFFFFFF,
+                 collision_layer: int = 0x00000001):
+        self.entity = entity
+        self.width = width
+        self.height = height
+        self.is_trigger = is_trigger
+        self.collision_mask = collision_mask
+        self.collision_layer = collision_layer
     
     def get_rect(self) -> pygame.Rect:
         """Get collision rectangle."""
-        transform = self.entity.get_component(TransformComponent)
+        transform = self.entity.transform
         if transform:
             return pygame.Rect(
                 transform.x - self.width / 2,
@@ -194,22 +364,45 @@ class CollisionComponent(Component):
             collision_layer=data["collision_layer"]
         )
 
+def _destroy_component(component: Any) -> None:
+    """Release any store slot a component holds."""
+    destroy = getattr(component, 'destroy', None)
+    if destroy is not None:
+        destroy()
+
 class Entity:
     """Base class for all game entities."""
+    __slots__ = ('id', 'name', 'type', 'components', '_component_list', '_component_slots',
+                 'component_mask', 'world', 'transform', 'physics', 'particle', 'sprite', 'ui',
+                 '_idx_by_comp', 'children', 'parent', 'status_effects', 'dead', 'zone_id',
+                 'tags', 'active', 'state', 'mark_for_deletion', '__weakref__')
     
     def __init__(self, entity_type: EntityType, name: str = ""):
         """Initialize entity."""
-        self.id = str(uuid.uuid4())
+        self.id = new_entity_id()
         self.name = name or f"{entity_type.name}_{self.id[:8]}"
         self.type = entity_type
         self.components: Dict[str, Component] = {}
+        self._component_list: Optional[Tuple[Component, ...]] = None  # components.values() for update(); None when stale
+        self._component_slots: List[Optional[Component]] = []  # Indexed by component_id()
+        self.component_mask = 0  # Bitwise OR of component_bit() for each component
+        self.world = None  # ecs.archetype.World tracking this entity, if any
+        # Direct references to the hot components (see _HOT_ATTRS), None when absent
+        self.transform = None
+        self.physics = None
+        self.particle = None
+        self.sprite = None
+        self.ui = None
+        self._idx_by_comp: Dict[int, int] = {}  # Component id -> index in the world's per-component list
         self.children: List['Entity'] = []
         self.parent: Optional['Entity'] = None
         self.status_effects: List[StatusEffect] = []
         self.dead = False
         self.zone_id: Optional[str] = None
-        self.tags: Set[str] = set()  # Initialize empty tags set
+        self.tags = 0  # Bitwise OR of tag_bit() for each tag
         self.active = True  # Add active attribute
+        self.state = EntityState.IDLE  # Set by status effects such as StunEffect
+        self.mark_for_deletion = False
         
         # Automatically add required components
         self.add_component(TransformComponent(self))
@@ -217,22 +410,108 @@ class Entity:
         
     def add_component(self, component: Component) -> None:
         """Add a component to the entity."""
-        component_name = component.__class__.__name__
-        self.components[component_name] = component
+        component_class = component.__class__
+        cid = component_id(component_class)
+        slots = self._component_slots
+        if cid >= len(slots):
+            slots.extend([None] * (cid + 1 - len(slots)))
+        previous = slots[cid]
+        added = previous is None
+        slots[cid] = component
+        if not added and previous is not component:
+            _destroy_component(previous)
+        self.components[component_class.__name__] = component
+        self._component_list = None
+        self.component_mask |= 1 << cid
+        attr = _HOT_ATTRS.get(cid)
+        if attr is not None:
+            setattr(self, attr, component)
+        if added and self.world is not None:
+            self.world._component_added(self, cid)
+        
+    def reset(self, name: str = "") -> None:
+        """Reinitialize a pooled entity for reuse.
+        
+        The Transform and State components are kept and reset to their
+        defaults; every other component is removed.
+        """
+        self.id = new_entity_id()
+        self.name = name or f"{self.type.name}_{self.id[:8]}"
+        for component in list(self.components.values()):
+            if not isinstance(component, (TransformComponent, StateComponent)):
+                self.remove_component(component.__class__.__name__)
+        
+        transform = self.get_component(TransformComponent)
+        transform.x = 0.0
+        transform.y = 0.0
+        transform.rotation = 0.0
+        transform.scale_x = 1.0
+        transform.scale_y = 1.0
+        state = self.get_component(StateComponent)
+        state.current_state = "idle"
+        state.previous_state = None
+        state.state_time = 0.0
+        
+        self.children.clear()
+        self.parent = None
+        self.status_effects.clear()
+        self.dead = False
+        self.zone_id = None
+        self.tags = 0
+        self.active = True
+        self.state = EntityState.IDLE
+        self.mark_for_deletion = False
+        
+    def add_tag(self, tag: str) -> None:
+        """Add a tag to the entity."""
+        self.tags |= tag_bit(tag)
+        
+    def remove_tag(self, tag: str) -> None:
+        """Remove a tag from the entity."""
+        self.tags &= ~_TAG_BITS.get(tag, 0)
+        
+    def has_tag(self, tag: str) -> bool:
+        """Check if entity has a tag."""
+        return self.tags & _TAG_BITS.get(tag, 0) != 0
         
     def remove_component(self, component_name: str) -> None:
         """Remove a component from the entity."""
-        if component_name in self.components:
-            del self.components[component_name]
+        cid = component_id(component_name)
+        slots = self._component_slots
+        component = slots[cid] if cid < len(slots) else None
+        if component is not None:
+            slots[cid] = None
+            del self.components[component.__class__.__name__]
+            self._component_list = None
+            self.component_mask &= ~(1 << cid)
+            attr = _HOT_ATTRS.get(cid)
+            if attr is not None:
+                setattr(self, attr, None)
+            if self.world is not None:
+                self.world._component_removed(self, cid)
+            _destroy_component(component)
+
+    def destroy(self) -> None:
+        """Release the store slots held by the entity's components.
+
+        EntityManager.remove_entity() calls this; the entity must not be
+        used afterwards. Components' __del__ only covers entities dropped
+        without it, and only once the cyclic collector runs.
+        """
+        for component in self.components.values():
+            _destroy_component(component)
             
     def get_component(self, component_type: Type[T]) -> Optional[T]:
-        """Get a component by type."""
-        component_name = component_type.__name__
-        return self.components.get(component_name)
+        """Get a component by type, name or component id."""
+        cid = _COMPONENT_IDS.get(component_type)
+        if cid is None:
+            cid = component_id(component_type)
+        slots = self._component_slots
+        return slots[cid] if cid < len(slots) else None
         
     def has_component(self, component_name: str) -> bool:
         """Check if entity has a component."""
-        return component_name in self.components
+        return self.get_component(component_name) is not None
         
     def set_state(self, new_state: str, reason: Optional[str] = None) -> bool:
         """Set entity state.
@@ -296,12 +575,15 @@ class Entity:
             return
             
         # Update components
-        for component in self.components.values():
+        components = self._component_list
+        if components is None:
+            components = self._component_list = tuple(self.components.values())
+        # A component that raises is skipped for this frame; the rest still update
+        for component in components:
             try:
                 component.update(dt)
             except Exception as e:
-                logger.error(f"Error updating component {component.__class__.__name__} for entity {self.id}: {str(e)}")
-                logger.error(traceback.format_exc())
+                log_exception_once(e, "Error updating component %s", component.__class__.__name__)
                 
         # Update children
         for child in self.children:
@@ -314,12 +596,11 @@ class Entity:
             
         # Draw components
         for component in self.components.values():
-            try:
-                if hasattr(component, 'draw'):
+            if hasattr(component, 'draw'):
+                try:
                     component.draw(surface)
-            except Exception as e:
-                logger.error(f"Error drawing component {component.__class__.__name__} for entity {self.id}: {str(e)}")
-                logger.error(traceback.format_exc())
+                except Exception as e:
+                    log_exception_once(e, "Error drawing component %s", component.__class__.__name__)
                 
         # Draw children
         for child in self.children:
@@ -361,7 +642,7 @@ class Entity:
             "type": self.type.name,
             "active": self.active,
             "zone_id": self.zone_id,
-            "tags": list(self.tags),
+            "tags": tag_names(self.tags),
             "components": {
                 name: component.to_dict()
                 for name, component in self.components.items()
@@ -371,36 +652,69 @@ class Entity:
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Entity':
-        """Create entity from dictionary."""
-        entity = cls(EntityType[data["type"]], data["name"])
-        entity.active = data["active"]
-        entity.zone_id = data["zone_id"]
-        entity.tags = set(data["tags"])
-        
-        # Load components
-        for component_name, component_data in data["components"].items():
-            component_type = ComponentRegistry.get_component_type(component_name)
-            if component_type:
-                component = component_type.from_dict(component_data, entity)
-                entity.add_component(component)
-                
-        # Load children
-        for child_data in data["children"]:
-            child = cls.from_dict(child_data)
-            entity.add_child(child)
+        """Create entity from dictionary.
+        
+        Children are built from an explicit stack rather than by recursion,
+        and each component name is looked up in the registry once per call.
+        """
+        component_types: Dict[str, Optional[type]] = {}
+        root = None
+        stack: List[Tuple[Dict[str, Any], Optional['Entity']]] = [(data, None)]
+        while stack:
+            node, parent = stack.pop()
+            entity = cls(EntityType[node["type"]], node["name"])
+            entity.active = node["active"]
+            entity.zone_id = node["zone_id"]
+            entity.tags = tag_mask(node["tags"])
+            
+            # Load components
+            for component_name, component_data in node["components"].items():
+                try:
+                    component_type = component_types[component_name]
+                except KeyError:
+                    component_type = component_types[component_name] = ComponentRegistry.get(component_name)
+                if component_type:
+                    component = component_type.from_dict(component_data, entity)
+                    entity.add_component(component)
+                    
+            if parent is None:
+                root = entity
+            else:
+                parent.add_child(entity)
+            # Reversed so children are popped, and added, in their saved order
+            stack.extend((child_data, entity) for child_data in reversed(node["children"]))
             
-        return entity
+        return root
         
     def save_to_file(self, file_path: str) -> None:
-        """Save entity to file."""
-        with open(file_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """Save entity to file.
+        
+        Paths ending in .msgpack are written as msgpack, anything else as
+        compact JSON.
+        """
+        data = self.to_dict()
+        if file_path.endswith(".msgpack"):
+            import msgspec  # Only msgpack saves need it
+            payload = msgspec.msgpack.encode(data)
+        elif orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+        with open(file_path, 'wb') as f:
+            f.write(payload)
             
     @classmethod
     def load_from_file(cls, file_path: str) -> 'Entity':
-        """Load entity from file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        """Load entity from a .msgpack or JSON file."""
+        with open(file_path, 'rb') as f:
+            payload = f.read()
+        if file_path.endswith(".msgpack"):
+            import msgspec
+            data = msgspec.msgpack.decode(payload)
+        elif orjson is not None:
+            data = orjson.loads(payload)
+        else:
+            data = json.loads(payload)
         return cls.from_dict(data)
         
     def render(self, surface, camera):
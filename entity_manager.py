@@ -2,32 +2,137 @@
 EntityManager for ECS system
 """
 
+from collections import deque
+from ecs.archetype import World
 from ecs.entity_audit import audit_components, audit_health_states
+from ecs.system_template import StatusEffectSystem
+from entities import Entity, component_id
+from logger import log_exception_once
+
+# Maximum number of released entities kept for reuse per entity type
+ENTITY_POOL_LIMIT = 256
+
+# Number of recent add/remove events kept in EntityManager.events
+ENTITY_EVENT_LIMIT = 4096
+
+# Components with a per-entity update(), in the order update() runs them.
+# Physics is stepped for every entity at once by PhysicsSystem.
+UPDATE_PHASES = ("State", "Health", "Bullet", "Sprite")
 
 class EntityManager:
     def __init__(self):
-        self.entities = {}  # dict: id -> entity
+        self._slots = []  # Live entities, densely packed; removal swaps the last one in
+        self._index = {}  # dict: id -> position in _slots
+        self._by_type = {}  # dict: entity type -> {id: entity}, in insertion order
+        self._pool = {}  # dict: entity type -> released entities
+        self.world = World()  # Tracks which entities own each component
+        self.events = deque(maxlen=ENTITY_EVENT_LIMIT)  # Recent ('add' | 'remove', id), oldest dropped first
+        self._phase_ids = [component_id(name) for name in UPDATE_PHASES]
+        self.status_effects = StatusEffectSystem()  # Ticks effect rows in world, before the phases
 
     def add_entity(self, entity):
-        self.entities[entity.id] = entity
-        print(f"[EntityManager] Entity {entity.id} added.")
+        index = self._index.get(entity.id)
+        if index is None:
+            self._index[entity.id] = len(self._slots)
+            self._slots.append(entity)
+        else:
+            self._slots[index] = entity
+        self._by_type.setdefault(getattr(entity, 'type', None), {})[entity.id] = entity
+        self.world.add_entity(entity)
+        self.events.append(('add', entity.id))
 
     def remove_entity(self, entity_id):
-        if entity_id in self.entities:
-            del self.entities[entity_id]
-            print(f"[EntityManager] Entity {entity_id} removed.")
+        """
+        Remove an entity and release the store slots its components hold.
+        """
+        entity = self._untrack(entity_id)
+        if entity is not None:
+            entity.destroy()
+
+    def release_entity(self, entity_id):
+        """
+        Remove an entity and keep it for reuse by create_entity().
+        """
+        entity = self._untrack(entity_id)
+        if entity is None:
+            return
+        pool = self._pool.setdefault(entity.type, [])
+        if len(pool) < ENTITY_POOL_LIMIT:
+            pool.append(entity)
+        else:
+            entity.destroy()
+
+    def _untrack(self, entity_id):
+        """
+        Drop an entity from every index, returning it, or None if unknown.
+        """
+        index = self._index.pop(entity_id, None)
+        if index is None:
+            return None
+        entity = self._slots[index]
+        last = self._slots.pop()
+        if last is not entity:
+            self._slots[index] = last
+            self._index[last.id] = index
+        self._by_type[getattr(entity, 'type', None)].pop(entity_id, None)
+        self.world.remove_entity(entity)
+        self.status_effects.remove(self.world, entity)
+        self.events.append(('remove', entity_id))
+        return entity
 
     def get_entity(self, entity_id):
-        return self.entities.get(entity_id, None)
+        index = self._index.get(entity_id)
+        return None if index is None else self._slots[index]
 
     def get_all_entities(self):
-        return list(self.entities.values())
+        """
+        Return the live list of registered entities, in no particular order.
+
+        The list is not copied: it changes as entities are added and
+        removed, so callers must not modify it and should copy it before
+        adding or removing entities while iterating.
+        """
+        return self._slots
 
     def get_entities_by_type(self, entity_type):
         """
         Return a list of all entities of the given type.
         """
-        return [entity for entity in self.entities.values() if getattr(entity, 'type', None) == entity_type]
+        bucket = self._by_type.get(entity_type)
+        return list(bucket.values()) if bucket else []
+
+    def apply_status_effect(self, entity, effect):
+        """
+        Put a status effect on an entity; update() ticks it until it expires.
+        """
+        self.status_effects.add(self.world, entity, effect)
+
+    def update(self, dt):
+        """
+        Tick status effects, then update every entity's components one
+        phase at a time.
+
+        Each phase walks only the entities owning that component. The
+        handler sits outside the loop: an entity whose component raises is
+        deactivated, the error is logged once per call site, and the phase
+        resumes with the next entity.
+        """
+        world = self.world
+        self.status_effects.update(world, dt)
+        for name, cid in zip(UPDATE_PHASES, self._phase_ids):
+            entities = world.entities_with(cid)
+            start = 0
+            while start < len(entities):
+                try:
+                    for index in range(start, len(entities)):
+                        entity = entities[index]
+                        if entity.active:
+                            entity._component_slots[cid].update(dt)
+                    break
+                except Exception as e:
+                    entity.active = False
+                    log_exception_once(e, "Error in %s update phase", name)
+                    start = index + 1
 
     def run_audits(self):
         all_entities = self.get_all_entities()
@@ -37,8 +142,13 @@ class EntityManager:
     def create_entity(self, entity_type, name=""):
         """
         Factory method to create and register a new entity.
+        Released entities of the same type are reused first.
         """
-        from entities import Entity  # Local import to avoid circular dependency
-        entity = Entity(entity_type, name)
+        pool = self._pool.get(entity_type)
+        if pool:
+            entity = pool.pop()
+            entity.reset(name)
+        else:
+            entity = Entity(entity_type, name)
         self.add_entity(entity)
         return entity 
\ No newline at end of file
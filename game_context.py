@@ -1,48 +1,55 @@
 """
 Game context singleton for managing global state and system references.
 """
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Final
 from logger import logger
 
-@dataclass
+# Per-biome ambient particles and music theme, built once at import
+BIOME_STATES: Final[Dict[str, Dict[str, Any]]] = {
+    'grass': {'ambient_particles': 'leaves', 'music_theme': 'forest'},
+    'lava': {'ambient_particles': 'embers', 'music_theme': 'volcanic'},
+    'tech': {'ambient_particles': 'sparks', 'music_theme': 'electronic'},
+    'ice': {'ambient_particles': 'snow', 'music_theme': 'arctic'},
+    'forest': {'ambient_particles': 'leaves', 'music_theme': 'forest'}
+}
+
 class GameContext:
-    """Singleton class to manage global game state and system references."""
-    # Core systems
-    asset_loader: Optional[Any] = None
-    tile_manager: Optional[Any] = None
-    biome_manager: Optional[Any] = None
-    music_manager: Optional[Any] = None
-    loot_manager: Optional[Any] = None
-    
-    # Game state
-    current_biome: str = 'grass'
-    current_chunk: int = 0
-    current_level: int = 1
-    difficulty: float = 1.0
-    
-    # Player state
-    player_health: int = 100
-    player_score: int = 0
-    player_level: int = 1
-    
-    # Biome-specific state
-    biome_states: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
-        'grass': {'ambient_particles': 'leaves', 'music_theme': 'forest'},
-        'lava': {'ambient_particles': 'embers', 'music_theme': 'volcanic'},
-        'tech': {'ambient_particles': 'sparks', 'music_theme': 'electronic'},
-        'ice': {'ambient_particles': 'snow', 'music_theme': 'arctic'},
-        'forest': {'ambient_particles': 'leaves', 'music_theme': 'forest'}
-    })
+    """Global game state and system references.
     
-    # Singleton instance
-    _instance = None
+    Use the module-level game_context instance rather than creating more.
+    """
+    __slots__ = ('asset_loader', 'tile_manager', 'biome_manager', 'music_manager', 'loot_manager',
+                 'current_biome', 'current_chunk', 'current_level', 'difficulty',
+                 'player_health', 'player_score', 'player_level', 'biome_states',
+                 '_ambient_particles', '_music_theme')
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(GameContext, cls).__new__(cls)
-            logger.info("Game context singleton created")
-        return cls._instance
+    def __init__(self):
+        """Initialize the context with default state."""
+        # Core systems
+        self.asset_loader: Optional[Any] = None
+        self.tile_manager: Optional[Any] = None
+        self.biome_manager: Optional[Any] = None
+        self.music_manager: Optional[Any] = None
+        self.loot_manager: Optional[Any] = None
+        
+        # Game state
+        self.current_biome: str = 'grass'
+        self.current_chunk: int = 0
+        self.current_level: int = 1
+        self.difficulty: float = 1.0
+        
+        # Player state
+        self.player_health: int = 100
+        self.player_score: int = 0
+        self.player_level: int = 1
+        
+        # Biome-specific state
+        self.biome_states: Dict[str, Dict[str, Any]] = BIOME_STATES
+        # Flat copies of the current biome's state, refreshed by change_biome()
+        state = self.biome_states[self.current_biome]
+        self._ambient_particles: str = state['ambient_particles']
+        self._music_theme: str = state['music_theme']
+        logger.info("Game context created")
     
     def initialize(self, asset_loader, tile_manager, biome_manager=None, 
                   music_manager=None, loot_manager=None):
@@ -56,11 +63,14 @@ class GameContext:
     
     def change_biome(self, new_biome: str) -> None:
         """Change the current biome and update related systems."""
-        if new_biome in self.biome_states:
+        state = self.biome_states.get(new_biome)
+        if state is not None:
             self.current_biome = new_biome
+            self._ambient_particles = state['ambient_particles']
+            self._music_theme = state['music_theme']
             # Update music if manager exists
             if self.music_manager:
-                self.music_manager.change_theme(self.biome_states[new_biome]['music_theme'])
+                self.music_manager.change_theme(self._music_theme)
             logger.info(f"Biome changed to {new_biome}")
         else:
             logger.error(f"Invalid biome: {new_biome}")
@@ -83,11 +93,11 @@ class GameContext:
     
     def get_current_ambient_particles(self) -> str:
         """Get the ambient particle type for the current biome."""
-        return self.biome_states[self.current_biome]['ambient_particles']
+        return self._ambient_particles
     
     def get_current_music_theme(self) -> str:
         """Get the music theme for the current biome."""
-        return self.biome_states[self.current_biome]['music_theme']
+        return self._music_theme
     
     def increase_difficulty(self, amount: float = 0.1) -> None:
         """Increase the game difficulty."""
@@ -4,6 +4,9 @@ import math
 from visual_effects import visual_effects, biome_visuals, apply_tint, apply_overlay
 
 class Platform(pygame.sprite.Sprite):
+    # (platform type, biome, width, height, overlay surface) -> composed surface shared by instances
+    _surface_cache = {}
+
     def __init__(self, x, y, width, height, platform_type='normal', biome_type='grass', overlays=None):
         super().__init__()
         self.platform_type = platform_type
@@ -89,9 +92,8 @@ class Platform(pygame.sprite.Sprite):
         self.update_appearance()
 
     def _draw_platform(self):
-        """Draw the platform with appropriate tiles and effects."""
-        # Clear the surface
-        self.image.fill((0, 0, 0, 0))
+        """Compose a new surface with the platform's tiles and biome effects."""
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         # Get base tiles based on platform type and biome
         biome_suffix = f'_{self.biome_type}' if self.biome_type in ['grass', 'lava', 'tech', 'ice', 'forest'] else ''
@@ -107,34 +109,35 @@ class Platform(pygame.sprite.Sprite):
             if not tile:
                 tile = None  # TODO: Replace with new tile system
             if tile:
-                self.image.blit(tile, (0, 0))
+                image.blit(tile, (0, 0))
         else:
             # Multi-tile platform
             # Left edge
             left_tile = self._get_platform_tile('left', type_suffix, biome_suffix)
             if left_tile:
-                self.image.blit(left_tile, (0, 0))
+                image.blit(left_tile, (0, 0))
             
             # Middle tiles
             middle_tile = self._get_platform_tile('middle', type_suffix, biome_suffix)
             if middle_tile:
                 for x in range(32, self.width - 32, 32):
-                    self.image.blit(middle_tile, (x, 0))
+                    image.blit(middle_tile, (x, 0))
             
             # Right edge
             right_tile = self._get_platform_tile('right', type_suffix, biome_suffix)
             if right_tile:
-                self.image.blit(right_tile, (self.width - 32, 0))
+                image.blit(right_tile, (self.width - 32, 0))
         
         # Apply biome-specific effects
         if self.biome_type in self.biome_tints:
             tint_color, tint_strength = self.biome_tints[self.biome_type]
-            self.image = apply_tint(self.image, tint_color, tint_strength)
+            image = apply_tint(image, tint_color, tint_strength)
         
         # Apply biome-specific overlay
         overlay_type = self.biome_overlay_types.get(self.biome_type)
         if overlay_type and overlay_type in self.overlays:
-            self.image = apply_overlay(self.image, self.overlays[overlay_type], alpha=150)
+            image = apply_overlay(image, self.overlays[overlay_type], alpha=150)
+        return image
 
     def _get_platform_tile(self, position, type_suffix, biome_suffix):
         """Helper method to get platform tiles with fallback options."""
@@ -147,14 +150,30 @@ class Platform(pygame.sprite.Sprite):
         return tile
 
     def update_appearance(self):
-        """Update the platform's visual appearance based on its type."""
-        self._draw_platform()
-        
+        """Update the platform's visual appearance based on its type.
+
+        Platforms with the same type, biome, size and overlay share one
+        composed surface; only a flashing platform gets its own copy.
+        """
+        overlay = self.overlays.get(self.biome_overlay_types.get(self.biome_type))
+        key = (self.platform_type, self.biome_type, self.width, self.height, overlay)
+        surface = Platform._surface_cache.get(key)
+        if surface is None:
+            surface = self._draw_platform()
+            surface.set_alpha(255)
+            Platform._surface_cache[key] = surface
+
         # Add hit flash effect
         if self.hit_flash > 0:
+            self.image = surface.copy()
             self.image.set_alpha(128)
         else:
-            self.image.set_alpha(255)
+            self.image = surface
+
+    @classmethod
+    def clear_surface_cache(cls):
+        """Drop all composed surfaces, e.g. after tiles or overlays are reloaded."""
+        cls._surface_cache.clear()
 
     def add_particles(self, count):
         """Add particles for visual effects."""
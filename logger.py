@@ -1,4 +1,33 @@
 import logging
+import traceback
+from typing import Any, Dict, Tuple
 
 logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger("game") 
\ No newline at end of file
+logger = logging.getLogger("game")
+
+# (message, args, exception type, file, line) -> times log_exception_once() saw it
+_exception_counts: Dict[Tuple[Any, ...], int] = {}
+
+def log_exception_once(exc: BaseException, message: str, *args: Any) -> None:
+    """Log an exception with its traceback the first time it is raised from a site.
+
+    message and args are formatted %-style, like the logger's own methods.
+    Repeats of the same message, args and exception type from the same
+    line are only counted; the count is logged, without a traceback, each
+    time it reaches a power of two.
+    """
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    if tb is None:
+        site = ("", 0)
+    else:
+        site = (tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+    key = (message, args, type(exc).__name__) + site
+    count = _exception_counts.get(key, 0) + 1
+    _exception_counts[key] = count
+    if count == 1:
+        logger.error(message + ": %s", *args, exc)
+        logger.error("%s", "".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+    elif count & (count - 1) == 0:
+        logger.error(message + ": %s (repeated %d times)", *args, exc, count)
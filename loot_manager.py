@@ -278,10 +278,19 @@ loot_manager = LootManager()
 # --- Tooltip Renderer (Bonus) ---
 import pygame
 
+_tooltip_font: Optional[pygame.font.Font] = None  # Default tooltip font, created on first use
+
+def _get_tooltip_font() -> pygame.font.Font:
+    """Get the shared default tooltip font; SysFont lookups are too slow to repeat per draw."""
+    global _tooltip_font
+    if _tooltip_font is None:
+        _tooltip_font = pygame.font.SysFont('arial', 16)
+    return _tooltip_font
+
 def render_tooltip(surface: pygame.Surface, text: str, pos: Tuple[int, int], font: Optional[pygame.font.Font] = None, padding: int = 6, color: Tuple[int, int, int] = (30, 30, 30), text_color: Tuple[int, int, int] = (255, 255, 255)):
     """Render a tooltip (text bubble) above loot or on hover."""
     if font is None:
-        font = pygame.font.SysFont('arial', 16)
+        font = _get_tooltip_font()
     lines = text.split('\n')
     rendered_lines = [font.render(line, True, text_color) for line in lines]
     width = max(line.get_width() for line in rendered_lines) + 2 * padding
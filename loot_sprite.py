@@ -54,12 +54,21 @@ class LootSprite(pygame.sprite.Sprite):
         self.kill()
 
 class LootTooltip:
+    _fonts = None  # Shared (body, title) fonts, created on first use
+
     def __init__(self, loot, font=None):
         self.loot = loot
-        self.font = font or pygame.font.SysFont('arial', 18)
-        self.title_font = pygame.font.SysFont('arial', 22, bold=True)
+        body_font, self.title_font = self._get_fonts()
+        self.font = font or body_font
         self.surface = self.render_tooltip()
 
+    @classmethod
+    def _get_fonts(cls):
+        """Get the shared body and title fonts, looking them up only once."""
+        if cls._fonts is None:
+            cls._fonts = (pygame.font.SysFont('arial', 18), pygame.font.SysFont('arial', 22, bold=True))
+        return cls._fonts
+
     def render_tooltip(self):
         # Colors by rarity
         rarity_colors = {
@@ -147,7 +147,7 @@ class Game:
                 self.logger.info("PhysicsSystem initialized successfully")
                 
                 # Initialize CollisionSystem
-                self.collision = CollisionSystem()
+                self.collision = CollisionSystem(self.entity_manager)
                 self.logger.info("CollisionSystem initialized successfully")
                 
                 # Initialize BulletSystem
@@ -582,6 +582,7 @@ class Game:
         
         # Update systems
         self.physics_system.update(delta_time)
+        self.entity_manager.update(delta_time)
         self.collision.update(delta_time)
         self.bullet_system.update(delta_time)
         self.enemy_system.update(delta_time)
@@ -3,6 +3,8 @@ Physics system for handling game physics.
 """
 from typing import List
 from entities import Entity
+from ecs.transform_store import transform_store
+from ecs.physics_store import physics_store
 
 class PhysicsSystem:
     """Handles physics calculations and updates."""
@@ -22,6 +24,11 @@ class PhysicsSystem:
     
     def update(self, delta_time: float):
         """Update physics for all entities."""
+        # Update every physics velocity, then move every entity with a velocity,
+        # each in one pass over its store
+        physics_store.step(delta_time)
+        transform_store.integrate(delta_time)
+
         for entity in self.entities:
             # Update entity physics here
             pass 
\ No newline at end of file
@@ -130,7 +130,7 @@ class Renderer:
             
             # Sort entities by layer
             self.layers.clear()
-            for entity_id, entity in entity_manager.entities.items():
+            for entity in entity_manager.get_all_entities():
                 if not entity.active:
                     continue
                     
@@ -286,7 +286,7 @@ class Renderer:
                 world_manager.chunk_manager.draw(surface)
             
             # Render entities
-            for entity_id, entity in entity_manager.entities.items():
+            for entity in entity_manager.get_all_entities():
                 if not entity.active:
                     continue
                 sprite = entity.get_component(SpriteComponent)
@@ -5,7 +5,7 @@ from typing import Dict, List, Tuple, Optional, Any, Callable, Type
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import pygame
-from entities import Entity, Component
+from entities import Entity, EntityState, Component
 from logger import logger
 import traceback
 
@@ -1,7 +1,11 @@
+from .aabb_tree import AABBTree
 from .bullet_system import BulletSystem
+from .spatial_grid import SpatialGrid
 from .zone_entity_spawner import ZoneEntitySpawner
 
 __all__ = [
+    'AABBTree',
     'BulletSystem',
+    'SpatialGrid',
     'ZoneEntitySpawner'
 ] 
\ No newline at end of file
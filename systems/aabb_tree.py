@@ -0,0 +1,391 @@
+"""
+Dynamic AABB tree for the static/slow collider broad-phase tier.
+"""
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Axis-aligned box as (left, top, right, bottom)
+AABB = Tuple[float, float, float, float]
+
+NULL_NODE = -1
+
+class AABBTree:
+    """Dynamic bounding volume tree over fattened AABBs.
+
+    Leaves store a "fat" box enlarged by a margin so that colliders which only
+    drift a little (bosses, turrets, terrain) never need to be reinserted.
+    Nodes live in flat lists indexed by node id, with a freelist for reuse.
+    """
+
+    def __init__(self, margin: float = 4.0):
+        """Initialize the tree.
+
+        Args:
+            margin: Default amount each leaf box is fattened by on every side
+        """
+        self.margin = margin
+        self.root = NULL_NODE
+
+        # Node storage (structure of arrays)
+        self._left: List[float] = []
+        self._top: List[float] = []
+        self._right: List[float] = []
+        self._bottom: List[float] = []
+        self._parent: List[int] = []
+        self._child1: List[int] = []
+        self._child2: List[int] = []
+        self._height: List[int] = []
+        self._ids: List[Optional[Hashable]] = []
+        self._free: List[int] = []
+
+        # Object id -> leaf node
+        self._leaves: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, obj_id: Hashable) -> bool:
+        return obj_id in self._leaves
+
+    def insert(self, obj_id: Hashable, aabb: AABB, margin: Optional[float] = None) -> None:
+        """Insert an object with the given box.
+
+        Args:
+            obj_id: Identifier of the object (e.g. entity id)
+            aabb: Tight bounding box of the object
+            margin: Fattening margin, defaults to the tree margin
+        """
+        if obj_id in self._leaves:
+            self.remove(obj_id)
+
+        leaf = self._allocate_node()
+        self._set_fat_box(leaf, aabb, self.margin if margin is None else margin)
+        self._ids[leaf] = obj_id
+        self._leaves[obj_id] = leaf
+        self._insert_leaf(leaf)
+
+    def remove(self, obj_id: Hashable) -> bool:
+        """Remove an object from the tree.
+
+        Returns:
+            bool: True if the object was in the tree
+        """
+        leaf = self._leaves.pop(obj_id, None)
+        if leaf is None:
+            return False
+        self._remove_leaf(leaf)
+        self._free_node(leaf)
+        return True
+
+    def update(self, obj_id: Hashable, aabb: AABB, margin: Optional[float] = None) -> bool:
+        """Update an object's box, reinserting only if it left its fat box.
+
+        Objects that are not yet in the tree are inserted.
+
+        Returns:
+            bool: True if the tree structure changed
+        """
+        leaf = self._leaves.get(obj_id)
+        if leaf is None:
+            self.insert(obj_id, aabb, margin)
+            return True
+
+        left, top, right, bottom = aabb
+        if (self._left[leaf] <= left and self._top[leaf] <= top and
+                right <= self._right[leaf] and bottom <= self._bottom[leaf]):
+            return False
+
+        self._remove_leaf(leaf)
+        self._set_fat_box(leaf, aabb, self.margin if margin is None else margin)
+        self._insert_leaf(leaf)
+        return True
+
+    def query(self, aabb: AABB) -> List[Hashable]:
+        """Get the ids of all objects whose fat box overlaps the given box."""
+        results = []
+        if self.root == NULL_NODE:
+            return results
+
+        left, top, right, bottom = aabb
+        node_left = self._left
+        node_top = self._top
+        node_right = self._right
+        node_bottom = self._bottom
+        child1 = self._child1
+        child2 = self._child2
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if (node_right[node] < left or right < node_left[node] or
+                    node_bottom[node] < top or bottom < node_top[node]):
+                continue
+            if child1[node] == NULL_NODE:
+                results.append(self._ids[node])
+            else:
+                stack.append(child1[node])
+                stack.append(child2[node])
+        return results
+
+    def get_ids(self) -> List[Hashable]:
+        """Get the ids of all objects in the tree."""
+        return list(self._leaves)
+
+    def get_fat_aabb(self, obj_id: Hashable) -> Optional[AABB]:
+        """Get the fattened box stored for an object."""
+        leaf = self._leaves.get(obj_id)
+        if leaf is None:
+            return None
+        return (self._left[leaf], self._top[leaf], self._right[leaf], self._bottom[leaf])
+
+    def get_height(self) -> int:
+        """Get the height of the tree (0 for a single leaf or empty tree)."""
+        if self.root == NULL_NODE:
+            return 0
+        return self._height[self.root]
+
+    def clear(self) -> None:
+        """Remove all objects from the tree."""
+        self.__init__(self.margin)
+
+    def _allocate_node(self) -> int:
+        """Get a fresh node from the freelist or grow the storage."""
+        if self._free:
+            node = self._free.pop()
+        else:
+            node = len(self._parent)
+            self._left.append(0.0)
+            self._top.append(0.0)
+            self._right.append(0.0)
+            self._bottom.append(0.0)
+            self._parent.append(NULL_NODE)
+            self._child1.append(NULL_NODE)
+            self._child2.append(NULL_NODE)
+            self._height.append(0)
+            self._ids.append(None)
+
+        self._parent[node] = NULL_NODE
+        self._child1[node] = NULL_NODE
+        self._child2[node] = NULL_NODE
+        self._height[node] = 0
+        self._ids[node] = None
+        return node
+
+    def _free_node(self, node: int) -> None:
+        """Return a node to the freelist."""
+        self._ids[node] = None
+        self._height[node] = -1
+        self._free.append(node)
+
+    def _set_fat_box(self, node: int, aabb: AABB, margin: float) -> None:
+        left, top, right, bottom = aabb
+        self._left[node] = left - margin
+        self._top[node] = top - margin
+        self._right[node] = right + margin
+        self._bottom[node] = bottom + margin
+
+    def _union_into(self, node: int, a: int, b: int) -> None:
+        """Set a node's box to the union of two other nodes' boxes."""
+        self._left[node] = min(self._left[a], self._left[b])
+        self._top[node] = min(self._top[a], self._top[b])
+        self._right[node] = max(self._right[a], self._right[b])
+        self._bottom[node] = max(self._bottom[a], self._bottom[b])
+
+    def _perimeter(self, node: int) -> float:
+        return 2.0 * ((self._right[node] - self._left[node]) + (self._bottom[node] - self._top[node]))
+
+    def _union_perimeter(self, a: int, b: int) -> float:
+        width = max(self._right[a], self._right[b]) - min(self._left[a], self._left[b])
+        height = max(self._bottom[a], self._bottom[b]) - min(self._top[a], self._top[b])
+        return 2.0 * (width + height)
+
+    def _insert_leaf(self, leaf: int) -> None:
+        """Insert a leaf using the surface area heuristic to pick a sibling."""
+        if self.root == NULL_NODE:
+            self.root = leaf
+            self._parent[leaf] = NULL_NODE
+            return
+
+        child1 = self._child1
+        child2 = self._child2
+
+        # Find the best sibling for the new leaf
+        index = self.root
+        while child1[index] != NULL_NODE:
+            c1 = child1[index]
+            c2 = child2[index]
+
+            area = self._perimeter(index)
+            combined_area = self._union_perimeter(index, leaf)
+
+            # Cost of creating a new parent for this node and the new leaf
+            cost = 2.0 * combined_area
+
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance_cost = 2.0 * (combined_area - area)
+
+            cost1 = self._union_perimeter(leaf, c1) + inheritance_cost
+            if child1[c1] != NULL_NODE:
+                cost1 -= self._perimeter(c1)
+
+            cost2 = self._union_perimeter(leaf, c2) + inheritance_cost
+            if child1[c2] != NULL_NODE:
+                cost2 -= self._perimeter(c2)
+
+            if cost < cost1 and cost < cost2:
+                break
+
+            index = c1 if cost1 < cost2 else c2
+
+        sibling = index
+
+        # Create a new parent for the sibling and the leaf
+        old_parent = self._parent[sibling]
+        new_parent = self._allocate_node()
+        self._parent[new_parent] = old_parent
+        self._union_into(new_parent, leaf, sibling)
+        self._height[new_parent] = self._height[sibling] + 1
+
+        if old_parent != NULL_NODE:
+            if child1[old_parent] == sibling:
+                child1[old_parent] = new_parent
+            else:
+                child2[old_parent] = new_parent
+        else:
+            self.root = new_parent
+
+        child1[new_parent] = sibling
+        child2[new_parent] = leaf
+        self._parent[sibling] = new_parent
+        self._parent[leaf] = new_parent
+
+        # Walk back up the tree fixing heights and boxes
+        self._refit(self._parent[leaf])
+
+    def _remove_leaf(self, leaf: int) -> None:
+        """Detach a leaf from the tree, collapsing its parent."""
+        if leaf == self.root:
+            self.root = NULL_NODE
+            return
+
+        parent = self._parent[leaf]
+        grand_parent = self._parent[parent]
+        if self._child1[parent] == leaf:
+            sibling = self._child2[parent]
+        else:
+            sibling = self._child1[parent]
+
+        if grand_parent != NULL_NODE:
+            # Connect the sibling to the grand parent and drop the parent
+            if self._child1[grand_parent] == parent:
+                self._child1[grand_parent] = sibling
+            else:
+                self._child2[grand_parent] = sibling
+            self._parent[sibling] = grand_parent
+            self._free_node(parent)
+            self._refit(grand_parent)
+        else:
+            self.root = sibling
+            self._parent[sibling] = NULL_NODE
+            self._free_node(parent)
+
+        self._parent[leaf] = NULL_NODE
+
+    def _refit(self, index: int) -> None:
+        """Rebalance and recompute boxes from a node up to the root."""
+        while index != NULL_NODE:
+            index = self._balance(index)
+            c1 = self._child1[index]
+            c2 = self._child2[index]
+            self._height[index] = 1 + max(self._height[c1], self._height[c2])
+            self._union_into(index, c1, c2)
+            index = self._parent[index]
+
+    def _balance(self, a: int) -> int:
+        """Perform a left or right rotation if node A is imbalanced.
+
+        Returns:
+            int: The new root of the subtree
+        """
+        child1 = self._child1
+        child2 = self._child2
+        parent = self._parent
+        height = self._height
+
+        if child1[a] == NULL_NODE or height[a] < 2:
+            return a
+
+        b = child1[a]
+        c = child2[a]
+        balance = height[c] - height[b]
+
+        # Rotate C up
+        if balance > 1:
+            f = child1[c]
+            g = child2[c]
+
+            child1[c] = a
+            parent[c] = parent[a]
+            parent[a] = c
+
+            if parent[c] != NULL_NODE:
+                if child1[parent[c]] == a:
+                    child1[parent[c]] = c
+                else:
+                    child2[parent[c]] = c
+            else:
+                self.root = c
+
+            if height[f] > height[g]:
+                child2[c] = f
+                child2[a] = g
+                parent[g] = a
+                self._union_into(a, b, g)
+                self._union_into(c, a, f)
+                height[a] = 1 + max(height[b], height[g])
+                height[c] = 1 + max(height[a], height[f])
+            else:
+                child2[c] = g
+                child2[a] = f
+                parent[f] = a
+                self._union_into(a, b, f)
+                self._union_into(c, a, g)
+                height[a] = 1 + max(height[b], height[f])
+                height[c] = 1 + max(height[a], height[g])
+            return c
+
+        # Rotate B up
+        if balance < -1:
+            d = child1[b]
+            e = child2[b]
+
+            child1[b] = a
+            parent[b] = parent[a]
+            parent[a] = b
+
+            if parent[b] != NULL_NODE:
+                if child1[parent[b]] == a:
+                    child1[parent[b]] = b
+                else:
+                    child2[parent[b]] = b
+            else:
+                self.root = b
+
+            if height[d] > height[e]:
+                child2[b] = d
+                child1[a] = e
+                parent[e] = a
+                self._union_into(a, c, e)
+                self._union_into(b, a, d)
+                height[a] = 1 + max(height[c], height[e])
+                height[b] = 1 + max(height[a], height[d])
+            else:
+                child2[b] = e
+                child1[a] = d
+                parent[d] = a
+                self._union_into(a, c, d)
+                self._union_into(b, a, e)
+                height[a] = 1 + max(height[c], height[d])
+                height[b] = 1 + max(height[a], height[e])
+            return b
+
+        return a
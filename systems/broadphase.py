@@ -0,0 +1,52 @@
+"""
+Sweep-and-prune broad phase over packed axis-aligned bounding boxes.
+"""
+from typing import Optional, Tuple
+import numpy as np
+
+def overlapping_pairs(xyxy: np.ndarray, layers: Optional[np.ndarray] = None,
+                      masks: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Find every pair of boxes that overlap and may collide.
+
+    Boxes are sorted by left edge once; each box is then only paired with
+    the boxes whose left edge lies before its right edge, found with one
+    searchsorted call, so the work is O(N log N + candidates) instead of
+    O(N^2). Edges that merely touch do not overlap, as with
+    pygame.Rect.colliderect().
+
+    Args:
+        xyxy: float64 array of shape (N, 4) with each box's left, top, right, bottom
+        layers: Optional int64 array with each box's collision layer bits
+        masks: Optional int64 array with the layer bits each box collides with;
+            a pair is kept when either box's layer is in the other's mask
+
+    Returns:
+        Tuple: int64 index arrays (a, b) with a < b, sorted by a then b
+    """
+    n = xyxy.shape[0]
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 2:
+        return empty, empty
+    order = np.argsort(xyxy[:, 0], kind='stable')
+    left = xyxy[order, 0]
+    # Sorted positions k + 1 .. ends[k] - 1 start left of box k's right edge
+    ends = np.searchsorted(left, xyxy[order, 2], side='left')
+    counts = np.maximum(ends - np.arange(1, n + 1), 0)
+    total = int(counts.sum())
+    if total == 0:
+        return empty, empty
+    first = np.repeat(np.arange(n), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    a = order[first]
+    b = order[first + 1 + offsets]
+
+    keep = ((xyxy[a, 0] < xyxy[b, 2]) & (xyxy[b, 0] < xyxy[a, 2]) &
+            (xyxy[a, 1] < xyxy[b, 3]) & (xyxy[b, 1] < xyxy[a, 3]))
+    if layers is not None and masks is not None:
+        keep &= ((layers[a] & masks[b]) != 0) | ((layers[b] & masks[a]) != 0)
+    a = a[keep]
+    b = b[keep]
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    pair_order = np.lexsort((hi, lo))
+    return lo[pair_order], hi[pair_order]
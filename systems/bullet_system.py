@@ -1,6 +1,6 @@
 from typing import List, Optional
 from entities import EntityType
-from components import TransformComponent, VelocityComponent, LifetimeComponent
+from components import LifetimeComponent, BulletComponent
 
 class BulletSystem:
     """System for processing bullet entities."""
@@ -10,20 +10,24 @@ class BulletSystem:
         self.entity_manager = entity_manager
 
     def update(self, delta_time: float):
-        """Update all bullet entities."""
+        """Update all bullet entities.
+
+        Bullet movement happens in PhysicsSystem, which integrates every
+        velocity in the transform store at once.
+        """
         for entity in self.entity_manager.get_entities_by_type(EntityType.BULLET):
-            # Get required components
-            transform = entity.get_component(TransformComponent)
-            velocity = entity.get_component(VelocityComponent)
             lifetime = entity.get_component(LifetimeComponent)
 
-            # Update position if both transform and velocity exist
-            if transform and velocity:
-                transform.x += velocity.vx * delta_time
-                transform.y += velocity.vy * delta_time
-
             # Check lifetime and remove if expired
             if lifetime:
                 lifetime.frames_left -= 1
                 if lifetime.frames_left <= 0:
-                    self.entity_manager.remove_entity(entity.id) 
\ No newline at end of file
+                    self._remove_bullet(entity)
+
+    def _remove_bullet(self, entity):
+        """Remove a bullet entity and recycle its bullet component."""
+        bullet = entity.get_component(BulletComponent)
+        if bullet:
+            entity.remove_component("BulletComponent")
+            BulletComponent.release(bullet)
+        self.entity_manager.remove_entity(entity.id) 
\ No newline at end of file
@@ -1,25 +1,56 @@
 import pygame
+import numpy as np
 from typing import List, Tuple
+from systems.broadphase import overlapping_pairs
 
 class CollisionSystem:
-    def __init__(self):
+    def __init__(self, entity_manager=None):
         self.collision_groups = {}
+        self.entity_manager = entity_manager
 
     def update(self, delta_time: float):
         """Update collision checks for all entities with collision components."""
         # Get all entities with collision components
         entities = self.get_entities_with_collision()
-        
-        # Check collisions between entities
-        for i, entity1 in enumerate(entities):
-            for entity2 in entities[i+1:]:
-                if self.check_collision(entity1, entity2):
-                    self.handle_collision(entity1, entity2)
+        if len(entities) < 2:
+            return
+
+        # Broad phase over packed boxes, then the narrow check per candidate pair
+        xyxy, layers, masks = self.pack_bounds(entities)
+        first, second = overlapping_pairs(xyxy, layers, masks)
+        for i, j in zip(first.tolist(), second.tolist()):
+            entity1 = entities[i]
+            entity2 = entities[j]
+            if self.check_collision(entity1, entity2):
+                self.handle_collision(entity1, entity2)
 
     def get_entities_with_collision(self) -> List:
-        """Get all entities that have collision components."""
-        # TODO: Implement entity filtering
-        return []
+        """Get all active entities that have collision components."""
+        if self.entity_manager is None:
+            return []
+        return [entity for entity in self.entity_manager.world.entities_with("Collision") if entity.active]
+
+    @staticmethod
+    def pack_bounds(entities: List) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gather each entity's components.CollisionComponent box, layer and mask into arrays.
+
+        Returns:
+            Tuple: (N, 4) float64 left/top/right/bottom boxes, int64 layers and int64 masks
+        """
+        n = len(entities)
+        xyxy = np.empty((n, 4), dtype=np.float64)
+        layers = np.empty(n, dtype=np.int64)
+        masks = np.empty(n, dtype=np.int64)
+        for i, entity in enumerate(entities):
+            collision = entity.get_component("Collision")
+            transform = entity.transform
+            # entities.CollisionComponent shares the id but has no offsets
+            left = transform.x + getattr(collision, 'offset_x', 0.0)
+            top = transform.y + getattr(collision, 'offset_y', 0.0)
+            xyxy[i] = (left, top, left + collision.width, top + collision.height)
+            layers[i] = collision.collision_layer
+            masks[i] = collision.collision_mask
+        return xyxy, layers, masks
 
     def check_collision(self, entity1, entity2) -> bool:
         """Check if two entities are colliding."""
@@ -29,4 +60,4 @@ class CollisionSystem:
     def handle_collision(self, entity1, entity2):
         """Handle collision between two entities."""
         # TODO: Implement collision response
-        pass 
\ No newline at end of file
+        pass
@@ -0,0 +1,192 @@
+"""
+Gravity and platform collision resolution for many rects at once.
+"""
+from typing import Sequence, Tuple
+import numpy as np
+import pygame
+try:
+    from numba import njit
+except ImportError:  # Optional; resolve_platforms() narrows candidates with NumPy instead
+    njit = None
+
+# Codes written to the hits array, indexing the collision name they stand for
+HIT_NONE = 0
+HIT_HORIZONTAL = 1
+HIT_BOTTOM = 2
+HIT_TOP = 3
+HIT_NAMES = (None, 'horizontal', 'vertical_bottom', 'vertical_top')
+
+def _resolve(xs, ys, ws, hs, vxs, vys, gravities, max_fall, plat_xyxy,
+             on_ground, hits, counts):
+    """Apply gravity, then push each rect out of the platforms it overlaps.
+
+    A platform is resolved when it overlapped the rect before resolving
+    started and still overlaps it, the same candidates as a
+    collidelistall() sweep followed by a colliderect() recheck. The
+    smaller overlap picks the axis: horizontal hits reverse vx, vertical
+    hits zero vy and landing on top sets on_ground. Rects outside the
+    bounding box of all platforms only get gravity.
+    """
+    n_plat = plat_xyxy.shape[0]
+    bx0 = by0 = bx1 = by1 = 0
+    if n_plat:
+        bx0 = plat_xyxy[0, 0]
+        by0 = plat_xyxy[0, 1]
+        bx1 = plat_xyxy[0, 2]
+        by1 = plat_xyxy[0, 3]
+        for k in range(1, n_plat):
+            bx0 = min(bx0, plat_xyxy[k, 0])
+            by0 = min(by0, plat_xyxy[k, 1])
+            bx1 = max(bx1, plat_xyxy[k, 2])
+            by1 = max(by1, plat_xyxy[k, 3])
+    for i in range(xs.shape[0]):
+        x0 = xs[i]
+        y0 = ys[i]
+        w = ws[i]
+        h = hs[i]
+        x = x0
+        y = y0
+        vx = vxs[i]
+        vy = min(vys[i] + gravities[i], max_fall)
+        grounded = False
+        hit = HIT_NONE
+        count = 0
+        if n_plat == 0 or not (x0 < bx1 and x0 + w > bx0 and y0 < by1 and y0 + h > by0):
+            n_check = 0
+        else:
+            n_check = n_plat
+        for k in range(n_check):
+            left = plat_xyxy[k, 0]
+            top = plat_xyxy[k, 1]
+            right = plat_xyxy[k, 2]
+            bottom = plat_xyxy[k, 3]
+            if not (x0 < right and x0 + w > left and y0 < bottom and y0 + h > top):
+                continue
+            if not (x < right and x + w > left and y < bottom and y + h > top):
+                continue
+            # Calculate overlap
+            dx = min(x + w - left, right - x)
+            dy = min(y + h - top, bottom - y)
+            if dx < dy:
+                if x + w // 2 < (left + right) // 2:
+                    x = left - w
+                else:
+                    x = right
+                vx = -vx
+                hit = HIT_HORIZONTAL
+            else:
+                if y + h // 2 < (top + bottom) // 2:
+                    y = top - h
+                    grounded = True
+                    hit = HIT_BOTTOM
+                else:
+                    y = bottom
+                    hit = HIT_TOP
+                vy = 0.0
+            count += 1
+        xs[i] = x
+        ys[i] = y
+        vxs[i] = vx
+        vys[i] = vy
+        on_ground[i] = grounded
+        hits[i] = hit
+        counts[i] = count
+
+_resolve_kernel = njit(cache=True, fastmath=True)(_resolve) if njit is not None else None
+
+def resolve_platforms(xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray,
+                      vxs: np.ndarray, vys: np.ndarray, gravities: np.ndarray,
+                      max_fall: float, plat_xyxy: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Apply gravity to every rect and resolve it against platforms.
+
+    xs, ys, vxs and vys are updated in place.
+
+    Args:
+        xs, ys, ws, hs: int64 arrays with each rect's position and size
+        vxs, vys: float64 arrays with each rect's velocity
+        gravities: float64 array with the gravity added to each vy
+        max_fall: Largest downward velocity gravity can reach
+        plat_xyxy: int32 array of shape (P, 4) with each platform's left, top, right, bottom
+
+    Returns:
+        Tuple: Per-rect on_ground flags, HIT_* codes of the last collision and collision counts
+    """
+    n = xs.shape[0]
+    on_ground = np.zeros(n, dtype=np.bool_)
+    hits = np.zeros(n, dtype=np.int8)
+    counts = np.zeros(n, dtype=np.int32)
+    if n == 0:
+        return on_ground, hits, counts
+    if _resolve_kernel is not None:
+        _resolve_kernel(xs, ys, ws, hs, vxs, vys, gravities, float(max_fall), plat_xyxy,
+                        on_ground, hits, counts)
+        return on_ground, hits, counts
+
+    # Gravity for everyone, then the scalar resolver only for rects touching a platform
+    np.minimum(vys + gravities, max_fall, out=vys)
+    if plat_xyxy.shape[0] == 0:
+        return on_ground, hits, counts
+    left, top, right, bottom = (plat_xyxy[:, j] for j in range(4))
+    # Only rects inside the platforms' bounding box get a row in the overlap matrix
+    near = np.flatnonzero((xs < right.max()) & (xs + ws > left.min()) &
+                          (ys < bottom.max()) & (ys + hs > top.min()))
+    if near.size == 0:
+        return on_ground, hits, counts
+    nx = xs[near]
+    ny = ys[near]
+    overlap = ((nx[:, None] < right) & ((nx + ws[near])[:, None] > left) &
+               (ny[:, None] < bottom) & ((ny + hs[near])[:, None] > top))
+    no_gravity = np.zeros(1, dtype=np.float64)
+    for row in np.flatnonzero(overlap.any(axis=1)).tolist():
+        i = int(near[row])
+        s = slice(i, i + 1)
+        _resolve(xs[s], ys[s], ws[s], hs[s], vxs[s], vys[s], no_gravity, max_fall,
+                 plat_xyxy[overlap[row]], on_ground[s], hits[s], counts[s])
+    return on_ground, hits, counts
+
+def resolve_platform_rect(rect: pygame.Rect, vx: float, vy: float, gravity: float, max_fall: float,
+                          platforms: Sequence[pygame.Rect]) -> Tuple[float, float, bool, int, int]:
+    """Apply gravity to one rect and resolve it against platforms.
+
+    The same rules as resolve_platforms(), without building arrays for a
+    single rect: candidates come from one collidelistall() call. rect is
+    moved in place.
+
+    Args:
+        rect: Rect to resolve
+        vx, vy: The rect's velocity
+        gravity: Gravity added to vy
+        max_fall: Largest downward velocity gravity can reach
+        platforms: Platform rects
+
+    Returns:
+        Tuple: New vx and vy, on_ground flag, HIT_* code of the last collision and collision count
+    """
+    vy = min(vy + gravity, max_fall)
+    on_ground = False
+    hit = HIT_NONE
+    count = 0
+    for index in rect.collidelistall(platforms):
+        platform = platforms[index]
+        if not rect.colliderect(platform):
+            continue
+        dx = min(rect.right - platform.left, platform.right - rect.left)
+        dy = min(rect.bottom - platform.top, platform.bottom - rect.top)
+        if dx < dy:
+            if rect.centerx < platform.centerx:
+                rect.right = platform.left
+            else:
+                rect.left = platform.right
+            vx = -vx
+            hit = HIT_HORIZONTAL
+        else:
+            if rect.centery < platform.centery:
+                rect.bottom = platform.top
+                on_ground = True
+                hit = HIT_BOTTOM
+            else:
+                rect.top = platform.bottom
+                hit = HIT_TOP
+            vy = 0.0
+        count += 1
+    return float(vx), float(vy), on_ground, hit, count
@@ -0,0 +1,114 @@
+"""
+Uniform spatial hash grid for broad-phase proximity queries.
+"""
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Grid cell coordinates; rects are anything with left/top/right/bottom (e.g. pygame.Rect)
+Cell = Tuple[int, int]
+
+class SpatialGrid:
+    """Buckets items by the fixed-size cells their rectangles overlap.
+
+    Queries only visit the cells a rectangle (or circle) covers, so finding
+    nearby platforms or enemies costs O(items per cell) instead of a scan
+    over every item. Dynamic items are cleared and reinserted once per
+    frame; static items are inserted once when their zone loads.
+    """
+
+    def __init__(self, cell: int = 64):
+        """Initialize the grid.
+
+        Args:
+            cell: Width and height of a grid cell in pixels
+        """
+        self.cell = cell
+        self.cells: Dict[Cell, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def clear(self) -> None:
+        """Remove every item from the grid."""
+        self.cells.clear()
+
+    def cell_range(self, rect: Any) -> Tuple[int, int, int, int]:
+        """Get the inclusive (x0, y0, x1, y1) range of cells a rectangle overlaps."""
+        cell = self.cell
+        # right/bottom are exclusive, so a rect ending on a cell edge stays out of the next cell
+        return (int(rect.left // cell), int(rect.top // cell),
+                int((rect.right - 1) // cell), int((rect.bottom - 1) // cell))
+
+    def insert(self, item: Any, rect: Any) -> None:
+        """Add an item to every cell its rectangle overlaps."""
+        cells = self.cells
+        x0, y0, x1, y1 = self.cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def remove(self, item: Any, rect: Any) -> None:
+        """Remove an item from the cells its rectangle overlaps."""
+        cells = self.cells
+        x0, y0, x1, y1 = self.cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                try:
+                    bucket.remove(item)
+                except ValueError:
+                    continue
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def cells_overlapping(self, rect: Any) -> Iterator[List[Any]]:
+        """Yield the occupied cell buckets a rectangle overlaps."""
+        cells = self.cells
+        x0, y0, x1, y1 = self.cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query(self, rect: Any) -> List[Any]:
+        """Get the items sharing a cell with a rectangle, each listed once."""
+        found = []
+        seen = set()
+        for bucket in self.cells_overlapping(rect):
+            for item in bucket:
+                key = id(item)
+                if key not in seen:
+                    seen.add(key)
+                    found.append(item)
+        return found
+
+    def iter_radius(self, x: float, y: float, radius: float) -> Iterator[Any]:
+        """Lazily yield the items in cells within radius of a point.
+
+        Items spanning several cells are yielded once per cell. Use this for
+        any()-style checks that can stop at the first hit.
+        """
+        cell = self.cell
+        cells = self.cells
+        for cx in range(int((x - radius) // cell), int((x + radius) // cell) + 1):
+            for cy in range(int((y - radius) // cell), int((y + radius) // cell) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Any]:
+        """Get the items in cells within radius of a point, each listed once."""
+        found = []
+        seen = set()
+        for item in self.iter_radius(x, y, radius):
+            key = id(item)
+            if key not in seen:
+                seen.add(key)
+                found.append(item)
+        return found
@@ -22,6 +22,12 @@ def test_bullet_initialization(bullet):
     assert bullet.damage == 10
     assert bullet.velocity_x != 0 or bullet.velocity_y != 0
 
+def test_bullet_images_shared(bullet):
+    other = Bullet(5, 5, 0, 1, 10)
+    assert other.image is bullet.image
+    assert other.rect.topleft == (5, 5)
+    assert Bullet(5, 5, 0, 1, 10, is_enemy=True).image is not bullet.image
+
 def test_bullet_movement(bullet, world_manager):
     initial_x = bullet.rect.x
     initial_y = bullet.rect.y
@@ -0,0 +1,68 @@
+"""
+Unit tests for the dynamic AABB tree.
+"""
+import random
+import unittest
+from systems.aabb_tree import AABBTree
+
+def _overlaps(a, b):
+    return not (a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1])
+
+class TestAABBTree(unittest.TestCase):
+    """Test cases for AABBTree."""
+
+    def test_insert_and_query(self):
+        """Test that queries return overlapping objects only."""
+        tree = AABBTree(margin=0.0)
+        tree.insert("a", (0, 0, 10, 10))
+        tree.insert("b", (100, 100, 110, 110))
+        self.assertEqual(tree.query((5, 5, 6, 6)), ["a"])
+        self.assertEqual(tree.query((200, 200, 210, 210)), [])
+        self.assertEqual(len(tree), 2)
+
+    def test_update_within_fat_box(self):
+        """Test that small moves do not reinsert the leaf."""
+        tree = AABBTree(margin=4.0)
+        tree.insert("boss", (0, 0, 32, 32))
+        self.assertFalse(tree.update("boss", (2, 2, 34, 34)))
+        self.assertTrue(tree.update("boss", (50, 50, 82, 82)))
+        self.assertEqual(tree.get_fat_aabb("boss"), (46, 46, 86, 86))
+
+    def test_remove(self):
+        """Test removing objects from the tree."""
+        tree = AABBTree()
+        tree.insert("a", (0, 0, 10, 10))
+        tree.insert("b", (0, 0, 10, 10))
+        self.assertTrue(tree.remove("a"))
+        self.assertFalse(tree.remove("a"))
+        self.assertEqual(tree.query((0, 0, 10, 10)), ["b"])
+        self.assertNotIn("a", tree)
+
+    def test_matches_brute_force(self):
+        """Test that queries match a brute force scan after many updates."""
+        rng = random.Random(42)
+        tree = AABBTree(margin=2.0)
+        boxes = {}
+        for i in range(200):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            boxes[i] = (x, y, x + 32, y + 32)
+            tree.insert(i, boxes[i])
+        for i in range(0, 200, 3):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            boxes[i] = (x, y, x + 32, y + 32)
+            tree.update(i, boxes[i])
+        for i in range(0, 200, 7):
+            tree.remove(i)
+            del boxes[i]
+
+        # Balanced tree stays logarithmic
+        self.assertLess(tree.get_height(), 20)
+
+        for _ in range(50):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            query = (x, y, x + 64, y + 64)
+            expected = {i for i in boxes if _overlaps(tree.get_fat_aabb(i), query)}
+            self.assertEqual(set(tree.query(query)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Unit tests for the sweep-and-prune broad phase.
+"""
+import random
+import unittest
+import numpy as np
+import pygame
+from entities import CollisionComponent, Entity, EntityType
+from systems.broadphase import overlapping_pairs
+from systems.collision_system import CollisionSystem
+
+class TestOverlappingPairs(unittest.TestCase):
+    """Test cases for overlapping_pairs."""
+
+    def test_matches_colliderect(self):
+        """Test against pygame.Rect.colliderect on every pair of random boxes."""
+        rng = random.Random(3)
+        for _ in range(50):
+            rects = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300),
+                                 rng.randint(1, 60), rng.randint(1, 60)) for _ in range(40)]
+            xyxy = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.float64)
+            expected = [(i, j) for i in range(len(rects)) for j in range(i + 1, len(rects))
+                        if rects[i].colliderect(rects[j])]
+            a, b = overlapping_pairs(xyxy)
+            self.assertEqual(list(zip(a.tolist(), b.tolist())), expected)
+
+    def test_layer_masks(self):
+        """Test that a pair is dropped only when neither layer is in the other's mask."""
+        xyxy = np.array([(0, 0, 10, 10)] * 3, dtype=np.float64)
+        layers = np.array([1, 2, 4], dtype=np.int64)
+        masks = np.array([2, 0, 0], dtype=np.int64)
+        a, b = overlapping_pairs(xyxy, layers, masks)
+        self.assertEqual(list(zip(a.tolist(), b.tolist())), [(0, 1)])
+
+    def test_touching_and_single(self):
+        """Test that touching edges and lone boxes give no pairs."""
+        a, b = overlapping_pairs(np.array([(0, 0, 10, 10), (10, 0, 20, 10)], dtype=np.float64))
+        self.assertEqual(a.size + b.size, 0)
+        a, b = overlapping_pairs(np.zeros((1, 4)))
+        self.assertEqual(a.size, 0)
+
+    def test_pack_bounds_without_offsets(self):
+        """Test that entities.CollisionComponent, which has no offsets, packs at the transform."""
+        entity = Entity(EntityType.ENEMY)
+        entity.transform.x = 5.0
+        entity.add_component(CollisionComponent(entity, width=8.0, height=4.0))
+        xyxy, layers, masks = CollisionSystem.pack_bounds([entity])
+        self.assertEqual(xyxy.tolist(), [[5.0, 0.0, 13.0, 4.0]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Unit tests for BulletManager.
+"""
+import unittest
+from bullets import BulletManager
+from components import BulletComponent, TransformComponent, VelocityComponent
+from config import ENEMY_BULLET_SPEED
+from entity_manager import EntityManager
+
+class TestBulletManager(unittest.TestCase):
+    """Test cases for BulletManager."""
+
+    def test_batch_matches_single_spawn(self):
+        """Test that batched bullets get the same state as create_bullet."""
+        manager = BulletManager(EntityManager())
+        single = manager.create_bullet(10, 20, 3, 4, 5, is_enemy=True)
+        batch = manager.create_bullets_batch([10, 0], [20, 0], [3, 0], [4, 0], [5, 7], is_enemy=True)
+        self.assertEqual(len(batch), 2)
+
+        transform = batch[0].get_component(TransformComponent)
+        velocity = batch[0].get_component(VelocityComponent)
+        self.assertEqual((transform.x, transform.y), (10.0, 20.0))
+        self.assertAlmostEqual(velocity.vx, single.get_component(VelocityComponent).vx)
+        self.assertAlmostEqual(velocity.vy, ENEMY_BULLET_SPEED * 0.8)
+        self.assertEqual(batch[0].get_component(BulletComponent).damage, 5)
+
+        # A zero direction gives a stationary bullet
+        self.assertEqual(batch[1].get_component(VelocityComponent).vx, 0.0)
+        self.assertEqual(batch[1].get_component(BulletComponent).damage, 7)
+
+    def test_empty_batch(self):
+        """Test that an empty batch creates nothing."""
+        manager = BulletManager(EntityManager())
+        self.assertEqual(manager.create_bullets_batch([], [], [], [], []), [])
+
+if __name__ == '__main__':
+    unittest.main()
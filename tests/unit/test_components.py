@@ -1,13 +1,18 @@
 """
 Unit tests for various components.
 """
+import importlib.util
+import math
 import unittest
 from components import (
     TransformComponent,
     VelocityComponent,
     HealthComponent,
     StateComponent,
-    LootComponent
+    LootComponent,
+    BulletComponent,
+    CollisionComponent,
+    ZoneComponent
 )
 
 class DummyEntity:
@@ -52,6 +57,52 @@ class TestComponents(unittest.TestCase):
         loot = LootComponent(entity, ["gold", "potion"])
         self.assertIn("gold", loot.loot_table)
         self.assertIn("potion", loot.loot_table)
+    
+    def test_bullet_component_velocity(self):
+        """Test BulletComponent caches its velocity vector."""
+        entity = DummyEntity()
+        bullet = BulletComponent(entity, speed=10.0, direction=0.0)
+        self.assertAlmostEqual(bullet.vx, 10.0)
+        self.assertAlmostEqual(bullet.vy, 0.0)
+        bullet.direction = math.pi / 2
+        self.assertAlmostEqual(bullet.vx, 0.0)
+        self.assertAlmostEqual(bullet.vy, 10.0)
+    
+    def test_bullet_component_pool(self):
+        """Test released bullet components are reused by spawn."""
+        entity = DummyEntity()
+        bullet = BulletComponent.spawn(entity, speed=5.0, damage=1.0)
+        bullet.update(3.0)
+        self.assertFalse(bullet.active)
+        BulletComponent.release(bullet)
+        reused = BulletComponent.spawn(entity, speed=2.0, damage=4.0)
+        self.assertIs(reused, bullet)
+        self.assertTrue(reused.active)
+        self.assertEqual(reused.age, 0.0)
+        self.assertAlmostEqual(reused.vx, 2.0)
+    
+    @unittest.skipUnless(importlib.util.find_spec("msgspec"), "msgspec not installed")
+    def test_component_bytes_round_trip(self):
+        """Test msgpack serialization matches the dict round trip."""
+        entity = DummyEntity()
+        health = HealthComponent(entity, max_health=80.0)
+        health.take_damage(30.0)
+        collision = CollisionComponent(entity, width=16.0, height=8.0, is_static=True)
+        collision.offset_x = 2.0
+        for component in (health, collision):
+            restored = type(component).from_bytes(component.to_bytes(), entity)
+            self.assertEqual(restored.to_dict(), component.to_dict())
+
+    def test_generated_from_dict(self):
+        """Test the generated from_dict loaders round trip and apply defaults."""
+        entity = DummyEntity()
+        transform = TransformComponent(entity, 3.0, 4.0, rotation=90.0, scale_y=2.0)
+        restored = TransformComponent.from_dict(transform.to_dict(), DummyEntity())
+        self.assertEqual(restored.to_dict(), transform.to_dict())
+        self.assertEqual(TransformComponent.from_dict({}, DummyEntity()).scale_x, 1.0)
+
+        zone = ZoneComponent.from_dict({"zone_id": "z1", "triggered": True}, entity)
+        self.assertEqual(zone.to_dict(), {"zone_id": "z1", "is_active": True, "triggered": True})
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Unit tests for configuration management.
+"""
+import json
+import unittest
+from config import ConfigComponent, ConfigManager, _ReadThroughDict
+
+class TestReadThroughDict(unittest.TestCase):
+    """Test cases for the copy-on-write config data dict."""
+
+    def test_reads_share_default(self):
+        """Test that reads see the shared default without copying it."""
+        default = {"fps": 60, "vsync": True}
+        data = _ReadThroughDict(default)
+        self.assertEqual(data["fps"], 60)
+        self.assertEqual(data.get("missing", 1), 1)
+        self.assertIn("vsync", data)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(dict.__len__(data), 0)
+
+    def test_write_detaches(self):
+        """Test that the first write copies and leaves the default untouched."""
+        default = {"fps": 60, "vsync": True}
+        data = _ReadThroughDict(default)
+        data["fps"] = 30
+        self.assertEqual(data, {"fps": 30, "vsync": True})
+        self.assertEqual(default["fps"], 60)
+
+    def test_inequality_reads_through(self):
+        """Test that != compares the shared default, not the empty backing dict."""
+        data = _ReadThroughDict({"fps": 60})
+        self.assertFalse(data != {"fps": 60})
+        self.assertTrue(data != {})
+        self.assertIsNone(_ReadThroughDict.__hash__)
+
+    def test_component_serializes_shared_data(self):
+        """Test that to_dict emits the default values before any write."""
+        component = ConfigComponent(None, config_id="game", data=_ReadThroughDict({"fps": 60}))
+        self.assertEqual(json.loads(json.dumps(component.to_dict()))["data"], {"fps": 60})
+
+class TestConfigManager(unittest.TestCase):
+    """Test cases for ConfigManager."""
+
+    def test_values_round_trip(self):
+        """Test reading, writing, resetting and deleting config values."""
+        manager = ConfigManager()
+        entity = manager.create_config("game", "game", {"fps": 30})
+        self.assertIs(manager.get_config("game").get_component(ConfigComponent).entity, entity)
+        self.assertEqual(manager.get_value("game", "fps"), 30)
+
+        manager.set_value("game", "fps", 120)
+        self.assertEqual(manager.get_value("game", "fps"), 120)
+        manager.reset_config("game")
+        self.assertEqual(manager.get_value("game", "fps"), 60)
+
+        restored = ConfigManager.from_dict(manager.to_dict())
+        self.assertEqual(restored.get_value("game", "fps"), 60)
+
+        manager.delete_config("game")
+        self.assertEqual(manager.get_value("game", "fps", "missing"), "missing")
+
+    def test_data_allocated_on_first_write(self):
+        """Test that configs without data only get a dict when written."""
+        manager = ConfigManager()
+        manager.create_config("audio", "audio")
+        component = manager.get_config("audio").get_component(ConfigComponent)
+        self.assertIsNone(component.data)
+        self.assertEqual(manager.get_value("audio", "mute", False), False)
+        self.assertEqual(component.to_dict()["data"], {})
+        manager.set_value("audio", "mute", True)
+        self.assertEqual(component.data, {"mute": True})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Unit tests for EnemyManager's batched enemy arrays.
+"""
+import unittest
+import pygame
+import pytest
+from tests.test_config import init_pygame, cleanup_pygame
+from entities import Entity, EntityType
+
+# enemies pulls in the world generator, which needs noise and the assets package
+enemies = pytest.importorskip("enemies")
+
+def _make_enemy(x, y):
+    """Build a basic enemy without Enemy.__init__, which passes Entity arguments it does not take."""
+    enemy = enemies.Enemy.__new__(enemies.Enemy)
+    Entity.__init__(enemy, EntityType.ENEMY)
+    enemy.rect = pygame.Rect(x, y, 32, 32)
+    enemy.velocity_x = 0.0
+    enemy.velocity_y = 0.0
+    enemy._reset_state('basic', '')
+    return enemy
+
+class TestEnemyManagerArrays(unittest.TestCase):
+    """Test cases for EnemyManager's per-enemy arrays."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment."""
+        init_pygame()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test environment."""
+        cleanup_pygame()
+
+    def test_stat_changes_reach_arrays(self):
+        """Test that stats changed after spawning are regathered on the next sync."""
+        manager = enemies.EnemyManager(800, 600)
+        enemy = _make_enemy(100, 100)
+        manager._add_enemy(enemy)
+        manager._sync_arrays(manager.enemies)
+        enemy.max_health = 200
+        enemy.speed = 7.0
+        enemy.detection_range = 50
+        manager._sync_arrays(manager.enemies)
+        self.assertEqual(manager.flee_healths.tolist(), [200 * enemy.flee_health_threshold])
+        self.assertEqual(manager.speeds.tolist(), [7.0])
+        self.assertEqual(manager.ranges.tolist(), [50.0])
+
+if __name__ == '__main__':
+    unittest.main()
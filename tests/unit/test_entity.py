@@ -1,9 +1,15 @@
 """
 Unit tests for the Entity class.
 """
+import os
+import tempfile
 import unittest
+import pytest
 from tests.test_config import init_pygame, cleanup_pygame
-from entities import Entity, EntityType
+from components import HealthComponent, StateComponent
+from entities import Entity, EntityState, EntityType, tag_names
+from entity_manager import EntityManager
+from status_effects import EffectType, StatusEffectManager, StunEffect
 
 class TestEntity(unittest.TestCase):
     """Test cases for the Entity class."""
@@ -42,5 +48,101 @@ class TestEntityAdvanced(unittest.TestCase):
         entity = Entity(EntityType.ENEMY)
         self.assertEqual(entity.type.name, "ENEMY")
 
+    def test_ids_unique_across_reset(self):
+        """Test that new and reset entities never share an id."""
+        entities = [Entity(EntityType.BULLET) for _ in range(3)]
+        ids = {entity.id for entity in entities}
+        entities[0].reset()
+        ids.add(entities[0].id)
+        self.assertEqual(len(ids), 4)
+        self.assertTrue(entities[1].name.startswith("BULLET_"))
+
+    def test_update_sees_component_changes(self):
+        """Test that update() picks up components added or removed after a previous update."""
+        entity = Entity(EntityType.ENEMY)
+        entity.update(0.5)
+        health = HealthComponent(entity, 10)
+        health.invincible = True
+        health.invincible_timer = 1.0
+        entity.add_component(health)
+        entity.update(0.5)
+        self.assertEqual(health.invincible_timer, 0.5)
+        entity.remove_component("HealthComponent")
+        entity.update(0.5)
+        self.assertEqual(health.invincible_timer, 0.5)
+        self.assertEqual(entity.get_component(StateComponent).state_time, 1.5)
+
+    def test_update_skips_only_failing_component(self):
+        """Test that a raising component neither stops later components nor deactivates the entity."""
+        entity = Entity(EntityType.ENEMY)
+        health = HealthComponent(entity, 10)
+        health.set_invincible(1.0)
+        entity.add_component(health)
+        entity.get_component(StateComponent).state_time = None  # update() raises TypeError
+        with self.assertLogs("game", level="ERROR"):
+            entity.update(0.5)
+            entity.update(0.25)
+        self.assertTrue(entity.active)
+        self.assertEqual(health.invincible_timer, 0.25)
+
+    def test_save_formats(self):
+        """Test that save_to_file writes to_dict() as msgpack or JSON by extension."""
+        msgspec = pytest.importorskip("msgspec")
+        entity = Entity(EntityType.LOOT, "chest")
+        entity.add_tag("rare")
+        entity.zone_id = "zone_3"
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, decode in (("chest.json", msgspec.json.decode),
+                                 ("chest.msgpack", msgspec.msgpack.decode)):
+                path = os.path.join(tmp, name)
+                entity.save_to_file(path)
+                with open(path, 'rb') as f:
+                    self.assertEqual(decode(f.read()), entity.to_dict())
+
+    def test_from_dict_rebuilds_children(self):
+        """Test that from_dict restores nested children in their saved order."""
+        root = Entity(EntityType.PLAYER, "root")
+        for name in ("a", "b"):
+            child = Entity(EntityType.LOOT, name)
+            child.add_child(Entity(EntityType.EFFECT, name + "1"))
+            root.add_child(child)
+        loaded = Entity.from_dict(root.to_dict())
+        self.assertEqual([c.name for c in loaded.children], ["a", "b"])
+        self.assertEqual([c.children[0].name for c in loaded.children], ["a1", "b1"])
+        self.assertIs(loaded.children[1].children[0].parent, loaded.children[1])
+
+    def test_tags(self):
+        """Test adding, checking, removing and serializing tag bits."""
+        entity = Entity(EntityType.ENEMY)
+        entity.add_tag("flying")
+        entity.add_tag("elite")
+        entity.remove_tag("elite")
+        self.assertTrue(entity.has_tag("flying"))
+        self.assertFalse(entity.has_tag("elite"))
+        self.assertEqual(entity.to_dict()["tags"], ["flying"])
+        self.assertEqual(Entity.from_dict(entity.to_dict()).tags, entity.tags)
+
+    def test_unknown_tag_queries_assign_no_bit(self):
+        """Test that checking or removing an unknown tag leaves the tag registry alone."""
+        entity = Entity(EntityType.ENEMY)
+        registered = len(tag_names(-1))
+        self.assertFalse(entity.has_tag("never_added_tag"))
+        entity.remove_tag("never_added_tag")
+        self.assertEqual(entity.tags, 0)
+        self.assertEqual(len(tag_names(-1)), registered)
+
+    def test_stun_on_slotted_entity(self):
+        """Test that a stun can set and clear the state of a slotted entity."""
+        manager = EntityManager()
+        entity = manager.create_entity(EntityType.ENEMY)
+        effects = StatusEffectManager()
+        stun = StunEffect("StunEffect", EffectType.STUN, duration=1.0)
+        stun.on_apply(entity)
+        effects.add_effect(entity.id, stun)
+        self.assertEqual(entity.state, EntityState.STUNNED)
+        effects.update(1.0, manager)
+        self.assertEqual(entity.state, EntityState.IDLE)
+        self.assertFalse(effects.has_effect(entity.id, "StunEffect"))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
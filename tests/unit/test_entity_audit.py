@@ -0,0 +1,42 @@
+"""
+Unit tests for the entity audit utilities.
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from components import HealthComponent, SpriteComponent
+from ecs.entity_audit import audit_components, audit_health_states
+from entities import Entity, EntityType, component_bit
+
+class TestEntityAudit(unittest.TestCase):
+    """Test cases for audit_components and audit_health_states."""
+
+    def test_component_mask_tracks_components(self):
+        """Test that the component mask follows add and remove."""
+        entity = Entity(EntityType.ENEMY)
+        bit = component_bit("TransformComponent")
+        self.assertTrue(entity.component_mask & bit)
+        entity.remove_component("TransformComponent")
+        self.assertFalse(entity.component_mask & bit)
+
+    def test_audits_report_only_bad_entities(self):
+        """Test that only entities failing a check are reported."""
+        good = Entity(EntityType.ENEMY)
+        good.add_component(SpriteComponent(good))
+        good.add_component(HealthComponent(good, max_health=10))
+        bad = Entity(EntityType.ENEMY)
+        health = HealthComponent(bad, max_health=10)
+        health.current_health = 20
+        bad.add_component(health)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            audit_components([good, bad])
+            audit_health_states([good, bad])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(bad.id in line for line in lines))
+        self.assertIn("['SpriteComponent']", lines[0])
+
+if __name__ == '__main__':
+    unittest.main()
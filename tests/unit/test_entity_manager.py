@@ -0,0 +1,125 @@
+"""
+Unit tests for EntityManager.
+"""
+import gc
+import unittest
+from components import HealthComponent, StateComponent, TransformComponent
+from ecs.physics_store import physics_store
+from ecs.transform_store import transform_store
+from entities import EntityType, PhysicsComponent, StatusEffect, StatusEffectType
+from entity_manager import EntityManager
+
+class TestEntityManager(unittest.TestCase):
+    """Test cases for EntityManager."""
+
+    def test_released_entities_are_reused(self):
+        """Test that create_entity reuses a released entity of the same type."""
+        manager = EntityManager()
+        loot = manager.create_entity(EntityType.LOOT, "loot")
+        old_id = loot.id
+        loot.add_component(HealthComponent(loot))
+        loot.get_component(TransformComponent).x = 40.0
+        loot.dead = True
+        manager.release_entity(old_id)
+        self.assertIsNone(manager.get_entity(old_id))
+
+        # A different type never gets the pooled entity
+        enemy = manager.create_entity(EntityType.ENEMY)
+        self.assertIsNot(enemy, loot)
+
+        reused = manager.create_entity(EntityType.LOOT, "loot")
+        self.assertIs(reused, loot)
+        self.assertNotEqual(reused.id, old_id)
+        self.assertIs(manager.get_entity(reused.id), reused)
+        self.assertFalse(reused.dead)
+        self.assertIsNone(reused.get_component(HealthComponent))
+        self.assertEqual(reused.get_component(TransformComponent).x, 0.0)
+
+    def test_update_runs_component_phases(self):
+        """Test that update() reaches active tracked entities only."""
+        manager = EntityManager()
+        entities = [manager.create_entity(EntityType.ENEMY) for _ in range(3)]
+        entities[1].active = False
+        manager.remove_entity(entities[2].id)
+        manager.update(0.5)
+        times = [entity.get_component(StateComponent).state_time for entity in entities]
+        self.assertEqual(times, [0.5, 0.0, 0.0])
+
+    def test_update_deactivates_failing_entity(self):
+        """Test that a raising component disables only its entity and is logged once."""
+        manager = EntityManager()
+        entities = [manager.create_entity(EntityType.ENEMY) for _ in range(4)]
+        for entity in entities[:2]:
+            entity.get_component(StateComponent).state_time = None  # update() raises TypeError
+        with self.assertLogs("game", level="ERROR") as logs:
+            manager.update(0.5)
+        self.assertEqual([entity.active for entity in entities], [False, False, True, True])
+        self.assertEqual(entities[3].get_component(StateComponent).state_time, 0.5)
+        self.assertEqual(sum("Traceback" in line for line in logs.output), 1)
+
+    def test_get_entities_by_type(self):
+        """Test that type queries follow adds and removes in insertion order."""
+        manager = EntityManager()
+        bullets = [manager.create_entity(EntityType.BULLET) for _ in range(3)]
+        manager.create_entity(EntityType.ENEMY)
+        manager.remove_entity(bullets[1].id)
+        self.assertEqual(manager.get_entities_by_type(EntityType.BULLET), [bullets[0], bullets[2]])
+        self.assertEqual(manager.get_entities_by_type(EntityType.LOOT), [])
+
+    def test_get_all_entities_after_removal(self):
+        """Test that removal keeps the live entity list packed and lookups valid."""
+        manager = EntityManager()
+        entities = [manager.create_entity(EntityType.ENEMY) for _ in range(4)]
+        live = manager.get_all_entities()
+        manager.remove_entity(entities[0].id)
+        manager.remove_entity(entities[3].id)
+        self.assertIs(manager.get_all_entities(), live)
+        self.assertCountEqual(live, entities[1:3])
+        for entity in entities[1:3]:
+            self.assertIs(manager.get_entity(entity.id), entity)
+        self.assertIsNone(manager.get_entity(entities[0].id))
+
+    def test_status_effects_tick_in_update(self):
+        """Test that applied effects hurt on update() and are dropped with their entity."""
+        manager = EntityManager()
+        entities = [manager.create_entity(EntityType.ENEMY) for _ in range(2)]
+        for entity in entities:
+            entity.add_component(HealthComponent(entity, 100))
+            manager.apply_status_effect(entity, StatusEffect(StatusEffectType.POISON, 2.0, value=5.0, tick_rate=0.5))
+        manager.update(0.5)
+        manager.remove_entity(entities[1].id)
+        manager.update(0.5)
+        self.assertEqual(entities[0].get_component(HealthComponent).current_health, 90)
+        self.assertEqual(entities[1].get_component(HealthComponent).current_health, 95)
+        archetype = manager.world.archetypes[0]
+        self.assertEqual(archetype.entities, [entities[0]])
+
+    def test_removal_releases_store_slots(self):
+        """Test that removing entities frees their store slots without the cyclic collector."""
+        manager = EntityManager()
+        gc.disable()
+        try:
+            transforms = len(transform_store)
+            rows = len(physics_store)
+            for _ in range(20):
+                bullet = manager.create_entity(EntityType.BULLET)
+                bullet.add_component(PhysicsComponent(bullet, velocity_x=5.0))
+                manager.remove_entity(bullet.id)
+            enemy = manager.create_entity(EntityType.ENEMY)
+            enemy.add_component(PhysicsComponent(enemy))
+            enemy.remove_component("PhysicsComponent")
+            self.assertEqual(len(physics_store), rows)
+            self.assertEqual(len(transform_store), transforms + 1)
+        finally:
+            gc.enable()
+
+    def test_events_record_adds_and_removes(self):
+        """Test that spawns and despawns are recorded in the event buffer."""
+        manager = EntityManager()
+        entity = manager.create_entity(EntityType.BULLET)
+        manager.remove_entity(entity.id)
+        manager.remove_entity(entity.id)
+        self.assertEqual(list(manager.events), [('add', entity.id), ('remove', entity.id)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for the shared physics store.
+"""
+import unittest
+from ecs.transform_store import TransformStore, transform_store
+from ecs.physics_store import PhysicsStore
+from entities import PhysicsComponent
+
+class TestPhysicsStore(unittest.TestCase):
+    """Test cases for PhysicsStore."""
+
+    def test_step_matches_scalar_update(self):
+        """Test that step() applies gravity, acceleration and friction like the old per-entity update."""
+        transforms = TransformStore()
+        store = PhysicsStore(transforms, capacity=1)
+        cases = [(3.0, -2.0, 1.0, 0.5, 0.1, 9.8), (0.0, 0.0, 0.0, 0.0, 0.2, 0.0), (-4.0, 1.0, 2.0, -1.0, 0.0, 1.5)]
+        for vx, vy, ax, ay, friction, gravity in cases:
+            slot = transforms.acquire(None)
+            row = store.alloc(slot)
+            transforms.vx[slot] = vx
+            transforms.vy[slot] = vy
+            store.set_acceleration(row, ax, ay)
+            store.set_friction(row, friction)
+            store.set_gravity(row, gravity)
+        dt = 0.016
+        store.step(dt)
+        for slot, (vx, vy, ax, ay, friction, gravity) in enumerate(cases):
+            vy += gravity * dt
+            vx += ax * dt
+            vy += ay * dt
+            vx *= (1 - friction)
+            vy *= (1 - friction)
+            self.assertEqual(transforms.vx[slot], vx)
+            self.assertEqual(transforms.vy[slot], vy)
+
+    def test_kinematic_and_freed_rows_skipped(self):
+        """Test that kinematic and freed rows keep their velocity."""
+        transforms = TransformStore()
+        store = PhysicsStore(transforms)
+        slots = [transforms.acquire(None) for _ in range(2)]
+        rows = [store.alloc(slot) for slot in slots]
+        for slot, row in zip(slots, rows):
+            transforms.vx[slot] = 5.0
+            store.set_acceleration(row, 10.0, 0.0)
+        store.set_kinematic(rows[0], True)
+        store.free(rows[1])
+        store.step(1.0)
+        self.assertEqual(transforms.vx[slots].tolist(), [5.0, 5.0])
+        self.assertEqual(store.alloc(slots[1]), rows[1])
+
+    def test_unforced_rows_skipped_until_set(self):
+        """Test that rows without forces are left out of step() until a setter gives them one."""
+        transforms = TransformStore()
+        store = PhysicsStore(transforms)
+        slots = [transforms.acquire(None) for _ in range(3)]
+        rows = [store.alloc(slot) for slot in slots]
+        transforms.vx[slots] = 1.0
+        store.set_gravity(rows[1], 2.0)
+        store.step(1.0)
+        self.assertEqual(store._rows.tolist(), [rows[1]])
+        store.set_friction(rows[2], 0.5)
+        store.step(1.0)
+        self.assertEqual(transforms.vx[slots].tolist(), [1.0, 1.0, 0.5])
+        self.assertEqual(transforms.vy[slots].tolist(), [0.0, 4.0, 0.0])
+
+    def test_component_view(self):
+        """Test that PhysicsComponent reads and writes the shared stores."""
+        entity = object()
+        physics = PhysicsComponent(entity, velocity_x=2.0, gravity=9.8, is_kinematic=True)
+        self.assertEqual(transform_store.vx[physics._slot], 2.0)
+        self.assertTrue(physics.is_kinematic)
+        physics.is_kinematic = False
+        physics.friction = 0.5
+        self.assertFalse(physics.is_kinematic)
+        self.assertEqual(physics.to_dict()["friction"], 0.5)
+        self.assertEqual(physics.to_dict()["gravity"], 9.8)
+
+if __name__ == '__main__':
+    unittest.main()
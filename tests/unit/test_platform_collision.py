@@ -0,0 +1,118 @@
+"""
+Unit tests for batched platform collision resolution.
+"""
+import random
+import unittest
+import numpy as np
+import pygame
+from systems.platform_collision import HIT_NAMES, resolve_platform_rect, resolve_platforms
+
+def _reference(rect, vx, vy, gravity, max_fall, platforms):
+    """The original per-enemy gravity and collidelistall() resolve loop."""
+    rect = rect.copy()
+    vy = min(vy + gravity, max_fall)
+    on_ground = False
+    last = None
+    count = 0
+    for index in rect.collidelistall(platforms):
+        platform = platforms[index]
+        if rect.colliderect(platform):
+            dx = min(rect.right - platform.left, platform.right - rect.left)
+            dy = min(rect.bottom - platform.top, platform.bottom - rect.top)
+            if dx < dy:
+                if rect.centerx < platform.centerx:
+                    rect.right = platform.left
+                else:
+                    rect.left = platform.right
+                vx *= -1
+                last = 'horizontal'
+            else:
+                if rect.centery < platform.centery:
+                    rect.bottom = platform.top
+                    on_ground = True
+                    last = 'vertical_bottom'
+                else:
+                    rect.top = platform.bottom
+                    last = 'vertical_top'
+                vy = 0
+            count += 1
+    return rect.x, rect.y, float(vx), float(vy), on_ground, last, count
+
+def _resolve_one(rect, vx, vy, gravity, max_fall, platforms):
+    xs = np.array([rect.x], dtype=np.int64)
+    ys = np.array([rect.y], dtype=np.int64)
+    vxs = np.array([vx], dtype=np.float64)
+    vys = np.array([vy], dtype=np.float64)
+    plat = np.array([(p.left, p.top, p.right, p.bottom) for p in platforms], dtype=np.int32).reshape(-1, 4)
+    on_ground, hits, counts = resolve_platforms(
+        xs, ys, np.array([rect.w], dtype=np.int64), np.array([rect.h], dtype=np.int64),
+        vxs, vys, np.array([gravity]), max_fall, plat
+    )
+    return (int(xs[0]), int(ys[0]), float(vxs[0]), float(vys[0]),
+            bool(on_ground[0]), HIT_NAMES[hits[0]], int(counts[0]))
+
+class TestResolvePlatforms(unittest.TestCase):
+    """Test cases for resolve_platforms."""
+
+    def test_lands_on_platform(self):
+        """Test that a falling rect lands on a platform and is grounded."""
+        result = _resolve_one(pygame.Rect(10, 40, 32, 32), 1.0, 3.0, 0.5, 15, [pygame.Rect(0, 64, 100, 20)])
+        self.assertEqual(result, (10, 32, 1.0, 0.0, True, 'vertical_bottom', 1))
+
+    def test_gravity_clamped(self):
+        """Test that gravity never pushes vy past the fall limit."""
+        result = _resolve_one(pygame.Rect(0, 0, 32, 32), 0.0, 14.8, 0.5, 15, [])
+        self.assertEqual(result[3], 15.0)
+
+    def test_outside_platform_bounds(self):
+        """Test that a rect away from every platform only gets gravity."""
+        platforms = [pygame.Rect(0, 0, 50, 10), pygame.Rect(100, 100, 50, 10)]
+        result = _resolve_one(pygame.Rect(400, 400, 32, 32), 2.0, 1.0, 0.5, 15, platforms)
+        self.assertEqual(result, (400, 400, 2.0, 1.5, False, None, 0))
+
+    def test_matches_rect_loop(self):
+        """Test against the pygame.Rect loop on random layouts."""
+        rng = random.Random(5)
+        for _ in range(300):
+            platforms = [pygame.Rect(rng.randint(0, 500), rng.randint(0, 500),
+                                     rng.randint(10, 120), rng.randint(10, 40)) for _ in range(15)]
+            rect = pygame.Rect(rng.randint(0, 560), rng.randint(0, 560), 32, 32)
+            vx = rng.choice([-2.0, 0.0, 1.5])
+            vy = rng.choice([-3.0, 0.0, 2.0, 14.9])
+            expected = _reference(rect, vx, vy, 0.5, 15, platforms)
+            self.assertEqual(_resolve_one(rect, vx, vy, 0.5, 15, platforms), expected)
+
+    def test_batch_matches_single(self):
+        """Test that resolving many rects at once matches resolving them one by one."""
+        rng = random.Random(8)
+        platforms = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300), 60, 20) for _ in range(10)]
+        rects = [pygame.Rect(rng.randint(0, 320), rng.randint(0, 320), 32, 32) for _ in range(50)]
+        xs = np.array([r.x for r in rects], dtype=np.int64)
+        ys = np.array([r.y for r in rects], dtype=np.int64)
+        sizes = np.full(len(rects), 32, dtype=np.int64)
+        vxs = np.ones(len(rects))
+        vys = np.zeros(len(rects))
+        plat = np.array([(p.left, p.top, p.right, p.bottom) for p in platforms], dtype=np.int32)
+        on_ground, hits, counts = resolve_platforms(xs, ys, sizes, sizes, vxs, vys,
+                                                    np.full(len(rects), 0.5), 15, plat)
+        for i, rect in enumerate(rects):
+            expected = _resolve_one(rect, 1.0, 0.0, 0.5, 15, platforms)
+            actual = (int(xs[i]), int(ys[i]), float(vxs[i]), float(vys[i]),
+                      bool(on_ground[i]), HIT_NAMES[hits[i]], int(counts[i]))
+            self.assertEqual(actual, expected)
+
+    def test_single_rect_matches_batch(self):
+        """Test that the scalar single-rect resolver matches the array kernel."""
+        rng = random.Random(11)
+        for _ in range(300):
+            platforms = [pygame.Rect(rng.randint(0, 500), rng.randint(0, 500),
+                                     rng.randint(10, 120), rng.randint(10, 40)) for _ in range(15)]
+            rect = pygame.Rect(rng.randint(0, 560), rng.randint(0, 560), 32, 32)
+            vx = rng.choice([-2.0, 0.0, 1.5])
+            vy = rng.choice([-3.0, 0.0, 2.0, 14.9])
+            expected = _resolve_one(rect, vx, vy, 0.5, 15, platforms)
+            vx, vy, on_ground, hit, count = resolve_platform_rect(rect, vx, vy, 0.5, 15, platforms)
+            self.assertEqual((rect.x, rect.y, vx, vy, on_ground, HIT_NAMES[hit], count), expected)
+
+if __name__ == '__main__':
+    unittest.main()
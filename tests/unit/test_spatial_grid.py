@@ -0,0 +1,62 @@
+"""
+Unit tests for the uniform spatial hash grid.
+"""
+import random
+import unittest
+import pygame
+from systems.spatial_grid import SpatialGrid
+
+class TestSpatialGrid(unittest.TestCase):
+    """Test cases for SpatialGrid."""
+
+    def test_insert_spans_cells(self):
+        """Test that a rect is bucketed in every cell it overlaps."""
+        grid = SpatialGrid(cell=64)
+        grid.insert("wide", pygame.Rect(32, 0, 64, 32))
+        self.assertEqual(set(grid.cells), {(0, 0), (1, 0)})
+        # A rect ending exactly on a cell edge stays out of the next cell
+        grid.insert("edge", pygame.Rect(0, 64, 64, 64))
+        self.assertNotIn((1, 1), grid.cells)
+
+    def test_query_lists_items_once(self):
+        """Test that items spanning several cells are returned once."""
+        grid = SpatialGrid(cell=32)
+        grid.insert("big", pygame.Rect(0, 0, 100, 100))
+        grid.insert("far", pygame.Rect(500, 500, 10, 10))
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 100, 100)), ["big"])
+        self.assertEqual(grid.query(pygame.Rect(200, 200, 10, 10)), [])
+
+    def test_remove(self):
+        """Test removing items drops empty cells."""
+        grid = SpatialGrid(cell=64)
+        rect = pygame.Rect(10, 10, 100, 10)
+        grid.insert("a", rect)
+        grid.remove("a", rect)
+        self.assertEqual(len(grid), 0)
+
+    def test_query_radius_matches_brute_force(self):
+        """Test that radius queries never miss a point within the radius."""
+        rng = random.Random(7)
+        grid = SpatialGrid(cell=64)
+        rects = [pygame.Rect(rng.randint(0, 1000), rng.randint(0, 1000), 32, 32) for _ in range(300)]
+        for rect in rects:
+            grid.insert(rect, rect)
+        for _ in range(50):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            nearby = grid.query_radius(x, y, 100)
+            for rect in rects:
+                if (rect.centerx - x) ** 2 + (rect.centery - y) ** 2 < 100 * 100:
+                    self.assertTrue(any(r is rect for r in nearby))
+
+    def test_iter_radius_is_lazy(self):
+        """Test that iter_radius yields cell contents without deduplicating."""
+        grid = SpatialGrid(cell=64)
+        wide = pygame.Rect(0, 0, 128, 32)
+        grid.insert(wide, wide)
+        items = grid.iter_radius(64, 16, 10)
+        self.assertIs(next(items), wide)
+        self.assertEqual(list(grid.iter_radius(1000, 1000, 10)), [])
+        self.assertEqual(grid.query_radius(64, 16, 10), [wide])
+
+if __name__ == '__main__':
+    unittest.main()
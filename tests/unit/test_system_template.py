@@ -0,0 +1,155 @@
+"""
+Unit tests for the ECS system base class.
+"""
+import unittest
+from ecs.archetype import World
+from ecs.component_registry import ComponentRegistry
+from ecs.system_template import ParticleSystem, PhysicsSystem, StatusEffectSystem, System
+from entities import Entity, EntityType, PhysicsComponent, StatusEffect, StatusEffectType
+from components import HealthComponent
+
+class _HealthSystem(System):
+    def __init__(self):
+        super().__init__()
+        self.required_components = ['TransformComponent', 'HealthComponent']
+
+    def update(self, entities, delta_time):
+        pass
+
+class TestSystem(unittest.TestCase):
+    """Test cases for System.filter_entities."""
+
+    def test_filter_by_required_mask(self):
+        """Test that only entities with every required component match."""
+        system = _HealthSystem()
+        plain = Entity(EntityType.ENEMY)
+        healthy = Entity(EntityType.ENEMY)
+        healthy.add_component(HealthComponent(healthy))
+        self.assertEqual(system.filter_entities([plain, healthy]), [healthy])
+
+        healthy.remove_component('HealthComponent')
+        self.assertEqual(system.filter_entities([plain, healthy]), [])
+
+    def test_filter_world_uses_component_lists(self):
+        """Test that world filtering only visits owners of the rarest component."""
+        world = World()
+        system = _HealthSystem()
+        plain = [Entity(EntityType.ENEMY) for _ in range(3)]
+        healthy = Entity(EntityType.ENEMY)
+        healthy.add_component(HealthComponent(healthy))
+        for entity in plain + [healthy]:
+            world.add_entity(entity)
+        self.assertEqual(world.entities_with('Health'), [healthy])
+        self.assertEqual(system.filter_entities(world), [healthy])
+
+        late = plain[0]
+        late.add_component(HealthComponent(late))
+        self.assertEqual(system.filter_entities(world), [healthy, late])
+
+        healthy.remove_component('HealthComponent')
+        self.assertEqual(system.filter_entities(world), [late])
+        world.remove_entity(late)
+        self.assertEqual(system.filter_entities(world), [])
+        self.assertIsNone(late.world)
+
+    def test_component_lookup_by_id(self):
+        """Test that classes, short names and ids reach the same component."""
+        entity = Entity(EntityType.ENEMY)
+        health = HealthComponent(entity)
+        entity.add_component(health)
+        self.assertIs(entity.get_component(ComponentRegistry.HEALTH), health)
+        self.assertIs(entity.get_component('Health'), health)
+        self.assertIs(entity.get_component(HealthComponent), health)
+        self.assertTrue(entity.has_component(ComponentRegistry.TRANSFORM))
+        self.assertIsNone(entity.get_component(ComponentRegistry.SPRITE))
+
+        entity.remove_component('Health')
+        self.assertNotIn('HealthComponent', entity.components)
+        self.assertIsNone(entity.get_component(HealthComponent))
+
+    def test_hot_component_attributes(self):
+        """Test that hot components are mirrored in direct entity attributes."""
+        entity = Entity(EntityType.ENEMY)
+        self.assertIs(entity.transform, entity.get_component(ComponentRegistry.TRANSFORM))
+        self.assertIsNone(entity.physics)
+
+        physics = PhysicsComponent(entity)
+        entity.add_component(physics)
+        self.assertIs(entity.physics, physics)
+        entity.remove_component(PhysicsComponent)
+        self.assertIsNone(entity.physics)
+
+class TestArchetypeSystems(unittest.TestCase):
+    """Test cases for the archetype-based systems."""
+
+    def test_physics_update(self):
+        """Test that physics integrates acceleration and velocity per archetype."""
+        world = World()
+        archetype, row = world.spawn(['Transform', 'Physics'], vx=2.0, ax=1.0)
+        world.spawn(['Transform', 'Physics', 'Collision'], tx=5.0, vy=-1.0)
+        world.spawn(['Transform'], tx=7.0)
+        PhysicsSystem().update(world, 0.5)
+        self.assertEqual(archetype.vx[row], 2.5)
+        self.assertEqual(archetype.tx[row], 1.25)
+        self.assertEqual(world.archetypes[1].ty.tolist(), [-0.5])
+        self.assertEqual(world.archetypes[2].tx.tolist(), [7.0])
+
+    def test_query_cache_picks_up_new_archetypes(self):
+        """Test that cached queries still see archetypes created later."""
+        world = World()
+        system = PhysicsSystem()
+        first, _ = world.spawn(['Transform', 'Physics'])
+        self.assertEqual(system.query(world), [first])
+        self.assertIs(system.query(world), system.query(world))
+        world.spawn(['Particle'])
+        second, _ = world.spawn(['Transform', 'Physics', 'Collision'])
+        self.assertEqual(system.query(world), [first, second])
+
+    def test_particles_expire(self):
+        """Test that expired particles are removed and marked dead."""
+        world = World()
+        entity = Entity(EntityType.EFFECT)
+        archetype, _ = world.spawn(['Particle', 'Transform'], entity, lifetime=0.25, pvx=4.0)
+        world.spawn(['Particle', 'Transform'], lifetime=1.0, pvx=4.0)
+        ParticleSystem().update(world, 0.5)
+        self.assertEqual(len(archetype), 1)
+        self.assertEqual(archetype.tx.tolist(), [2.0])
+        self.assertTrue(entity.dead)
+
+    def test_status_effects_tick_and_expire(self):
+        """Test that damage effects hurt on each tick and expired effects are dropped."""
+        world = World()
+        entity = Entity(EntityType.ENEMY)
+        health = HealthComponent(entity, 100)
+        entity.add_component(health)
+        StatusEffectSystem.apply(world, entity, StatusEffect(StatusEffectType.BURN, 1.5, value=10.0, tick_rate=0.5))
+        StatusEffectSystem.apply(world, entity, StatusEffect(StatusEffectType.SLOW, 0.25, value=0.5))
+        system = StatusEffectSystem()
+        system.update(world, 0.5)
+        archetype = world.archetypes[0]
+        self.assertEqual(health.current_health, 90)
+        self.assertEqual(len(archetype), 1)
+        self.assertEqual(archetype.tick_time.tolist(), [0.0])
+        for _ in range(2):
+            system.update(world, 0.5)
+        self.assertEqual(health.current_health, 70)
+        self.assertEqual(len(archetype), 0)
+
+    def test_status_effect_row_counts(self):
+        """Test that add() counts rows per entity, expiry uncounts them and remove() skips unaffected entities."""
+        world = World()
+        system = StatusEffectSystem()
+        burning = Entity(EntityType.ENEMY)
+        bystander = Entity(EntityType.ENEMY)
+        system.add(world, burning, StatusEffect(StatusEffectType.BURN, 1.0))
+        system.add(world, burning, StatusEffect(StatusEffectType.SLOW, 0.25))
+        system.update(world, 0.5)
+        self.assertEqual(system._row_counts, {id(burning): 1})
+        system.remove(world, bystander)
+        self.assertEqual(len(world.archetypes[0]), 1)
+        system.remove(world, burning)
+        self.assertEqual(len(world.archetypes[0]), 0)
+        self.assertEqual(system._row_counts, {})
+
+if __name__ == '__main__':
+    unittest.main()
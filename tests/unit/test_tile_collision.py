@@ -0,0 +1,55 @@
+"""
+Unit tests for tile collision resolution.
+"""
+import random
+import unittest
+import numpy as np
+import pygame
+from systems.tile_collision import resolve_tiles
+
+def _reference(rect, vx, vy, tiles):
+    """The original per-tile pygame.Rect resolve loop."""
+    rect = rect.copy()
+    for tx, ty in tiles:
+        tile_rect = pygame.Rect(tx, ty, 32, 32)
+        if vx != 0 and rect.colliderect(tile_rect):
+            if vx > 0:
+                rect.right = tile_rect.left
+            else:
+                rect.left = tile_rect.right
+            vx = 0
+        if vy != 0 and rect.colliderect(tile_rect):
+            if vy > 0:
+                rect.bottom = tile_rect.top
+            else:
+                rect.top = tile_rect.bottom
+            vy = 0
+    return rect.x, rect.y, float(vx), float(vy)
+
+class TestResolveTiles(unittest.TestCase):
+    """Test cases for resolve_tiles."""
+
+    def test_stops_on_floor(self):
+        """Test that a falling rect lands on top of a tile."""
+        tiles = np.array([[0, 64]], dtype=np.int32)
+        self.assertEqual(resolve_tiles(0, 40, 32, 32, 0.0, 3.0, tiles), (0, 32, 0.0, 0.0))
+
+    def test_no_tiles(self):
+        """Test that an empty tile array leaves the rect alone."""
+        tiles = np.empty((0, 2), dtype=np.int32)
+        self.assertEqual(resolve_tiles(5, 6, 32, 32, 1.0, -1.0, tiles), (5, 6, 1.0, -1.0))
+
+    def test_matches_rect_loop(self):
+        """Test against the pygame.Rect loop on random layouts."""
+        rng = random.Random(3)
+        for _ in range(300):
+            tiles = [(rng.randrange(0, 20) * 32, rng.randrange(0, 20) * 32) for _ in range(40)]
+            rect = pygame.Rect(rng.randint(0, 600), rng.randint(0, 600), 32, 32)
+            vx = rng.choice([-2.5, 0.0, 1.5])
+            vy = rng.choice([-3.0, 0.0, 2.0])
+            expected = _reference(rect, vx, vy, tiles)
+            actual = resolve_tiles(rect.x, rect.y, rect.w, rect.h, vx, vy, np.array(tiles, dtype=np.int32))
+            self.assertEqual(actual, expected)
+
+if __name__ == '__main__':
+    unittest.main()
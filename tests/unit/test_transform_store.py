@@ -0,0 +1,66 @@
+"""
+Unit tests for the shared transform store.
+"""
+import unittest
+from ecs.transform_store import TransformStore, transform_store
+from components import TransformComponent, VelocityComponent
+
+class TestTransformStore(unittest.TestCase):
+    """Test cases for TransformStore."""
+
+    def test_components_share_slot(self):
+        """Test that an entity's transform and velocity use one slot."""
+        entity = object()
+        transform = TransformComponent(entity, 10, 20)
+        velocity = VelocityComponent(entity, 3, -4)
+        self.assertEqual(transform._slot, velocity._slot)
+        self.assertEqual(transform_store.vx[transform._slot], 3)
+
+    def test_integrate(self):
+        """Test that integrate moves every live slot by its velocity."""
+        store = TransformStore(capacity=2)
+        slots = [store.acquire(None) for _ in range(5)]
+        for i, slot in enumerate(slots):
+            store.vx[slot] = i
+            store.vy[slot] = -i
+        store.integrate(0.5)
+        self.assertEqual(store.x[:5].tolist(), [0.0, 0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(store.y[:5].tolist(), [0.0, -0.5, -1.0, -1.5, -2.0])
+        self.assertEqual(store.scale_x[:5].tolist(), [1.0] * 5)
+
+    def test_release_stops_motion(self):
+        """Test that released slots no longer move."""
+        store = TransformStore()
+        slot = store.acquire(None)
+        store.vx[slot] = 10
+        store.release(slot)
+        store.integrate(1.0)
+        self.assertEqual(store.x[slot], 0.0)
+
+    def test_free_slots_are_reused(self):
+        """Test that freed slots are handed out again before growing."""
+        store = TransformStore(capacity=4)
+        slots = [store.alloc() for _ in range(3)]
+        store.x[slots[1]] = 42.0
+        store.free(slots[1])
+        self.assertEqual(store.alive[slots[1]], -1)
+        self.assertEqual(store.x[slots[1]], 0.0)
+        self.assertEqual(len(store), 2)
+
+        self.assertEqual(store.alloc(), slots[1])
+        self.assertEqual(store.alloc(), 3)
+        self.assertEqual(store.alive[:4].tolist(), [1, 1, 1, 1])
+
+    def test_fields_are_lane_aligned(self):
+        """Test that every field row starts on a cache line after growing."""
+        store = TransformStore(capacity=3)
+        self.assertEqual(store.capacity, 8)
+        for _ in range(20):
+            store.alloc()
+        self.assertEqual(store.capacity % 8, 0)
+        for name in ("x", "y", "rotation", "scale_x", "scale_y", "vx", "vy"):
+            self.assertEqual(getattr(store, name).ctypes.data % 64, 0)
+        self.assertEqual(store.block_of(19), (2, 3))
+
+if __name__ == '__main__':
+    unittest.main()
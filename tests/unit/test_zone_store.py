@@ -0,0 +1,37 @@
+"""
+Unit tests for the zone flag store.
+"""
+import unittest
+from ecs.zone_store import ZoneStore, zone_store
+from components import ZoneComponent
+
+class TestZoneStore(unittest.TestCase):
+    """Test cases for ZoneStore."""
+
+    def test_pending_mask(self):
+        """Test that only active, untriggered zones are pending."""
+        store = ZoneStore(capacity=2)
+        ids = ["a", "b", "c", "d"]
+        slots = [store.alloc(zone_id) for zone_id in ids]
+        store.flags[slots[0]] = 0b01
+        store.flags[slots[1]] = 0b11
+        store.flags[slots[2]] = 0b00
+        store.flags[slots[3]] = 0b01
+        self.assertEqual(store.get_pending_zone_ids(), ["a", "d"])
+
+        store.free(slots[3])
+        self.assertEqual(store.get_pending_zone_ids(), ["a"])
+        self.assertEqual(store.alloc("e"), slots[3])
+
+    def test_component_flags(self):
+        """Test that ZoneComponent properties read and write the store."""
+        zone = ZoneComponent(object(), "z1")
+        self.assertTrue(zone.is_active)
+        self.assertFalse(zone.triggered)
+        zone.triggered = True
+        self.assertEqual(zone_store.flags[zone._slot], 0b11)
+        zone.is_active = False
+        self.assertEqual(zone.to_dict(), {"zone_id": "z1", "is_active": False, "triggered": True})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+"""
+Unit tests for zone key helpers.
+"""
+import unittest
+from zone_types import ZONE_NEIGHBOR_OFFSETS, zone_coords, zone_key
+
+class TestZoneKey(unittest.TestCase):
+    """Test cases for zone_key and zone_coords."""
+
+    def test_round_trip(self):
+        """Test that packed keys unpack to the same coordinates, including negatives."""
+        for coords in [(0, 0), (-1, -1), (5, -7), (-3, 9), (2**31 - 1, -2**31)]:
+            self.assertEqual(zone_coords(zone_key(*coords)), coords)
+
+    def test_neighbors_are_distinct(self):
+        """Test that the nine neighbouring zones get nine different keys."""
+        keys = {zone_key(dx, dy) for dx, dy in ZONE_NEIGHBOR_OFFSETS}
+        self.assertEqual(len(keys), 9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Set
 import random
 import json
@@ -7,7 +8,7 @@ from zone_template import ZoneTemplateGenerator
 from tile_rules import get_tile_variant
 from zone_template_loader import ZoneTemplateLoader
 from zone_template import ZoneTemplate
-from zone_types import Zone, ZoneTransition
+from zone_types import Zone, ZoneTransition, zone_key, zone_coords
 from config import ZONE_SIZE, ZONE_LOAD_DISTANCE, BIOME_SETTINGS
 import noise
 from logger import logger
@@ -51,8 +52,11 @@ class WorldManager:
         self.tile_factory = TileFactory(asset_manager)
         self.template_loader = zone_template_loader
         self.zone_builder = ZoneBuilder(self.tile_factory, entity_manager)
-        self.zones: Dict[Tuple[int, int], Entity] = {}
-        self.active_zones: Set[Tuple[int, int]] = set()
+        self.zones: Dict[int, Entity] = {}  # zone_key(x, y) -> zone
+        self.active_zones: Set[int] = set()  # zone_key(x, y) of each active zone
+        self._platform_rects: List[pygame.Rect] = []
+        self._platform_xyxy = np.empty((0, 4), dtype=np.int32)  # Same platforms as int32 (left, top, right, bottom) rows
+        self._platform_rects_key: Optional[frozenset] = None  # Active zones the cached rects belong to
         self.zone_states: Dict[str, Dict] = {}
         self.initial_load_distance = 1  # Start with just 1 zone in each direction
         self.max_load_distance = 2  # Maximum load distance for scaling
@@ -115,7 +119,7 @@ class WorldManager:
         # Create the starting zone using ZoneBuilder
         start_zone = self.zone_builder.build_zone(start_template, x=0, y=0, zone_id="start_zone")
         # Add the zone to the world
-        self.zones[(0, 0)] = start_zone
+        self.zones[zone_key(0, 0)] = start_zone
         self.current_zone = start_zone
         self.active_zones.add(start_zone)
         logger.info(f"Initialized starting zone: {start_zone.name}")
@@ -201,7 +205,7 @@ class WorldManager:
             zone_id = f"zone_{x}_{y}"
             
             # Skip if zone already exists
-            if (x, y) in self.zones:
+            if zone_key(x, y) in self.zones:
                 logger.debug(f"Zone {zone_id} already exists, skipping generation")
                 return
                 
@@ -226,7 +230,7 @@ class WorldManager:
                 raise ZoneGenerationError(f"Invalid zone {zone_id}")
                 
             # Store zone
-            self.zones[(x, y)] = zone
+            self.zones[zone_key(x, y)] = zone
             logger.info(f"Successfully generated zone {zone_id}")
             
             # Apply saved state if exists
@@ -274,7 +278,7 @@ class WorldManager:
             temp_entity.add_component(zone_component)
             
             # Add to zones
-            self.zones[(x, y)] = temp_entity
+            self.zones[zone_key(x, y)] = temp_entity
             
             if biome == "forest":
                 self.particle_manager.emit_particles(temp_entity, "leaves", count=5)
@@ -304,10 +308,11 @@ class WorldManager:
             # Determine which zones should be active based on distance
             for x in range(zone_x - self.max_load_distance, zone_x + self.max_load_distance + 1):
                 for y in range(zone_y - self.max_load_distance, zone_y + self.max_load_distance + 1):
-                    new_active_zones.add((x, y))
+                    key = zone_key(x, y)
+                    new_active_zones.add(key)
                     
                     # Only generate zone if it doesn't exist
-                    if (x, y) not in self.zones:
+                    if key not in self.zones:
                         logger.info(f"Loading new zone at ({x}, {y})")
                         self._generate_zone(x, y)
                         logger.info(f"New zone at ({x}, {y}) loaded")
@@ -317,10 +322,10 @@ class WorldManager:
             
             # Unload zones that are too far away
             zones_to_unload = set(self.zones.keys()) - new_active_zones
-            for zone_coords in zones_to_unload:
-                if zone_coords in self.zones:
-                    logger.info(f"Unloading zone at {zone_coords}")
-                    del self.zones[zone_coords]
+            for key in zones_to_unload:
+                if key in self.zones:
+                    logger.info(f"Unloading zone at {zone_coords(key)}")
+                    del self.zones[key]
             
         except Exception as e:
             logger.error(f"Error updating world: {str(e)}")
@@ -428,7 +433,7 @@ class WorldManager:
             zone_y = int(y // (self.zone_size * 32))
             
             # Get zone from the zones dictionary
-            zone = self.zones.get((zone_x, zone_y))
+            zone = self.zones.get(zone_key(zone_x, zone_y))
             
             # Debug tracking
             if zone:
@@ -519,7 +524,27 @@ class WorldManager:
             for tile in zone.tiles:
                 if tile.is_platform:
                     platforms.append(tile.rect)
-        return platforms 
+        return platforms
+
+    def get_platform_rects(self) -> List[pygame.Rect]:
+        """Get platform rects from active zones, rebuilt only when the active zones change."""
+        self._refresh_platforms()
+        return self._platform_rects
+
+    def get_platform_xyxy(self) -> np.ndarray:
+        """Get the platforms of active zones as an int32 (N, 4) left, top, right, bottom array."""
+        self._refresh_platforms()
+        return self._platform_xyxy
+
+    def _refresh_platforms(self):
+        """Rebuild the cached platform rects and array if the active zones changed."""
+        key = frozenset(self.active_zones)
+        if key != self._platform_rects_key:
+            self._platform_rects = self.get_platforms()
+            self._platform_xyxy = np.array(
+                [(p.left, p.top, p.right, p.bottom) for p in self._platform_rects], dtype=np.int32
+            ).reshape(-1, 4)
+            self._platform_rects_key = key
 
     def handle_input(self, keys):
         """Handle input events."""
@@ -4,6 +4,22 @@ import pygame
 import json
 from enum import Enum, auto
 
+# Offsets of a zone and its eight neighbours
+ZONE_NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = tuple(
+    (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2)
+)
+
+def zone_key(x: int, y: int) -> int:
+    """Pack zone coordinates into a single int dictionary key."""
+    return (x << 32) | (y & 0xFFFFFFFF)
+
+def zone_coords(key: int) -> Tuple[int, int]:
+    """Unpack a zone_key() back into zone coordinates."""
+    y = key & 0xFFFFFFFF
+    if y & 0x80000000:
+        y -= 1 << 32
+    return key >> 32, y
+
 class ZoneType(Enum):
     """Types of zones in the game."""
     EARLY_GAME = auto()